@@ -92,7 +92,8 @@ def _prune_scheduled_downloads(_active_downloads: List[Dict[str, Any]], history:
             
             # Keep entries visible while not completed; remove only once they
             # reach history (completed/failed/cancelled) or become stale.
-            if download_id in history_ids:
+            # Pipelined season downloads track each episode as "<id>_e<n>"
+            if download_id in history_ids or any(str(h).startswith(f"{download_id}_e") for h in history_ids):
                 to_remove.append(download_id)
                 continue
             if now - float(item.get("scheduled_at", now)) > max_age_seconds:
@@ -1,23 +1,193 @@
 # 17.03.25
 
 import time
+import queue
 import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 # External library
 from rich.console import Console
 from rich.prompt import Prompt
+from rich.table import Table
+from rich.live import Live
 
 
 # Internal utilities
+from StreamingCommunity.utils import config_manager
 from StreamingCommunity.utils.console.message import start_message
 from StreamingCommunity.services._base import load_search_functions
+from StreamingCommunity.services._base.site_search_manager import live_year_updates
 from StreamingCommunity.utils.console.table import TVShowManager
+from StreamingCommunity.utils.ranking import rank
 
 
 # Variable
 console = Console()
 msg = Prompt()
+GLOBAL_SEARCH_WORKERS = config_manager.config.get_int('DEFAULT', 'global_search_workers', default=6)
+GLOBAL_SEARCH_TIMEOUT = config_manager.config.get_int('DEFAULT', 'global_search_timeout', default=20)
+
+
+def _database_to_items(database, alias: str, site_name: str) -> List[dict]:
+    """Convert the media_list of a site database into dicts tagged with their source."""
+    if not database or not hasattr(database, 'media_list'):
+        return []
+
+    items = []
+    for element in database.media_list:
+        # Convert element to dictionary if it's an object
+        item_dict = element.__dict__.copy() if hasattr(element, '__dict__') else {}
+
+        # Add source information
+        item_dict['source'] = site_name
+        item_dict['source_alias'] = alias
+        items.append(item_dict)
+
+    return items
+
+
+def search_sites(search_terms: str, selected_sites: List[str], search_functions: dict, on_results: Optional[Callable[[str, List[dict]], None]] = None,
+    workers: int = GLOBAL_SEARCH_WORKERS, timeout: float = GLOBAL_SEARCH_TIMEOUT
+) -> Tuple[Dict[str, List[dict]], List[dict]]:
+    """
+    Query the selected sites concurrently, at most `workers` at a time, each with its own deadline.
+
+    A site that misses its deadline is reported as timed out and its late results are discarded.
+    Python cannot kill its thread, so it keeps holding a slot until it returns: live threads never
+    exceed `workers`. If every slot is held by such sites for another `timeout`, the sites still
+    waiting are reported as skipped.
+
+    Parameters:
+        search_terms (str): The terms to search for.
+        selected_sites (list): Site aliases to query.
+        search_functions (dict): Search functions by alias, from load_search_functions.
+        on_results (callable, optional): Called from the calling thread with (alias, items) as each site answers or times out.
+        workers (int): Maximum number of sites queried at the same time.
+        timeout (float): Seconds a site has to answer, counted from its own start.
+
+    Returns:
+        tuple: (results by alias, per-site stats with site, status, count and latency)
+    """
+    workers = max(1, workers)
+    pending = list(selected_sites)
+    running: Dict[str, float] = {}
+    stragglers: Dict[str, threading.Thread] = {}
+    stalled_since = None
+    stats: Dict[str, dict] = {}
+    all_results: Dict[str, List[dict]] = {}
+    threads: Dict[str, threading.Thread] = {}
+    done_queue = queue.Queue()
+
+    # Years looked up after a site answered are written into its items as they arrive
+    year_links: Dict[int, dict] = {}
+    links_lock = threading.Lock()
+
+    def on_year(media):
+        with links_lock:
+            item = year_links.get(id(media))
+        if item is not None:
+            item['year'] = media.year
+
+    def run_site(alias: str):
+        site_name = alias.split("_")[0].capitalize()
+        func, _ = search_functions[alias]
+        try:
+            # Call the search function with get_onlyDatabase=True to get database object
+            with live_year_updates(on_year):
+                database = func(search_terms, get_onlyDatabase=True)
+            items = _database_to_items(database, alias, site_name)
+
+            with links_lock:
+                for element, item in zip(database.media_list if items else [], items):
+                    year_links[id(element)] = item
+                    item['year'] = getattr(element, 'year', item.get('year'))
+
+            done_queue.put((alias, 'ok' if items else 'empty', items, None))
+        except Exception as e:
+            done_queue.put((alias, 'error', [], str(e)))
+
+    while pending or running:
+        for alias, thread in list(stragglers.items()):
+            if not thread.is_alive():
+                stragglers.pop(alias)
+
+        while pending and len(running) + len(stragglers) < workers:
+            alias = pending.pop(0)
+            running[alias] = time.monotonic()
+            threads[alias] = threading.Thread(target=run_site, args=(alias,), name=f"search-{alias}", daemon=True)
+            threads[alias].start()
+
+        # Every slot is held by a site that already timed out
+        if pending and not running:
+            stalled_since = stalled_since or time.monotonic()
+            if time.monotonic() - stalled_since > timeout:
+                for alias in pending:
+                    stats[alias] = {'site': alias.split("_")[0].capitalize(), 'status': 'skipped', 'count': 0, 'latency': 0.0, 'error': None}
+                    if on_results:
+                        on_results(alias, [])
+                pending.clear()
+            time.sleep(0.2)
+            continue
+        stalled_since = None
+
+        try:
+            alias, status, items, error = done_queue.get(timeout=0.2)
+            if alias in running:
+                latency = time.monotonic() - running.pop(alias)
+                stats[alias] = {'site': alias.split("_")[0].capitalize(), 'status': status, 'count': len(items), 'latency': latency, 'error': error}
+
+                if items:
+                    all_results[alias] = items
+                if on_results:
+                    on_results(alias, items)
+        except queue.Empty:
+            pass
+
+        now = time.monotonic()
+        for alias, started in list(running.items()):
+            if now - started > timeout:
+                running.pop(alias)
+                stragglers[alias] = threads[alias]
+                stats[alias] = {'site': alias.split("_")[0].capitalize(), 'status': 'timeout', 'count': 0, 'latency': now - started, 'error': None}
+                if on_results:
+                    on_results(alias, [])
+
+    # Report in the order the sites were selected
+    ordered_results = {alias: all_results[alias] for alias in selected_sites if alias in all_results}
+    return ordered_results, [stats[alias] for alias in selected_sites if alias in stats]
+
+
+def _render_live_results(items: List[dict], waiting: int) -> Table:
+    table = Table(title="Results so far", caption=f"Waiting for {waiting} sites" if waiting else None)
+    table.add_column("#", style="dim", justify="center", width=4)
+    table.add_column("Title", style="magenta", min_width=20)
+    table.add_column("Type", style="yellow", justify="center", width=15)
+    table.add_column("Year", style="green", justify="center", width=8)
+    table.add_column("Source", style="cyan", width=25)
+
+    for i, item in enumerate(items, 1):
+        table.add_row(str(i), str(item.get('title', item.get('name', 'Unknown'))), str(item.get('type', item.get('media_type', 'Unknown'))), str(item.get('year', '') or ''), str(item.get('source', 'Unknown')))
+    return table
+
+
+def print_search_summary(stats: List[dict]):
+    """Print the status, result count and latency of every queried site."""
+    colors = {'ok': 'green', 'empty': 'yellow', 'error': 'red', 'timeout': 'red', 'skipped': 'red'}
+    table = Table(title="Search summary")
+    table.add_column("Site", style="cyan")
+    table.add_column("Status", justify="center")
+    table.add_column("Results", justify="right")
+    table.add_column("Time", justify="right")
+
+    for stat in sorted(stats, key=lambda s: s['latency']):
+        color = colors.get(stat['status'], 'white')
+        table.add_row(stat['site'], f"[{color}]{stat['status']}", str(stat['count']), f"{stat['latency']:.2f}s")
+        if stat['error']:
+            logging.error(f"Global search error on {stat['site']}: {stat['error']}")
+
+    console.print(table)
 
 
 def global_search(search_terms: str = None, selected_sites: list = None):
@@ -87,36 +257,23 @@ def global_search(search_terms: str = None, selected_sites: list = None):
     console.print(f"\n[green]Searching for: [yellow]{search_terms}")
     console.print(f"[green]Searching across: {len(selected_sites)} sites \n")
     
-    # Search each selected site
-    for alias in selected_sites:
-        site_name = alias.split("_")[0].capitalize()
-        console.print(f"[cyan]Search url in: {site_name}")
-        
-        func, _ = search_functions[alias]
-        try:
-            # Call the search function with get_onlyDatabase=True to get database object
-            database = func(search_terms, get_onlyDatabase=True)
-            
-            # Check if database has media_list attribute and it's not empty
-            if database and hasattr(database, 'media_list') and len(database.media_list) > 0:
-                # Store media_list items with additional source information
-                all_results[alias] = []
-                for element in database.media_list:
-                    # Convert element to dictionary if it's an object
-                    if hasattr(element, '__dict__'):
-                        item_dict = element.__dict__.copy()
-                    else:
-                        item_dict = {}  # Fallback for non-object items
-                        
-                    # Add source information
-                    item_dict['source'] = site_name
-                    item_dict['source_alias'] = alias
-                    all_results[alias].append(item_dict)
-                    
-                console.print(f"[green]Found result: {len(database.media_list)}\n")
+    # Query the sites concurrently, showing results as they arrive
+    streamed_items = []
+    answered = set()
 
-        except Exception as e:
-            console.print(f"[red]Error searching {site_name}: {str(e)}")
+    # Rendered on every refresh, so years that arrive late show up in place
+    def render():
+        return _render_live_results(list(streamed_items), len(selected_sites) - len(answered))
+
+    with Live(console=console, refresh_per_second=4, get_renderable=render) as live:
+        def on_results(alias, items):
+            answered.add(alias)
+            streamed_items.extend(items)
+            live.refresh()
+
+        all_results, stats = search_sites(search_terms, selected_sites, search_functions, on_results=on_results)
+
+    print_search_summary(stats)
     
     # Display the consolidated results
     if all_results:
@@ -125,6 +282,9 @@ def global_search(search_terms: str = None, selected_sites: list = None):
             for item in results:
                 all_media_items.append(item)
 
+        # Rank the merged results of all sites against the query, ties keep the site order
+        all_media_items = [item for item, _ in rank(search_terms, all_media_items, key=lambda item: item.get('title', item.get('name')))]
+
         # Display consolidated results
         manager = display_consolidated_results(all_media_items, search_terms)
         
@@ -4,6 +4,8 @@ import os
 import json
 import shutil
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
 
@@ -15,8 +17,9 @@ from rich.console import Console
 from StreamingCommunity.utils import config_manager, os_manager, internet_manager
 from StreamingCommunity.utils.http_client import get_headers
 from StreamingCommunity.setup import get_wvd_path, get_prd_path
-from StreamingCommunity.core.processors import join_video, join_audios, join_subtitles
+from StreamingCommunity.core.processors import join_video, mux_tracks
 from StreamingCommunity.core.processors.helper.nfo import create_nfo
+from StreamingCommunity.core.processors.encoder import encode_after_mux
 from StreamingCommunity.source.utils.tracker import download_tracker, context_tracker
 from StreamingCommunity.source.utils.media_players import MediaPlayers
 from StreamingCommunity.cli.run import execute_hooks
@@ -41,6 +44,7 @@ AUDIO_FILTER = config_manager.config.get('DOWNLOAD', 'select_audio')
 SUBTITLE_FILTER = config_manager.config.get('DOWNLOAD', 'select_subtitle')
 MERGE_SUBTITLES = config_manager.config.get_bool('PROCESS', 'merge_subtitle', default=True)
 MERGE_AUDIO = config_manager.config.get_bool('PROCESS', 'merge_audio', default=True)
+MAX_EXTRA_AUDIO_WORKERS = 3
 
 
 class DASH_Downloader:
@@ -93,6 +97,12 @@ class DASH_Downloader:
         self.copied_subtitles = []
         self.copied_audios = []
         self.audio_only = False
+
+        # Extra audio MPDs run in a pool, these guard the license server and the shared temp dir
+        self._license_lock = threading.Lock()
+        self._claim_lock = threading.Lock()
+        self._claimed_paths = set()
+        self._extra_audio_cancel = threading.Event()
     
     def _setup_drm_info(self, selected_ids, selected_kids, selected_langs, selected_periods):
         """Fetch and setup DRM information."""
@@ -266,137 +276,201 @@ class DASH_Downloader:
         # Priority: audio-specific license > main license
         effective_license_url     = audio_license_url or self.license_url
         effective_license_headers = audio_license_headers or self.license_headers
-        return self._get_keys_for_drm_info(drm_info, effective_license_url, effective_license_headers, self.key)
+        with self._license_lock:
+            return self._get_keys_for_drm_info(drm_info, effective_license_url, effective_license_headers, self.key)
+
+    def _claim_path(self, path: str) -> bool:
+        """Reserve a destination in the temp dir, False if another extra audio job already took it."""
+        with self._claim_lock:
+            if path in self._claimed_paths:
+                return False
+            self._claimed_paths.add(path)
+            return True
 
-    def _download_extra_audios(self) -> list:
+    def _download_extra_audio(self, audio_spec: dict, share: int = 1) -> tuple:
         """
-        Download extra audio tracks from separate MPD URLs.
-        For each audio:
+        Download one extra audio track from its own MPD URL:
           1. Creates dedicated MediaDownloader (audio-only, no video; subtitles included)
           2. Runs parser_stream() to get metadata + KIDs
           3. Fetches DRM keys specific to this audio KID
           4. Downloads with correct keys
           5. Moves result to main temp dir
-        Returns a list of dicts compatible with status['external_audios'].
+        Returns (audios, subtitles) lists compatible with status['external_audios'] / status['subtitles'].
         """
         external_audios = []
-        external_subtitles = []  # subtitles found in extra audio MPDs
+        external_subtitles = []  # subtitles found in this extra audio MPD
 
-        for audio_spec in self.mpd_audio_list:
-            audio_url             = audio_spec.get("url")
-            audio_language        = audio_spec.get("language", "und")
-            audio_headers         = audio_spec.get("headers") or self.mpd_headers
-            audio_license_url     = audio_spec.get("license_url") or self.license_url
-            audio_license_headers = audio_spec.get("license_headers")
+        # Hide live progress bars and split the thread budget with the other jobs
+        context_tracker.parallel_share = share
 
-            if not audio_url:
-                console.print(f"[yellow]Skipping extra audio '{audio_language}': missing url")
-                continue
-            
-            # Dedicated temp di
-            audio_temp_dir = os.path.join(self.output_dir, f"audio_{audio_language}_temp")
-            os_manager.create_path(audio_temp_dir)
-            audio_filename = self.filename_base
+        audio_url             = audio_spec.get("url")
+        audio_language        = audio_spec.get("language", "und")
+        audio_headers         = audio_spec.get("headers") or self.mpd_headers
+        audio_license_url     = audio_spec.get("license_url") or self.license_url
+        audio_license_headers = audio_spec.get("license_headers")
+
+        if not audio_url:
+            console.print(f"[yellow]Skipping extra audio '{audio_language}': missing url")
+            return external_audios, external_subtitles
+
+        if self._extra_audio_cancel.is_set():
+            return external_audios, external_subtitles
+        
+        # Dedicated temp di
+        audio_temp_dir = os.path.join(self.output_dir, f"audio_{audio_language}_temp")
+        os_manager.create_path(audio_temp_dir)
+        audio_filename = self.filename_base
+
+        try:
+            audio_downloader = MediaDownloader(
+                url=audio_url,
+                output_dir=audio_temp_dir,
+                filename=audio_filename,
+                headers=audio_headers,
+                cookies=self.cookies,
+                decrypt_preference=self.decrypt_preference,
+                download_id=None,
+                site_name=self.site_name,
+            )
+            audio_downloader.stop_event  = self._extra_audio_cancel
+            audio_downloader.license_url = audio_license_url
+            audio_downloader.drm_type    = self.drm_preference
+
+            # Drop video only; subtitles follow the global select_subtitle filter
+            audio_downloader.custom_filters = {
+                "video": "false",
+                "audio": f"lang='{audio_language}':for=best",
+                "subtitle": SUBTITLE_FILTER,
+            }
+
+            # --- Parse for extra audios  ---
+            console.print(f"[dim]Parsing DASH for audio {audio_language} ...")
+            audio_downloader.parser_stream(show_table=False)
+
+            # Get metadata paths for DRM extraction
+            a_meta_json, a_meta_selected, _, a_raw_mpd, _ = audio_downloader.get_metadata()
+
+            # --- Fetch DRM keys specific to this audio's KID ---
+            audio_keys = self._fetch_keys_for_audio(
+                audio_url, audio_headers,
+                a_meta_json, a_meta_selected, a_raw_mpd,
+                audio_license_url=audio_license_url,
+                audio_license_headers=audio_license_headers,
+            )
+
+            if audio_keys:
+                audio_downloader.set_key(audio_keys)
+
+            # The main download may have failed or been stopped while this one was parsing
+            if self._extra_audio_cancel.is_set():
+                return external_audios, external_subtitles
+
+            audio_status = audio_downloader.start_download()
+
+            if audio_status.get("error") == "cancelled":
+                return external_audios, external_subtitles
+
+            if audio_status.get("error"):
+                console.print(f"[yellow]Error downloading audio {audio_language}: {audio_status['error']}")
+                return external_audios, external_subtitles
+
+            # --- Collect and rename result ---
+            for audio_file in audio_status.get("audios", []):
+                fpath = audio_file.get("path")
+                if fpath and os.path.exists(fpath):
+                    ext = os.path.splitext(fpath)[1]
+                    final_path = os.path.join(self.output_dir, f"{self.filename_base}.{audio_language}{ext}")
+                    if not self._claim_path(final_path):
+                        continue
+                    try:
+                        shutil.move(fpath, final_path)
+                        external_audios.append({
+                            "file":     os.path.basename(final_path),
+                            "language": audio_language,
+                            "path":     final_path,
+                        })
+                    except Exception as e:
+                        console.print(f"[yellow]Could not move audio {audio_language}: {e}")
+
+            # --- Collect subtitles downloaded from this MPD ---
+            for sub_file in audio_status.get("subtitles", []):
+                fpath = sub_file.get("path")
+                if fpath and os.path.exists(fpath):
+                    ext = os.path.splitext(fpath)[1]
+                    sub_lang = sub_file.get("language") or sub_file.get("name") or audio_language
+                    final_sub_path = os.path.join(self.output_dir, f"{self.filename_base}.{sub_lang}{ext}")
+
+                    # Several MPDs often carry the same subtitle, keep the first one
+                    if not self._claim_path(final_sub_path):
+                        continue
+                    try:
+                        shutil.move(fpath, final_sub_path)
+                        external_subtitles.append({
+                            "path":     final_sub_path,
+                            "language": sub_lang,
+                            "name":     sub_lang,
+                            "size":     os.path.getsize(final_sub_path),
+                        })
+                        console.print(f"[dim]Extra subtitle [cyan]{sub_lang}[/cyan] from {audio_language} MPD ready.")
+                    except Exception as e:
+                        console.print(f"[yellow]Could not move subtitle {sub_lang}: {e}")
 
+        except Exception as e:
+            console.print(f"[yellow]Warning on extra audio {audio_language}: {e}")
+
+        finally:
+            # Copy log files before cleanup
             try:
-                audio_downloader = MediaDownloader(
-                    url=audio_url,
-                    output_dir=audio_temp_dir,
-                    filename=audio_filename,
-                    headers=audio_headers,
-                    cookies=self.cookies,
-                    decrypt_preference=self.decrypt_preference,
-                    download_id=None,
-                    site_name=self.site_name,
-                )
-                audio_downloader.license_url = audio_license_url
-                audio_downloader.drm_type    = self.drm_preference
-
-                # Drop video only; subtitles follow the global select_subtitle filter
-                audio_downloader.custom_filters = {
-                    "video": "false",
-                    "audio": f"lang='{audio_language}':for=best",
-                    "subtitle": SUBTITLE_FILTER,
-                }
-
-                # --- Parse for extra audios  ---
-                console.print(f"[dim]Parsing DASH for audio {audio_language} ...")
-                audio_downloader.parser_stream(show_table=False)
-
-                # Get metadata paths for DRM extraction
-                a_meta_json, a_meta_selected, _, a_raw_mpd, _ = audio_downloader.get_metadata()
-
-                # --- Fetch DRM keys specific to this audio's KID ---
-                audio_keys = self._fetch_keys_for_audio(
-                    audio_url, audio_headers,
-                    a_meta_json, a_meta_selected, a_raw_mpd,
-                    audio_license_url=audio_license_url,
-                    audio_license_headers=audio_license_headers,
-                )
-
-                if audio_keys:
-                    audio_downloader.set_key(audio_keys)
-
-                audio_status = audio_downloader.start_download()
-
-                if audio_status.get("error"):
-                    console.print(f"[yellow]Error downloading audio {audio_language}: {audio_status['error']}")
-                    continue
-
-                # --- Collect and rename result ---
-                for audio_file in audio_status.get("audios", []):
-                    fpath = audio_file.get("path")
-                    if fpath and os.path.exists(fpath):
-                        ext = os.path.splitext(fpath)[1]
-                        final_path = os.path.join(self.output_dir, f"{self.filename_base}.{audio_language}{ext}")
-                        try:
-                            shutil.move(fpath, final_path)
-                            external_audios.append({
-                                "file":     os.path.basename(final_path),
-                                "language": audio_language,
-                                "path":     final_path,
-                            })
-                        except Exception as e:
-                            console.print(f"[yellow]Could not move audio {audio_language}: {e}")
-
-                # --- Collect subtitles downloaded from this MPD ---
-                for sub_file in audio_status.get("subtitles", []):
-                    fpath = sub_file.get("path")
-                    if fpath and os.path.exists(fpath):
-                        ext = os.path.splitext(fpath)[1]
-                        sub_lang = sub_file.get("language") or sub_file.get("name") or audio_language
-                        final_sub_path = os.path.join(self.output_dir, f"{self.filename_base}.{sub_lang}{ext}")
-                        try:
-                            shutil.move(fpath, final_sub_path)
-                            external_subtitles.append({
-                                "path":     final_sub_path,
-                                "language": sub_lang,
-                                "name":     sub_lang,
-                                "size":     os.path.getsize(final_sub_path),
-                            })
-                            console.print(f"[dim]Extra subtitle [cyan]{sub_lang}[/cyan] from {audio_language} MPD ready.")
-                        except Exception as e:
-                            console.print(f"[yellow]Could not move subtitle {sub_lang}: {e}")
+                for log_file in os.listdir(audio_temp_dir):
+                    if 'parsing' in log_file or 'log' in log_file:
+                        src = os.path.join(audio_temp_dir, log_file)
+                        dst = os.path.join(self.output_dir, f"{audio_language}_{log_file}")
+                        if os.path.isfile(src):
+                            shutil.copy2(src, dst)
+            except Exception:
+                pass
+            
+            shutil.rmtree(audio_temp_dir, ignore_errors=True)
+
+        return external_audios, external_subtitles
+
+    def _start_extra_audios(self) -> list:
+        """Start the extra audio MPD downloads in a bounded pool, they run alongside the main download."""
+        workers = min(MAX_EXTRA_AUDIO_WORKERS, len(self.mpd_audio_list))
+        share = context_tracker.budget_share * (workers + 1)
+
+        # The main download gets the same slice of the budget, its progress bar stays visible
+        context_tracker.budget_share = share
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dash-extra-audio")
+        futures = [executor.submit(self._download_extra_audio, audio_spec, share) for audio_spec in self.mpd_audio_list]
+        executor.shutdown(wait=False)
+        return futures
+
+    def _collect_extra_audios(self, futures: list) -> tuple:
+        """Wait for the extra audio jobs and merge their results in the order of mpd_audio_list."""
+        external_audios = []
+        external_subtitles = []
+        seen_sub_paths = set()
 
+        for audio_spec, future in zip(self.mpd_audio_list, futures):
+            try:
+                audios, subtitles = future.result()
             except Exception as e:
-                console.print(f"[yellow]Warning on extra audio {audio_language}: {e}")
-
-            finally:
-                # Copy log files before cleanup
-                try:
-                    for log_file in os.listdir(audio_temp_dir):
-                        if 'parsing' in log_file or 'log' in log_file:
-                            src = os.path.join(audio_temp_dir, log_file)
-                            dst = os.path.join(self.output_dir, f"{audio_language}_{log_file}")
-                            if os.path.isfile(src):
-                                shutil.copy2(src, dst)
-                except Exception:
-                    pass
-                
-                shutil.rmtree(audio_temp_dir, ignore_errors=True)
+                console.print(f"[yellow]Warning on extra audio {audio_spec.get('language', 'und')}: {e}")
+                continue
+
+            external_audios.extend(audios)
+            for sub in subtitles:
+                if sub.get("path") not in seen_sub_paths:
+                    seen_sub_paths.add(sub.get("path"))
+                    external_subtitles.append(sub)
 
         return external_audios, external_subtitles
 
+    def _download_extra_audios(self) -> tuple:
+        """Download every extra audio track of mpd_audio_list, see _download_extra_audio."""
+        return self._collect_extra_audios(self._start_extra_audios())
+
     def start(self):
         """Main execution flow for downloading DASH content."""
         if self.file_already_exists:
@@ -472,10 +546,27 @@ class DASH_Downloader:
             download_tracker.update_status(self.download_id, "Downloading ...")
         
         console.print("[dim]Starting download ...")
-        self.media_downloader.set_key(self.decryption_keys)
-        status = self.media_downloader.start_download()
-        
-        # Check for cancellation
+        context_tracker.notify_download_start()
+
+        # Extra audio tracks (separate MPDs, one per language) download alongside the main one
+        extra_audio_futures = self._start_extra_audios() if self.mpd_audio_list else []
+
+        try:
+            self.media_downloader.set_key(self.decryption_keys)
+            status = self.media_downloader.start_download()
+        except Exception:
+            # Do not leave the extra audio jobs running after the main download failed
+            self._extra_audio_cancel.set()
+            self._collect_extra_audios(extra_audio_futures)
+            raise
+        finally:
+            context_tracker.budget_share = None
+        
+        # Check for cancellation, running extra audio jobs stop through their stop_event
+        if status.get('error') == 'cancelled' or self._no_media_downloaded(status):
+            self._extra_audio_cancel.set()
+            self._collect_extra_audios(extra_audio_futures)
+
         if status.get('error') == 'cancelled':
             if self.download_id:
                 download_tracker.complete_download(self.download_id, success=False, error="cancelled")
@@ -488,10 +579,13 @@ class DASH_Downloader:
                 download_tracker.complete_download(self.download_id, success=False, error="No media downloaded")
             return None, True
 
-        # Download extra audio tracks (separate MPDs, one per language)
-        if self.mpd_audio_list:
-            extra_audios, extra_subtitles = self._download_extra_audios()
+        if extra_audio_futures:
+            extra_audios, extra_subtitles = self._collect_extra_audios(extra_audio_futures)
             status["external_audios"] = extra_audios
+
+            # A dub that finished before the video sits in the same folder and was listed as a main audio too
+            extra_audio_paths = {os.path.abspath(a["path"]) for a in extra_audios}
+            status["audios"] = [a for a in status.get("audios", []) if os.path.abspath(a.get("path", "")) not in extra_audio_paths]
             if extra_subtitles:
                 existing_sub_paths = {s.get("path") for s in status.get("subtitles", [])}
                 for sub in extra_subtitles:
@@ -499,6 +593,14 @@ class DASH_Downloader:
                         status["subtitles"].append(sub)
                         existing_sub_paths.add(sub.get("path"))
 
+        # Hand muxing to the series pipeline when one is running, so the next download can start
+        post_processor = context_tracker.post_processor
+        if post_processor is not None:
+            return post_processor(self.output_path, lambda: self._finalize(status))
+        return self._finalize(status)
+
+    def _finalize(self, status):
+        """Mux the downloaded tracks, move them in place, write the NFO and run the hooks."""
         # Merge files
         if self.download_id:
             download_tracker.update_status(self.download_id, "Muxing ...")
@@ -524,13 +626,18 @@ class DASH_Downloader:
         # Move audio files if any were copied without merging
         self._move_copied_audios()
         
+        # Re-encode now or queue it, if the mux only copied the streams. A queued encode
+        # completes the download itself once the file is final, so hooks never see the copy.
+        deferred = encode_after_mux(self.output_path, on_done=self._complete_download)
+
         # Print summary and cleanup
         self._print_summary()
-        
-        if CREATE_NFO_FILES:
-            create_nfo(self.output_path)
-        if self.download_id:
-            download_tracker.complete_download(self.download_id, success=True, path=os.path.abspath(self.output_path))
+
+        if deferred:
+            if self.download_id:
+                download_tracker.update_status(self.download_id, "Encoding (queued) ...")
+        else:
+            self._complete_download()
             
         if CLEANUP_TMP:
             shutil.rmtree(self.output_dir, ignore_errors=True)
@@ -538,6 +645,13 @@ class DASH_Downloader:
         execute_hooks('post_run')
         return self.output_path, False
     
+    def _complete_download(self):
+        """Write the NFO and report the download as done, which runs the post_download hooks."""
+        if CREATE_NFO_FILES:
+            create_nfo(self.output_path)
+        if self.download_id:
+            download_tracker.complete_download(self.download_id, success=True, path=os.path.abspath(self.output_path))
+
     def _no_media_downloaded(self, status):
         """Check if no media was downloaded."""
         return (status.get('video') is None and status.get('audios') == [] and status.get('subtitles') == [] and status.get('external_subtitles') == [])
@@ -546,9 +660,7 @@ class DASH_Downloader:
         """Move file to final output path."""
         if os.path.abspath(final_file) != os.path.abspath(self.output_path):
             try:
-                if os.path.exists(self.output_path):
-                    os.remove(self.output_path)
-                os.rename(final_file, self.output_path)
+                os_manager.move_file(final_file, self.output_path)
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not move file: {e}")
                 self.output_path = final_file
@@ -595,61 +707,36 @@ class DASH_Downloader:
             self.last_merge_result = result_json
             return merged_file if os.path.exists(merged_file) else None
         
-        current_file = video_path
-        
-        # Merge or track audio tracks
-        if audio_tracks:
-            if MERGE_AUDIO:
-                current_file = self._merge_audio_tracks(current_file, audio_tracks)
-            else:
-                self._track_audios_for_copy(audio_tracks)
-        
-       # Merge or track subtitle tracks
-        if status['subtitles']:
-            if MERGE_SUBTITLES:
-                current_file = self._merge_subtitle_tracks(current_file, status['subtitles'])
-            else:
-                self._track_subtitles_for_copy(status['subtitles'])
-        
-        return current_file
+        # Tracks not merged are copied next to the final file
+        merge_audios = audio_tracks if MERGE_AUDIO else []
+        merge_subtitles = status['subtitles'] if MERGE_SUBTITLES else []
+        if audio_tracks and not MERGE_AUDIO:
+            self._track_audios_for_copy(audio_tracks)
+        if status['subtitles'] and not MERGE_SUBTITLES:
+            self._track_subtitles_for_copy(status['subtitles'])
+
+        if not merge_audios and not merge_subtitles:
+            return video_path
+
+        return self._mux_tracks(video_path, merge_audios, merge_subtitles)
     
-    def _merge_audio_tracks(self, current_file, audio_tracks):
-        """Merge audio tracks with current video."""
-        console.print(f"[cyan]\nMerging [red]{len(audio_tracks)} [cyan]audio track(s)...")
-        audio_output = os.path.join(self.output_dir, f"{self.filename_base}_with_audio.{EXTENSION_OUTPUT}")
-        
-        merged_file, _, result_json = join_audios(
-            video_path=current_file,
+    def _mux_tracks(self, video_path, audio_tracks, subtitle_tracks):
+        """Mux audio and subtitle tracks with the video in a single FFmpeg pass."""
+        console.print(f"[cyan]\nMerging [red]{len(audio_tracks)} [cyan]audio and [red]{len(subtitle_tracks)} [cyan]subtitle track(s)...")
+        merged_file, result_json = mux_tracks(
+            video_path=video_path,
             audio_tracks=audio_tracks,
-            out_path=audio_output,
-            log_path=os.path.join(self.output_dir, "audio_merge.log")
-        )
-        self.last_merge_result = result_json
-        
-        if os.path.exists(merged_file):
-            return merged_file
-        else:
-            console.print("[yellow]Audio merge failed, continuing with video only")
-            return current_file
-    
-    def _merge_subtitle_tracks(self, current_file, subtitle_tracks):
-        """Merge subtitle tracks with current video."""
-        console.print(f"[cyan]\nMerging [red]{len(subtitle_tracks)} [cyan]subtitle track(s)...")
-        sub_output = os.path.join(self.output_dir, f"{self.filename_base}_final.{EXTENSION_OUTPUT}")
-        
-        merged_file, result_json = join_subtitles(
-            video_path=current_file,
             subtitles_list=subtitle_tracks,
-            out_path=sub_output,
-            log_path=os.path.join(self.output_dir, "sub_merge.log")
+            out_path=os.path.join(self.output_dir, f"{self.filename_base}_final.{EXTENSION_OUTPUT}"),
+            log_path=os.path.join(self.output_dir, "mux.log")
         )
         self.last_merge_result = result_json
         
         if os.path.exists(merged_file):
             return merged_file
         else:
-            console.print("[yellow]Subtitle merge failed, continuing without subtitles")
-            return current_file
+            console.print("[yellow]Mux failed, continuing with video only")
+            return video_path
     
     def _track_subtitles_for_copy(self, subtitles_list):
         """Track subtitle paths for later copying to final location."""
@@ -671,6 +758,7 @@ class DASH_Downloader:
         
         output_dir = os.path.dirname(self.output_path)
         filename_base = os.path.splitext(os.path.basename(self.output_path))[0]
+        stage_file = os_manager.move_file if CLEANUP_TMP else os_manager.link_or_copy
         console.print("[cyan]Copy the subtitles to the final path.")
         
         for sub_info in self.copied_subtitles:
@@ -682,7 +770,7 @@ class DASH_Downloader:
             dst_path = os.path.join(output_dir, f"{filename_base}.{language}{extension}")
             
             try:
-                shutil.copy2(src_path, dst_path)
+                stage_file(src_path, dst_path)
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not move subtitle {language}: {e}")
     
@@ -706,6 +794,7 @@ class DASH_Downloader:
         
         output_dir = os.path.dirname(self.output_path)
         filename_base = os.path.splitext(os.path.basename(self.output_path))[0]
+        stage_file = os_manager.move_file if CLEANUP_TMP else os_manager.link_or_copy
         console.print("[cyan]Copy the audios to the final path.")
         
         for idx, audio_info in enumerate(self.copied_audios):
@@ -715,11 +804,11 @@ class DASH_Downloader:
             
             if self.audio_only and idx == 0:
                 dst_path = self.output_path
-                move_func = shutil.move
+                move_func = os_manager.move_file
             else:
                 # final name
                 dst_path = os.path.join(output_dir, f"{filename_base}.{language}{extension}")
-                move_func = shutil.copy2
+                move_func = stage_file
             
             try:
                 move_func(src_path, dst_path)
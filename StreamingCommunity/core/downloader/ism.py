@@ -14,8 +14,9 @@ from rich.console import Console
 from StreamingCommunity.utils import config_manager, os_manager, internet_manager
 from StreamingCommunity.utils.http_client import get_headers
 from StreamingCommunity.setup import get_wvd_path, get_prd_path
-from StreamingCommunity.core.processors import join_video, join_audios, join_subtitles
+from StreamingCommunity.core.processors import join_video, mux_tracks
 from StreamingCommunity.core.processors.helper.nfo import create_nfo
+from StreamingCommunity.core.processors.encoder import encode_after_mux
 from StreamingCommunity.source.utils.tracker import download_tracker, context_tracker
 from StreamingCommunity.source.utils.media_players import MediaPlayers
 from StreamingCommunity.cli.run import execute_hooks
@@ -207,6 +208,7 @@ class ISM_Downloader:
             download_tracker.update_status(self.download_id, "Downloading ...")
         
         console.print("[dim]Starting download ...")
+        context_tracker.notify_download_start()
         self.media_downloader.set_key(self.decryption_keys)
         status = self.media_downloader.start_download()
         
@@ -223,6 +225,14 @@ class ISM_Downloader:
                 download_tracker.complete_download(self.download_id, success=False, error="No media downloaded")
             return None, True
         
+        # Hand muxing to the series pipeline when one is running, so the next download can start
+        post_processor = context_tracker.post_processor
+        if post_processor is not None:
+            return post_processor(self.output_path, lambda: self._finalize(status))
+        return self._finalize(status)
+
+    def _finalize(self, status):
+        """Mux the downloaded tracks, move them in place, write the NFO and run the hooks."""
         # Merge files
         if self.download_id:
             download_tracker.update_status(self.download_id, "Muxing ...")
@@ -245,13 +255,18 @@ class ISM_Downloader:
         self._move_copied_audios()
         self._move_copied_subtitles()
         
+        # Re-encode now or queue it, if the mux only copied the streams. A queued encode
+        # completes the download itself once the file is final, so hooks never see the copy.
+        deferred = encode_after_mux(self.output_path, on_done=self._complete_download)
+
         # Print summary and cleanup
         self._print_summary()
-        
-        if CREATE_NFO_FILES:
-            create_nfo(self.output_path)
-        if self.download_id:
-            download_tracker.complete_download(self.download_id, success=True, path=os.path.abspath(self.output_path))
+
+        if deferred:
+            if self.download_id:
+                download_tracker.update_status(self.download_id, "Encoding (queued) ...")
+        else:
+            self._complete_download()
             
         if CLEANUP_TMP:
             shutil.rmtree(self.output_dir, ignore_errors=True)
@@ -259,6 +274,13 @@ class ISM_Downloader:
         execute_hooks('post_run')
         return self.output_path, False
     
+    def _complete_download(self):
+        """Write the NFO and report the download as done, which runs the post_download hooks."""
+        if CREATE_NFO_FILES:
+            create_nfo(self.output_path)
+        if self.download_id:
+            download_tracker.complete_download(self.download_id, success=True, path=os.path.abspath(self.output_path))
+
     def _no_media_downloaded(self, status):
         """Check if no media was downloaded."""
         return (status.get('video') is None and status.get('audios') == [] and status.get('subtitles') == [] and status.get('external_subtitles') == [])
@@ -267,9 +289,7 @@ class ISM_Downloader:
         """Move file to final output path."""
         if os.path.abspath(final_file) != os.path.abspath(self.output_path):
             try:
-                if os.path.exists(self.output_path):
-                    os.remove(self.output_path)
-                os.rename(final_file, self.output_path)
+                os_manager.move_file(final_file, self.output_path)
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not move file: {e}")
                 self.output_path = final_file
@@ -311,61 +331,36 @@ class ISM_Downloader:
             self.last_merge_result = result_json
             return merged_file if os.path.exists(merged_file) else None
         
-        current_file = video_path
-        
-        # Merge or track audio tracks
-        if status['audios']:
-            if MERGE_AUDIO:
-                current_file = self._merge_audio_tracks(current_file, status['audios'])
-            else:
-                self._track_audios_for_copy(status['audios'])
-        
-        # Merge or track subtitle tracks
-        if status['subtitles']:
-            if MERGE_SUBTITLES:
-                current_file = self._merge_subtitle_tracks(current_file, status['subtitles'])
-            else:
-                self._track_subtitles_for_copy(status['subtitles'])
-        
-        return current_file
+        # Tracks not merged are copied next to the final file
+        merge_audios = status['audios'] if MERGE_AUDIO else []
+        merge_subtitles = status['subtitles'] if MERGE_SUBTITLES else []
+        if status['audios'] and not MERGE_AUDIO:
+            self._track_audios_for_copy(status['audios'])
+        if status['subtitles'] and not MERGE_SUBTITLES:
+            self._track_subtitles_for_copy(status['subtitles'])
+
+        if not merge_audios and not merge_subtitles:
+            return video_path
+
+        return self._mux_tracks(video_path, merge_audios, merge_subtitles)
     
-    def _merge_audio_tracks(self, current_file, audio_tracks):
-        """Merge audio tracks with current video."""
-        console.print(f"[cyan]\nMerging [red]{len(audio_tracks)} [cyan]audio track(s)...")
-        audio_output = os.path.join(self.output_dir, f"{self.filename_base}_with_audio.{EXTENSION_OUTPUT}")
-        
-        merged_file, _, result_json = join_audios(
-            video_path=current_file,
+    def _mux_tracks(self, video_path, audio_tracks, subtitle_tracks):
+        """Mux audio and subtitle tracks with the video in a single FFmpeg pass."""
+        console.print(f"[cyan]\nMerging [red]{len(audio_tracks)} [cyan]audio and [red]{len(subtitle_tracks)} [cyan]subtitle track(s)...")
+        merged_file, result_json = mux_tracks(
+            video_path=video_path,
             audio_tracks=audio_tracks,
-            out_path=audio_output,
-            log_path=os.path.join(self.output_dir, "audio_merge.log")
-        )
-        self.last_merge_result = result_json
-        
-        if os.path.exists(merged_file):
-            return merged_file
-        else:
-            console.print("[yellow]Audio merge failed, continuing with video only")
-            return current_file
-    
-    def _merge_subtitle_tracks(self, current_file, subtitle_tracks):
-        """Merge subtitle tracks with current video."""
-        console.print(f"[cyan]\nMerging [red]{len(subtitle_tracks)} [cyan]subtitle track(s)...")
-        sub_output = os.path.join(self.output_dir, f"{self.filename_base}_final.{EXTENSION_OUTPUT}")
-        
-        merged_file, result_json = join_subtitles(
-            video_path=current_file,
             subtitles_list=subtitle_tracks,
-            out_path=sub_output,
-            log_path=os.path.join(self.output_dir, "sub_merge.log")
+            out_path=os.path.join(self.output_dir, f"{self.filename_base}_final.{EXTENSION_OUTPUT}"),
+            log_path=os.path.join(self.output_dir, "mux.log")
         )
         self.last_merge_result = result_json
         
         if os.path.exists(merged_file):
             return merged_file
         else:
-            console.print("[yellow]Subtitle merge failed, continuing without subtitles")
-            return current_file
+            console.print("[yellow]Mux failed, continuing with video only")
+            return video_path
     
     def _track_audios_for_copy(self, audios_list):
         """Track audio paths for later copying to final location."""
@@ -400,6 +395,7 @@ class ISM_Downloader:
         
         output_dir = os.path.dirname(self.output_path)
         filename_base = os.path.splitext(os.path.basename(self.output_path))[0]
+        stage_file = os_manager.move_file if CLEANUP_TMP else os_manager.link_or_copy
         console.print("[cyan]Copy the audios to the final path.")
         
         for idx, audio_info in enumerate(self.copied_audios):
@@ -409,11 +405,11 @@ class ISM_Downloader:
             
             if self.audio_only and idx == 0:
                 dst_path = self.output_path
-                move_func = shutil.move
+                move_func = os_manager.move_file
             else:
                 # final name
                 dst_path = os.path.join(output_dir, f"{filename_base}.{language}{extension}")
-                move_func = shutil.copy2
+                move_func = stage_file
             
             try:
                 move_func(src_path, dst_path)
@@ -427,6 +423,7 @@ class ISM_Downloader:
         
         output_dir = os.path.dirname(self.output_path)
         filename_base = os.path.splitext(os.path.basename(self.output_path))[0]
+        stage_file = os_manager.move_file if CLEANUP_TMP else os_manager.link_or_copy
         console.print("[cyan]Copy the subtitles to the final path.")
         
         for subtitle_info in self.copied_subtitles:
@@ -438,7 +435,7 @@ class ISM_Downloader:
             dst_path = os.path.join(output_dir, f"{filename_base}.{language}{extension}")
             
             try:
-                shutil.copy2(src_path, dst_path)
+                stage_file(src_path, dst_path)
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not move subtitle {language}: {e}")
     
@@ -1,11 +1,13 @@
 # 09.06.24
 
 import os
+import json
 import time
 import signal
 import logging
 from functools import partial
 import threading
+from contextlib import nullcontext
 
 
 # External libraries
@@ -29,6 +31,22 @@ console = Console()
 REQUEST_VERIFY = config_manager.config.get_bool('REQUESTS', 'verify')
 CREATE_NFO_FILES = config_manager.config.get_bool('PROCESS', 'generate_nfo', default=False)
 SKIP_DOWNLOAD = config_manager.config.get_bool('DOWNLOAD', 'skip_download')
+MP4_CONNECTIONS = config_manager.config.get_int('DOWNLOAD', 'mp4_connections', default=4)
+MAX_RETRY = config_manager.config.get_int('REQUESTS', 'max_retry', default=3)
+
+# Ranged download tuning
+MIN_SEGMENT_SIZE = 4 * 1024 * 1024
+MIN_PARALLEL_SIZE = 2 * MIN_SEGMENT_SIZE
+
+# Write loop tuning: chunks grow to about CHUNK_TARGET_SECONDS of data, UI refresh is rate limited
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+CHUNK_TARGET_SECONDS = 0.25
+PROGRESS_INTERVAL = 0.2
+
+# Resume sidecar, written next to the .temp file
+RESUME_SUFFIX = '.resume.json'
+STATE_SAVE_INTERVAL = 2.0
 
 
 class InterruptHandler:
@@ -60,11 +78,645 @@ def signal_handler(signum, frame, interrupt_handler, original_handler):
         signal.signal(signum, original_handler)
 
 
+class RangeNotSupported(Exception):
+    """Raised when the server answers a Range request with the full body."""
+
+
+class _Segment:
+    def __init__(self, start: int, end: int):
+        self.start = start      # Next byte reserved by the worker
+        self.written = start    # Bytes below this offset are on disk
+        self.end = end          # Exclusive, may shrink when another worker steals the tail
+
+    @property
+    def remaining(self) -> int:
+        return self.end - self.start
+
+
+def _pwrite(fd: int, data: bytes, offset: int, lock: threading.Lock):
+    """Positional write, emulated with lseek+write where os.pwrite is missing (Windows)."""
+    if hasattr(os, 'pwrite'):
+        while data:
+            written = os.pwrite(fd, data, offset)
+            data = data[written:]
+            offset += written
+    else:
+        with lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            while data:
+                written = os.write(fd, data)
+                data = data[written:]
+
+
+def adaptive_chunk_size(speed: float) -> int:
+    """Power of two between MIN_CHUNK_SIZE and MAX_CHUNK_SIZE holding about CHUNK_TARGET_SECONDS of data."""
+    size = MIN_CHUNK_SIZE
+    target = speed * CHUNK_TARGET_SECONDS
+    while size < MAX_CHUNK_SIZE and size * 2 <= target:
+        size *= 2
+    return size
+
+
+class _ChunkBuffer:
+    def __init__(self):
+        """Reusable write buffer, received data is copied in and flushed in large writes."""
+        self.buf = bytearray(MAX_CHUNK_SIZE)
+        self.view = memoryview(self.buf)
+        self.pos = 0
+        self.target = MIN_CHUNK_SIZE
+        self.last_flush = time.monotonic()
+
+    def add(self, data) -> bool:
+        """Append data, return True when the buffer should be flushed."""
+        size = len(data)
+        if self.pos + size > len(self.buf):
+            # Oversized chunk (e.g. decompressed body), grow once instead of failing
+            self.view.release()
+            self.buf.extend(bytes(self.pos + size - len(self.buf)))
+            self.view = memoryview(self.buf)
+        self.view[self.pos:self.pos + size] = data
+        self.pos += size
+        return self.pos >= self.target or self.pos + MIN_CHUNK_SIZE > MAX_CHUNK_SIZE
+
+    def data(self):
+        return self.view[:self.pos]
+
+    def reset(self):
+        """Empty the buffer and resize the next chunk on the measured throughput."""
+        now = time.monotonic()
+        elapsed = now - self.last_flush
+        if elapsed > 0 and self.pos:
+            self.target = adaptive_chunk_size(self.pos / elapsed)
+        self.last_flush = now
+        self.pos = 0
+
+
+def _write_all(file, data) -> int:
+    """Write data to an unbuffered file, looping on short writes."""
+    view = memoryview(data)
+    total = len(view)
+    while view:
+        view = view[file.write(view):]
+    return total
+
+
+def get_validator(response_headers) -> str:
+    """Return a strong ETag or the Last-Modified date, usable as If-Range value."""
+    etag = response_headers.get('etag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response_headers.get('last-modified')
+
+
+def load_resume_state(temp_path: str, validator: str, total: int):
+    """
+    Return the byte ranges still missing from temp_path, or None when it cannot be resumed.
+
+    The URL is not compared since most CDNs sign it per request, the validator and the
+    size identify the remote file.
+    """
+    state_path = temp_path + RESUME_SUFFIX
+    if not validator or not total or not (os.path.exists(temp_path) and os.path.exists(state_path)):
+        return None
+
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+        if state.get('validator') != validator or state.get('total') != total:
+            logging.info(f"Resume state of {temp_path} is stale, restarting")
+            return None
+
+        return [(int(a), int(b)) for a, b in state.get('remaining', []) if int(b) > int(a)]
+
+    except Exception as e:
+        logging.warning(f"Invalid resume state {state_path}: {e}")
+        return None
+
+
+def save_resume_state(temp_path: str, validator: str, total: int, remaining: list):
+    state_path = temp_path + RESUME_SUFFIX
+    try:
+        with open(state_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'validator': validator, 'total': total, 'remaining': remaining}, f)
+        os.replace(state_path + '.tmp', state_path)
+    except Exception as e:
+        logging.warning(f"Could not save resume state {state_path}: {e}")
+
+
+def clear_resume_state(temp_path: str):
+    try:
+        os.remove(temp_path + RESUME_SUFFIX)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning(f"Could not remove resume state of {temp_path}: {e}")
+
+
+def probe_range_support(client, url: str, headers: dict) -> bool:
+    """Check that the server really honours byte ranges with a one byte request."""
+    try:
+        probe_headers = dict(headers)
+        probe_headers['Range'] = 'bytes=0-0'
+        with client.stream("GET", url, headers=probe_headers) as response:
+            return response.status_code == 206 and 'content-range' in response.headers
+    except Exception:
+        return False
+
+
+class ParallelRangeDownloader:
+    def __init__(self, client, url: str, headers: dict, path: str, total: int, connections: int, validator: str = None, segments: list = None):
+        """
+        Download a file with several ranged connections into a preallocated file.
+
+        The file is split in one segment per connection, when a worker finishes its own
+        segment it steals the second half of the largest segment still in progress.
+        When segments is given only those (start, end) ranges of an existing file are fetched.
+        """
+        self.client = client
+        self.url = url
+        self.headers = dict(headers)
+        self.path = path
+        self.total = total
+        self.connections = max(1, connections)
+        self.resume = segments is not None
+
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.pending = []
+        self.active = []
+        self.downloaded = 0
+        self.error = None
+        self.stopped = False
+        self.threads = []
+        self.fd = None
+
+        if validator:
+            self.headers['If-Range'] = validator
+
+        if self.resume:
+            self.pending = [_Segment(start, end) for start, end in segments]
+        else:
+            seg_size = -(-total // self.connections)
+            for start in range(0, total, seg_size):
+                self.pending.append(_Segment(start, min(start + seg_size, total)))
+
+    def start(self):
+        if self.resume:
+            with open(self.path, 'r+b') as f:
+                if os.fstat(f.fileno()).st_size != self.total:
+                    f.truncate(self.total)
+        else:
+            with open(self.path, 'wb') as f:
+                f.truncate(self.total)
+
+        self.fd = os.open(self.path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+        for idx in range(self.connections):
+            t = threading.Thread(target=self._worker, name=f"mp4-range-{idx}", daemon=True)
+            t.start()
+            self.threads.append(t)
+
+    def is_alive(self) -> bool:
+        return any(t.is_alive() for t in self.threads)
+
+    def stop(self):
+        self.stopped = True
+
+    def join(self):
+        for t in self.threads:
+            t.join()
+        if self.fd is not None:
+            try:
+                os.fsync(self.fd)
+            except Exception:
+                pass
+            os.close(self.fd)
+            self.fd = None
+
+    def contiguous_size(self) -> int:
+        """Bytes written from the start of the file without holes."""
+        with self.lock:
+            unfinished = [s.written for s in self.pending + self.active if s.end > s.written]
+        return min(unfinished) if unfinished else self.total
+
+    def remaining_ranges(self) -> list:
+        """Byte ranges not yet on disk, as stored in the resume sidecar."""
+        with self.lock:
+            return sorted([s.written, s.end] for s in self.pending + self.active if s.end > s.written)
+
+    def _next_segment(self):
+        with self.lock:
+            if self.pending:
+                seg = self.pending.pop(0)
+                self.active.append(seg)
+                return seg
+
+            # Work stealing: split the biggest segment still downloading
+            victim = max(self.active, key=lambda s: s.remaining, default=None)
+            if victim is None or victim.remaining < 2 * MIN_SEGMENT_SIZE:
+                return None
+
+            mid = victim.start + victim.remaining // 2
+            seg = _Segment(mid, victim.end)
+            victim.end = mid
+            self.active.append(seg)
+            return seg
+
+    def _worker(self):
+        # One write buffer per worker, reused for every segment it fetches or steals
+        buffer = _ChunkBuffer()
+
+        while not self.stopped:
+            seg = self._next_segment()
+            if seg is None:
+                return
+
+            try:
+                self._fetch_with_retry(seg, buffer)
+
+            except Exception as e:
+                logging.error(f"Range worker failed on bytes {seg.start}-{seg.end - 1}: {e}")
+                with self.lock:
+                    self.error = self.error or e
+                    self.stopped = True
+                return
+
+            finally:
+                with self.lock:
+                    if seg.written >= seg.end:
+                        self.active.remove(seg)
+
+    def _flush(self, seg: _Segment, buffer: _ChunkBuffer, offset: int) -> int:
+        """Write the buffered bytes at offset, return the offset of the next flush."""
+        size = buffer.pos
+        if size:
+            _pwrite(self.fd, buffer.data(), offset, self.write_lock)
+            with self.lock:
+                seg.written = offset + size
+                self.downloaded += size
+            buffer.reset()
+        return offset + size
+
+    def _fetch_with_retry(self, seg: _Segment, buffer: _ChunkBuffer):
+        for attempt in range(MAX_RETRY):
+            try:
+                self._fetch(seg, buffer)
+                return
+            except RangeNotSupported:
+                raise
+            except Exception as e:
+                if self.stopped or attempt == MAX_RETRY - 1:
+                    raise
+                logging.warning(f"Range {seg.start}-{seg.end - 1} failed ({e}), retry {attempt + 1}/{MAX_RETRY}")
+                time.sleep(min(2 ** attempt, 10))
+
+    def _fetch(self, seg: _Segment, buffer: _ChunkBuffer):
+        if seg.remaining <= 0:
+            return
+
+        range_headers = dict(self.headers)
+        range_headers['Range'] = f"bytes={seg.start}-{seg.end - 1}"
+
+        with self.client.stream("GET", self.url, headers=range_headers) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise RangeNotSupported(f"Expected 206, got {response.status_code}")
+
+            buffer.pos = 0
+            buffer.last_flush = time.monotonic()
+            buf_offset = seg.start
+            try:
+                for chunk in response.iter_bytes():
+                    if self.stopped:
+                        return
+
+                    with self.lock:
+                        room = seg.remaining
+                        if room <= 0:
+                            return
+                        data = chunk[:room] if len(chunk) > room else chunk
+                        seg.start += len(data)
+
+                    if buffer.pos + len(data) > MAX_CHUNK_SIZE:
+                        buf_offset = self._flush(seg, buffer, buf_offset)
+                    if buffer.add(data):
+                        buf_offset = self._flush(seg, buffer, buf_offset)
+
+                    # Tail was stolen by another worker, drop this connection
+                    if len(data) < len(chunk):
+                        return
+
+            finally:
+                self._flush(seg, buffer, buf_offset)
+
+        if seg.remaining > 0:
+            raise IOError(f"Connection closed with {seg.remaining} bytes left in range")
+
+
+def _create_progress():
+    """Use NullContext if in GUI mode or in a parallel episode worker to avoid live table conflicts."""
+    if not context_tracker.show_progress:
+        return nullcontext()
+
+    return Progress(
+        TextColumn("[yellow]MP4[/yellow] [cyan]Downloading[/cyan]: "),
+        CustomBarColumn(),
+        TextColumn("[bright_green]{task.fields[downloaded]}[/bright_green] [bright_magenta]{task.fields[downloaded_unit]}[/bright_magenta][dim]/[/dim][bright_cyan]{task.fields[total_size]}[/bright_cyan] [bright_magenta]{task.fields[total_unit]}[/bright_magenta]"),
+        TextColumn("[dim]\\\\[[/dim][bright_yellow]{task.fields[elapsed]}[/bright_yellow][dim] < [/dim][bright_cyan]{task.fields[eta]}[/bright_cyan][dim]][/dim]"),
+        TextColumn("[bright_magenta]@[/bright_magenta]"),
+        TextColumn("[bright_cyan]{task.fields[speed]}[/bright_cyan]"),
+        console=console,
+        refresh_per_second=10.0
+    )
+
+
+class _ProgressReporter:
+    def __init__(self, progress_bars, total: int, download_id: str, initial: int = 0):
+        """Push download stats to the console progress bar and to the GUI tracker."""
+        self.progress_bars = progress_bars
+        self.total = total
+        self.download_id = download_id
+        self.initial = initial
+        self.start_time = time.time()
+        self.next_update = 0.0
+        self.task_id = None
+
+        if context_tracker.show_progress:
+            if total:
+                total_size_value, total_size_unit = internet_manager.format_file_size(total).split(" ")
+                task_total = total
+            else:
+                total_size_value, total_size_unit = "--", ""
+                task_total = None
+
+            self.task_id = progress_bars.add_task("download", total=task_total, downloaded="0.00", downloaded_unit="B", total_size=total_size_value, total_unit=total_size_unit, elapsed="0s", eta="--", speed="-- B/s")
+
+    def update(self, downloaded: int, force: bool = False):
+        """Refresh the stats at most every PROGRESS_INTERVAL seconds, unless force is set."""
+        now = time.monotonic()
+        if not force and now < self.next_update:
+            return
+        self.next_update = now + PROGRESS_INTERVAL
+        total = self.total
+
+        # Calculate stats
+        elapsed = time.time() - self.start_time
+        elapsed_str = internet_manager.format_time(elapsed)
+
+        # Calculate speed and ETA (only if total known)
+        speed = (downloaded - self.initial) / elapsed if elapsed > 0 else 0
+        speed_str = internet_manager.format_transfer_speed(float(speed)) if speed > 0 else "-- B/s"
+
+        if total:
+            remaining_bytes = max(total - downloaded, 0)
+            eta_seconds = remaining_bytes / speed if speed > 0 else 0
+            eta_str = internet_manager.format_time(eta_seconds)
+        else:
+            eta_str = "--"
+
+        # Format downloaded size
+        if downloaded > 0:
+            downloaded_value, downloaded_unit = internet_manager.format_file_size(downloaded).split(" ")
+        else:
+            downloaded_value, downloaded_unit = "0.00", "B"
+        
+        # GUI Update
+        if self.download_id:
+            percent = (downloaded / total * 100) if total else 0
+            total_size_str = f"{(total / 1024 / 1024):.2f}MB" if total else "Unknown"
+            download_tracker.update_progress(
+                self.download_id, 
+                "video", 
+                progress=percent, 
+                speed=speed_str, 
+                size=f"{downloaded_value}{downloaded_unit}/{total_size_str if total else '??'}"
+            )
+
+        # Update progress if not GUI
+        if self.task_id is not None:
+            self.progress_bars.update(
+                self.task_id,
+                completed=downloaded,
+                downloaded=downloaded_value,
+                downloaded_unit=downloaded_unit,
+                elapsed=elapsed_str,
+                eta=eta_str,
+                speed=speed_str
+            )
+
+
+def _download_single(client, url: str, headers: dict, temp_path: str, interrupt_handler: InterruptHandler, download_id: str, validator: str = None, expected_total: int = None):
+    """Stream the whole file over one connection. Returns (total, incomplete_error)."""
+    incomplete_error = False
+    request_headers = dict(headers)
+
+    # Continue from the first missing byte of a previous run
+    remaining = load_resume_state(temp_path, validator, expected_total)
+    resume_from = remaining[0][0] if remaining else 0
+    if resume_from:
+        request_headers['Range'] = f"bytes={resume_from}-"
+        request_headers['If-Range'] = validator
+    else:
+        clear_resume_state(temp_path)
+
+    # Open the streaming response using the effective headers
+    with client.stream("GET", url, headers=request_headers) as response:
+        response.raise_for_status()
+
+        # Respect content-length when provided; otherwise treat as unknown (streaming/chunked)
+        content_length = response.headers.get('content-length')
+        try:
+            total = int(content_length) if content_length is not None else None
+        except Exception:
+            total = None
+
+        if resume_from and response.status_code == 206:
+            console.print(f"[cyan]Resuming download from [red]{internet_manager.format_file_size(resume_from)}")
+            total = expected_total
+            file_mode = 'r+b'
+        else:
+            if resume_from:
+                console.print("[yellow]Remote file changed since the last run, restarting download.")
+                clear_resume_state(temp_path)
+            resume_from = 0
+            file_mode = 'wb'
+
+        if total is None:
+            console.print("[yellow]No Content-Length received; streaming until peer closes connection.")
+
+        # Only files with a validator and a known size can be resumed later
+        resumable = bool(validator and total)
+        downloaded = resume_from
+        last_save = time.time()
+
+        with _create_progress() as progress_bars:
+            reporter = _ProgressReporter(progress_bars, total, download_id, initial=resume_from)
+
+            # Unbuffered file, writes are coalesced by the reusable chunk buffer
+            with open(temp_path, file_mode, buffering=0) as file:
+                if resume_from:
+                    file.seek(resume_from)
+                    file.truncate()
+
+                buffer = _ChunkBuffer()
+                written = resume_from
+                next_check = 0.0
+
+                try:
+                    for chunk in response.iter_bytes():
+                        if not chunk:
+                            continue
+
+                        downloaded += len(chunk)
+                        if buffer.pos + len(chunk) > MAX_CHUNK_SIZE:
+                            written += _write_all(file, buffer.data())
+                            buffer.reset()
+                        if buffer.add(chunk):
+                            written += _write_all(file, buffer.data())
+                            buffer.reset()
+
+                        # Everything below runs at the progress cadence, not once per chunk
+                        now = time.monotonic()
+                        if now < next_check and not interrupt_handler.force_quit:
+                            continue
+                        next_check = now + PROGRESS_INTERVAL
+
+                        if interrupt_handler.force_quit or (download_id and download_tracker.is_stopped(download_id)):
+                            console.print("\n[red]Force quitting... Saving partial download.")
+                            if download_id and download_tracker.is_stopped(download_id):
+                                incomplete_error = "cancelled"
+                            break
+
+                        reporter.update(downloaded)
+
+                        if resumable and time.time() - last_save >= STATE_SAVE_INTERVAL:
+                            save_resume_state(temp_path, validator, total, [[written, total]])
+                            last_save = time.time()
+
+                except (KeyboardInterrupt):
+                    if not interrupt_handler.force_quit:
+                        interrupt_handler.kill_download = True
+                        
+                except Exception as e:
+                    incomplete_error = "resume" if resumable else True
+                    interrupt_handler.kill_download = True
+                    if resumable:
+                        console.print(f"\n[red]Download error: {e}.")
+                    else:
+                        console.print(f"\n[red]Download error: {e}. Saving partial download.")
+
+                finally:
+                    try:
+                        if buffer.pos:
+                            written += _write_all(file, buffer.data())
+                            buffer.reset()
+                        os.fsync(file.fileno())
+                    except Exception:
+                        pass
+
+                    downloaded = written
+                    reporter.update(downloaded, force=True)
+
+    if resumable and incomplete_error in ("resume", "cancelled") and downloaded < total:
+        save_resume_state(temp_path, validator, total, [[downloaded, total]])
+    else:
+        clear_resume_state(temp_path)
+
+    return total, incomplete_error
+
+
+def _download_parallel(client, url: str, headers: dict, temp_path: str, total: int, interrupt_handler: InterruptHandler, download_id: str, validator: str = None, allow_resume: bool = True):
+    """Download the file with MP4_CONNECTIONS ranged requests. Returns (total, incomplete_error)."""
+    incomplete_error = False
+
+    remaining = load_resume_state(temp_path, validator, total) if allow_resume else None
+    if remaining is None:
+        clear_resume_state(temp_path)
+    else:
+        done = total - sum(end - start for start, end in remaining)
+        console.print(f"[cyan]Resuming download from [red]{internet_manager.format_file_size(done)}")
+
+    connections = context_tracker.share_budget(MP4_CONNECTIONS)
+    downloader = ParallelRangeDownloader(client, url, headers, temp_path, total, connections, validator=validator, segments=remaining)
+    initial = total - sum(end - start for start, end in remaining) if remaining is not None else 0
+    logging.info(f"MP4 ranged download with {downloader.connections} connections, size {total}, resume at {initial}")
+
+    with _create_progress() as progress_bars:
+        reporter = _ProgressReporter(progress_bars, total, download_id, initial=initial)
+        downloader.start()
+        last_save = time.time()
+
+        try:
+            while downloader.is_alive():
+                if interrupt_handler.force_quit or (download_id and download_tracker.is_stopped(download_id)):
+                    console.print("\n[red]Force quitting... Saving partial download.")
+                    if download_id and download_tracker.is_stopped(download_id):
+                        incomplete_error = "cancelled"
+                    downloader.stop()
+                    break
+
+                reporter.update(initial + downloader.downloaded)
+
+                if validator and time.time() - last_save >= STATE_SAVE_INTERVAL:
+                    save_resume_state(temp_path, validator, total, downloader.remaining_ranges())
+                    last_save = time.time()
+
+                time.sleep(0.1)
+
+        except (KeyboardInterrupt):
+            downloader.stop()
+            if not interrupt_handler.force_quit:
+                interrupt_handler.kill_download = True
+
+        finally:
+            downloader.join()
+            reporter.update(initial + downloader.downloaded, force=True)
+
+    # If-Range answered with the full body: the remote file changed, start over
+    if isinstance(downloader.error, RangeNotSupported) and remaining is not None:
+        console.print("[yellow]Remote file changed since the last run, restarting download.")
+        return _download_parallel(client, url, headers, temp_path, total, interrupt_handler, download_id, validator=validator, allow_resume=False)
+
+    # The server stopped honouring ranges mid-run: fetch the whole file over one connection
+    if isinstance(downloader.error, RangeNotSupported) and not incomplete_error:
+        console.print("[yellow]Server stopped serving byte ranges, falling back to a single connection.")
+        clear_resume_state(temp_path)
+        return _download_single(client, url, headers, temp_path, interrupt_handler, download_id, validator=validator, expected_total=total)
+
+    left = downloader.remaining_ranges()
+    if not left:
+        clear_resume_state(temp_path)
+        return total, incomplete_error
+
+    if downloader.error is not None:
+        interrupt_handler.kill_download = True
+        console.print(f"\n[red]Download error: {downloader.error}.")
+        if not incomplete_error:
+            incomplete_error = "resume" if validator else True
+
+    # Keep holes and sidecar so the next run can resume them
+    if validator and incomplete_error in ("resume", "cancelled"):
+        save_resume_state(temp_path, validator, total, left)
+        return total, incomplete_error
+
+    # Keep only the part without holes, like a single stream download would
+    clear_resume_state(temp_path)
+    if not incomplete_error:
+        incomplete_error = True
+    try:
+        os.truncate(temp_path, downloader.contiguous_size())
+    except Exception as e:
+        logging.error(f"Could not truncate partial download: {e}")
+
+    return total, incomplete_error
+
+
 def MP4_Downloader(url: str, path: str, referer: str = None, headers_: dict = None, show_final_info: bool = True, download_id: str = None, site_name: str = None):
     """
     Downloads an MP4 video with enhanced interrupt handling.
     - Single Ctrl+C: Completes download gracefully
     - Triple Ctrl+C: Saves partial download and exits
+    - Network errors and GUI cancel keep <path>.temp with a resume sidecar for the next run
     """
     url = str(url).strip()
     path = os_manager.get_sanitize_path(path)
@@ -124,12 +776,19 @@ def MP4_Downloader(url: str, path: str, referer: str = None, headers_: dict = No
 
     # Ensure the output directory exists
     os.makedirs(os.path.dirname(path), exist_ok=True)
+    context_tracker.notify_download_start()
 
     with create_client() as client:
+        accept_ranges = ''
+        head_total = None
+        validator = None
         try:
             head = client.head(url, headers=headers)
             head.raise_for_status()
             content_type = (head.headers.get('content-type') or '').lower()
+            accept_ranges = (head.headers.get('accept-ranges') or '').lower()
+            head_total = int(head.headers.get('content-length') or 0) or None
+            validator = get_validator(head.headers)
         except Exception:
             content_type = ''
 
@@ -157,128 +816,34 @@ def MP4_Downloader(url: str, path: str, referer: str = None, headers_: dict = No
                 console.print(f"[red]Fallback GET failed: {e}")
                 return None, False
 
-        # Open the streaming response using the effective headers
-        with client.stream("GET", url, headers=headers) as response:
-            response.raise_for_status()
-
-            # Respect content-length when provided; otherwise treat as unknown (streaming/chunked)
-            content_length = response.headers.get('content-length')
-            try:
-                total = int(content_length) if content_length is not None else None
-            except Exception:
-                total = None
-
-            if total is None:
-                console.print("[yellow]No Content-Length received; streaming until peer closes connection.")
- 
-            start_time = time.time()
-            downloaded = 0
-            incomplete_error = False
-
-            # Use NullContext if in GUI mode to avoid live table conflicts for GUI
-            from contextlib import nullcontext
-            progress_ctx = nullcontext() if context_tracker.is_gui else Progress(
-                TextColumn("[yellow]MP4[/yellow] [cyan]Downloading[/cyan]: "),
-                CustomBarColumn(),
-                TextColumn("[bright_green]{task.fields[downloaded]}[/bright_green] [bright_magenta]{task.fields[downloaded_unit]}[/bright_magenta][dim]/[/dim][bright_cyan]{task.fields[total_size]}[/bright_cyan] [bright_magenta]{task.fields[total_unit]}[/bright_magenta]"),
-                TextColumn("[dim]\\\\[[/dim][bright_yellow]{task.fields[elapsed]}[/bright_yellow][dim] < [/dim][bright_cyan]{task.fields[eta]}[/bright_cyan][dim]][/dim]"),
-                TextColumn("[bright_magenta]@[/bright_magenta]"),
-                TextColumn("[bright_cyan]{task.fields[speed]}[/bright_cyan]"),
-                console=console,
-                refresh_per_second=10.0
-            )
-
-            with progress_ctx as progress_bars:
-                if not context_tracker.is_gui:
-                    if total:
-                        total_size_value, total_size_unit = internet_manager.format_file_size(total).split(" ")
-                        task_total = total
-                    else:
-                        total_size_value, total_size_unit = "--", ""
-                        task_total = None
+        # Resume needs byte ranges and a validator to send in If-Range
+        if 'bytes' not in accept_ranges:
+            validator = None
 
-                    task_id = progress_bars.add_task("download", total=task_total, downloaded="0.00", downloaded_unit="B", total_size=total_size_value, total_unit=total_size_unit, elapsed="0s", eta="--", speed="-- B/s")
+        use_ranges = (
+            context_tracker.share_budget(MP4_CONNECTIONS) > 1
+            and head_total is not None and head_total >= MIN_PARALLEL_SIZE
+            and 'bytes' in accept_ranges
+            and probe_range_support(client, url, headers)
+        )
 
-                with open(temp_path, 'wb') as file:
-                    try:
-                        for chunk in response.iter_bytes(chunk_size=65536):
-                            if interrupt_handler.force_quit or (download_id and download_tracker.is_stopped(download_id)):
-                                console.print("\n[red]Force quitting... Saving partial download.")
-                                if download_id and download_tracker.is_stopped(download_id):
-                                    incomplete_error = "cancelled"
-                                break
-
-                            if chunk:
-                                size = file.write(chunk)
-                                downloaded += size
-
-                                # Calculate stats
-                                elapsed = time.time() - start_time
-                                elapsed_str = internet_manager.format_time(elapsed)
-
-                                # Calculate speed and ETA (only if total known)
-                                if elapsed > 0:
-                                    speed = downloaded / elapsed
-                                    speed_str = internet_manager.format_transfer_speed(speed)
-                                else:
-                                    speed_str = "-- B/s"
-
-                                if total:
-                                    remaining_bytes = max(total - downloaded, 0)
-                                    eta_seconds = remaining_bytes / speed if (elapsed > 0 and speed > 0) else 0
-                                    eta_str = internet_manager.format_time(eta_seconds)
-                                else:
-                                    eta_str = "--"
-
-                                # Format downloaded size
-                                downloaded_value, downloaded_unit = internet_manager.format_file_size(downloaded).split(" ")
-                                
-                                # GUI Update
-                                if download_id:
-                                    percent = (downloaded / total * 100) if total else 0
-                                    total_size_str = f"{(total / 1024 / 1024):.2f}MB" if total else "Unknown"
-                                    download_tracker.update_progress(
-                                        download_id, 
-                                        "video", 
-                                        progress=percent, 
-                                        speed=speed_str, 
-                                        size=f"{downloaded_value}{downloaded_unit}/{total_size_str if total else '??'}"
-                                    )
-
-                                # Update progress if not GUI
-                                if not context_tracker.is_gui:
-                                    progress_bars.update(
-                                        task_id,
-                                        completed=downloaded,
-                                        downloaded=downloaded_value,
-                                        downloaded_unit=downloaded_unit,
-                                        elapsed=elapsed_str,
-                                        eta=eta_str,
-                                        speed=speed_str
-                                    )
-
-                    except (KeyboardInterrupt):
-                        if not interrupt_handler.force_quit:
-                            interrupt_handler.kill_download = True
-                            
-                    except Exception as e:
-                        incomplete_error = True
-                        interrupt_handler.kill_download = True
-                        console.print(f"\n[red]Download error: {e}. Saving partial download.")
+        if use_ranges:
+            total, incomplete_error = _download_parallel(client, url, headers, temp_path, head_total, interrupt_handler, download_id, validator=validator)
+        else:
+            total, incomplete_error = _download_single(client, url, headers, temp_path, interrupt_handler, download_id, validator=validator, expected_total=head_total)
 
-                    finally:
-                        try:
-                            file.flush()
-                            os.fsync(file.fileno())
-                        except Exception:
-                            pass
-                
     if os.path.exists(temp_path):
         if incomplete_error == "cancelled":
             if download_id:
                 download_tracker.complete_download(download_id, success=False, error="cancelled")
             return None, True
 
+        if incomplete_error == "resume":
+            console.print(f"[yellow]Partial download kept in [red]{temp_path}[yellow], run again to resume it.")
+            if download_id:
+                download_tracker.complete_download(download_id, success=False, error="Download interrupted, partial file kept for resume")
+            return None, interrupt_handler.kill_download
+
         last_exc = None
         for attempt in range(10):
             try:
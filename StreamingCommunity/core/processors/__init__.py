@@ -1,9 +1,10 @@
 # 16.04.24
 
-from .merge import join_video, join_audios, join_subtitles
+from .merge import join_video, join_audios, join_subtitles, mux_tracks
 
 __all__ = [
     "join_video",
     "join_audios",
-    "join_subtitles"
+    "join_subtitles",
+    "mux_tracks"
 ]
\ No newline at end of file
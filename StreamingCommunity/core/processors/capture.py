@@ -1,12 +1,12 @@
 # 16.04.24
 
-import re
 import os
 import time
 import logging
 import threading
 import subprocess
-from typing import Optional
+from collections import deque
+from typing import Dict, List, Optional
 
 
 # External library
@@ -15,213 +15,237 @@ from rich.console import Console
 
 # Internal utilities
 from StreamingCommunity.utils.os import internet_manager
+from StreamingCommunity.source.utils.tracker import download_tracker, context_tracker
 
 
 # Variable
 console = Console()
-terminate_flag = threading.Event()
+STDERR_TAIL_LINES = 20
 
 
-class ProgressData:
-    """Class to store the last progress data"""
-    def __init__(self):
-        self.last_data = None
-        self.lock = threading.Lock()
-    
-    def update(self, data):
-        with self.lock:
-            self.last_data = data
-    
-    def get(self):
-        with self.lock:
-            return self.last_data
-
-
-def capture_output(process: subprocess.Popen, description: str, progress_data: ProgressData, log_path: Optional[str] = None) -> None:
+def parse_progress_block(block: Dict[str, str]) -> dict:
     """
-    Function to capture and print output from a subprocess.
+    Convert one `-progress` key/value block into typed values.
 
     Parameters:
-        - process (subprocess.Popen): The subprocess whose output is captured.
-        - description (str): Description of the command being executed.
-        - progress_data (ProgressData): Object to store the last progress data.
-        - log_path (Optional[str]): Path to log file to write output.
+        - block (Dict[str, str]): Raw keys of the block (out_time_us, total_size, speed, ...).
+
+    Returns:
+        dict: out_time_us, total_size, speed (float or None) and the human fields fps, time, bitrate.
     """
-    log_file = None
-    if log_path:
+    def to_int(value):
         try:
-            os.makedirs(os.path.dirname(log_path), exist_ok=True)
-            log_file = open(log_path, 'w', encoding='utf-8')
-        except Exception as e:
-            logging.error(f"Error opening log file {log_path}: {e}")
-    
-    try:
-        max_length = 0
-        start_time = time.time()
+            return int(value)
+        except (TypeError, ValueError):
+            return None
 
-        with log_file or open(os.devnull, 'w') as log_f:
-            for line in iter(process.stdout.readline, ''):          
-                try:
-                    line = line.strip()
-
-                    if not line:
-                        continue
-
-                    # Write to log file
-                    log_f.write(line + '\n')
-                    log_f.flush()
-
-                    # Check if termination is requested
-                    if terminate_flag.is_set():
-                        break
-
-                    if "size=" in line:
-                        try:
-                            elapsed_time = time.time() - start_time
-                            data = parse_output_line(line)
-
-                            if 'q' in data:
-                                is_end = (float(data.get('q', -1.0)) == -1.0)
-                                size_key = 'Lsize' if is_end else 'size'
-                                byte_size = int(re.findall(r'\d+', data.get(size_key, '0'))[0]) * 1000
-                            else:
-                                byte_size = int(re.findall(r'\d+', data.get('size', '0'))[0]) * 1000
-
-                            # Extract additional information
-                            fps = data.get('fps', 'N/A')
-                            time_processed = data.get('time', 'N/A')
-                            bitrate = data.get('bitrate', 'N/A')
-                            speed = data.get('speed', 'N/A')
-
-                            # Format elapsed time as HH:MM:SS
-                            elapsed_formatted = internet_manager.format_time(elapsed_time, add_hours=True)
-
-                            # Store progress data as JSON
-                            json_data = {'fps': fps,'speed': speed, 'time': time_processed,'bitrate': bitrate}
-                            progress_data.update(json_data)
-
-                            # Construct the progress string with formatted output information
-                            progress_string = (
-                                f"{description}[white]: "
-                                f"([green]'fps': [yellow]{fps}[white], "
-                                f"[green]'speed': [yellow]{speed}[white], "
-                                f"[green]'size': [yellow]{internet_manager.format_file_size(byte_size)}[white], "
-                                f"[green]'time': [yellow]{time_processed}[white], "
-                                f"[green]'bitrate': [yellow]{bitrate}[white], "
-                                f"[green]'elapsed': [yellow]{elapsed_formatted}[white])"
-                            )
-                            max_length = max(max_length, len(progress_string))
-
-                            # Print the progress string to the console, overwriting the previous line
-                            console.print(progress_string.ljust(max_length), end="\r")
-
-                        except Exception as e:
-                            logging.error(f"Error parsing output line: {line} - {e}")
-
-                except Exception as e:
-                    logging.error(f"Error processing line from subprocess: {e}")
-
-    except Exception as e:
-        logging.error(f"Error in capture_output: {e}")
-
-    finally:
+    # Older FFmpeg builds only report out_time_ms, which is also in microseconds
+    out_time_us = to_int(block.get('out_time_us', block.get('out_time_ms')))
+    speed_raw = (block.get('speed') or '').strip().rstrip('x')
+    try:
+        speed = float(speed_raw)
+    except ValueError:
+        speed = None
+
+    time_processed = block.get('out_time', 'N/A')
+    if '.' in time_processed:
+        time_processed = time_processed.split('.')[0]
+
+    return {
+        'out_time_us': out_time_us,
+        'total_size': to_int(block.get('total_size')),
+        'speed': speed,
+        'fps': block.get('fps', 'N/A'),
+        'time': time_processed,
+        'bitrate': block.get('bitrate', 'N/A'),
+        'finished': block.get('progress') == 'end',
+    }
+
+
+class FFmpegRunner:
+    def __init__(self, description: str, log_path: Optional[str] = None, download_id: Optional[str] = None, duration: Optional[float] = None, task_key: str = "ffmpeg"):
+        """
+        Run one FFmpeg command and follow its `-progress pipe:1` output.
+
+        All state belongs to the instance, so any number of runners can work in parallel.
+        Progress is printed to the console and reported to the download tracker; a stop
+        requested for the download terminates this process only.
+
+        Parameters:
+            - description (str): Label shown before the progress line.
+            - log_path (Optional[str]): File receiving the FFmpeg stderr.
+            - download_id (Optional[str]): Tracked download, defaults to the one of the current context.
+            - duration (Optional[float]): Expected output duration in seconds, used for the percentage.
+            - task_key (str): Key of the tracker task updated with the progress.
+        """
+        self.description = description
+        self.log_path = log_path
+        self.download_id = download_id if download_id is not None else context_tracker.download_id
+        self.duration = duration
+        self.task_key = task_key
+        self.process: Optional[subprocess.Popen] = None
+        self.last_progress: Optional[dict] = None
+        self.stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        self._cancel_event = threading.Event()
+        self._max_length = 0
+
+    @property
+    def cancelled(self) -> bool:
+        if self._cancel_event.is_set():
+            return True
+        return bool(self.download_id) and download_tracker.is_stopped(self.download_id)
+
+    def cancel(self):
+        """Stop this FFmpeg process, other runners are not affected."""
+        self._cancel_event.set()
+        self._kill()
+
+    # Called by download_tracker.request_stop
+    terminate = cancel
+
+    def _kill(self):
         try:
-            terminate_process(process)
+            if self.process is not None and self.process.poll() is None:
+                self.process.kill()
         except Exception as e:
-            logging.error(f"Error terminating process: {e}")
+            logging.error(f"Failed to terminate process: {e}")
+
+    @staticmethod
+    def _with_progress_args(ffmpeg_command: List[str]) -> List[str]:
+        return [ffmpeg_command[0], '-progress', 'pipe:1', '-nostats'] + list(ffmpeg_command[1:])
+
+    def _drain_stderr(self):
+        """Keep the tail of stderr for error messages and copy it to the log file."""
+        log_file = None
+        if self.log_path:
+            try:
+                os.makedirs(os.path.dirname(self.log_path) or '.', exist_ok=True)
+                log_file = open(self.log_path, 'w', encoding='utf-8')
+            except Exception as e:
+                logging.error(f"Error opening log file {self.log_path}: {e}")
 
+        try:
+            for line in iter(self.process.stderr.readline, ''):
+                line = line.rstrip()
+                if not line:
+                    continue
+                self.stderr_tail.append(line)
+                if log_file:
+                    log_file.write(line + '\n')
+        except Exception as e:
+            logging.error(f"Error reading FFmpeg stderr: {e}")
+        finally:
+            if log_file:
+                log_file.close()
+
+    def _report(self, progress: dict, start_time: float):
+        self.last_progress = progress
+
+        percent = None
+        if self.duration and progress['out_time_us'] is not None:
+            percent = min(100.0, progress['out_time_us'] / 1_000_000 / self.duration * 100)
+        if progress['finished']:
+            percent = 100.0
+
+        size_str = internet_manager.format_file_size(progress['total_size'] or 0)
+        speed_str = f"{progress['speed']}x" if progress['speed'] is not None else 'N/A'
+
+        if self.download_id:
+            download_tracker.update_ffmpeg_progress(self.download_id, self.task_key, out_time_us=progress['out_time_us'], speed=progress['speed'], total_size=progress['total_size'], progress=percent)
+
+        if not context_tracker.show_progress:
+            return
+
+        elapsed_formatted = internet_manager.format_time(time.time() - start_time, add_hours=True)
+        progress_string = (
+            f"{self.description}[white]: "
+            f"([green]'fps': [yellow]{progress['fps']}[white], "
+            f"[green]'speed': [yellow]{speed_str}[white], "
+            f"[green]'size': [yellow]{size_str}[white], "
+            f"[green]'time': [yellow]{progress['time']}[white], "
+            f"[green]'bitrate': [yellow]{progress['bitrate']}[white], "
+            f"[green]'elapsed': [yellow]{elapsed_formatted}[white])"
+        )
+        self._max_length = max(self._max_length, len(progress_string))
+        console.print(progress_string.ljust(self._max_length), end="\r")
+
+    def run(self, ffmpeg_command: List[str]) -> Optional[dict]:
+        """
+        Execute the command and block until FFmpeg exits or the download is stopped.
+
+        Returns:
+            dict: The last progress data (fps, speed, time, bitrate, out_time_us, total_size) and the
+            FFmpeg returncode (-1 when it did not start or was cancelled).
+        """
+        if self.cancelled:
+            return {'returncode': -1}
 
-def parse_output_line(line: str) -> dict:
-    """
-    Function to parse the output line and extract relevant information.
-
-    Parameters:
-        - line (str): The output line to parse.
+        try:
+            self.process = subprocess.Popen(self._with_progress_args(ffmpeg_command), stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, encoding='utf-8', errors='replace')
+        except Exception as e:
+            logging.error(f"Failed to start ffmpeg process: {e}")
+            return {'returncode': -1}
 
-    Returns:
-        dict: A dictionary containing parsed information.
-    """
-    try:
-        data = {}
-        parts = line.replace("  ", "").replace("= ", "=").split()
+        if self.download_id:
+            download_tracker.register_process(self.download_id, self)
 
-        for part in parts:
-            key_value = part.split('=')
+        stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        stderr_thread.start()
 
-            if len(key_value) == 2:
-                key = key_value[0]
-                value = key_value[1]
+        start_time = time.time()
+        block: Dict[str, str] = {}
+        try:
+            for line in iter(self.process.stdout.readline, ''):
+                if self.cancelled:
+                    self._kill()
+                    break
+
+                key, sep, value = line.strip().partition('=')
+                if not sep:
+                    continue
+                block[key] = value
+
+                # Every block ends with progress=continue|end
+                if key == 'progress':
+                    try:
+                        self._report(parse_progress_block(block), start_time)
+                    except Exception as e:
+                        logging.error(f"Error parsing FFmpeg progress: {block} - {e}")
+                    block = {}
+
+            self.process.wait()
 
-                # Remove milliseconds from time value
-                if key == 'time' and isinstance(value, str) and '.' in value:
-                    value = value.split('.')[0]
-                data[key] = value
+        except KeyboardInterrupt:
+            logging.error("Terminating ffmpeg process...")
+            self._kill()
 
-        return data
-    
-    except Exception as e:
-        logging.error(f"Error parsing line: {line} - {e}")
-        return {}
+        except Exception as e:
+            logging.error(f"Error in ffmpeg process: {e}")
+            self._kill()
 
+        finally:
+            self._kill()
+            stderr_thread.join(timeout=5)
 
-def terminate_process(process):
-    """
-    Function to terminate a subprocess if it's still running.
+        if self.process.returncode not in (0, None) and not self.cancelled:
+            logging.error(f"FFmpeg exited with code {self.process.returncode}: {' | '.join(self.stderr_tail)}")
 
-    Parameters:
-        - process (subprocess.Popen): The subprocess to terminate.
-    """
-    try:
-        if process.poll() is None:
-            process.kill()
-    except Exception as e:
-        logging.error(f"Failed to terminate process: {e}")
+        result = {k: v for k, v in (self.last_progress or {}).items() if k != 'finished'}
+        result['returncode'] = -1 if self.cancelled else self.process.returncode
+        return result
 
 
-def capture_ffmpeg_real_time(ffmpeg_command: list, description: str, log_path: Optional[str] = None) -> dict:
+def capture_ffmpeg_real_time(ffmpeg_command: list, description: str, log_path: Optional[str] = None, duration: Optional[float] = None) -> dict:
     """
-    Function to capture real-time output from ffmpeg process.
+    Run an ffmpeg command with a fresh FFmpegRunner bound to the current download.
 
     Parameters:
         - ffmpeg_command (list): The command to execute ffmpeg.
         - description (str): Description of the command being executed.
+        - log_path (Optional[str]): Path to log file to write output.
+        - duration (Optional[float]): Expected duration in seconds, for the progress percentage.
 
     Returns:
-        dict: JSON dictionary with the last progress data containing
+        dict: JSON dictionary with the last progress data and the returncode
     """
-    global terminate_flag
-
-    # Clear the terminate_flag before starting a new capture
-    terminate_flag.clear()
-
-    # Create progress data storage
-    progress_data = ProgressData()
-
-    try:
-
-        # Start the ffmpeg process with subprocess.Popen
-        process = subprocess.Popen(ffmpeg_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
-
-        # Start a thread to capture and print output
-        output_thread = threading.Thread(target=capture_output, args=(process, description, progress_data, log_path))
-        output_thread.start()
-
-        try:
-            # Wait for ffmpeg process to complete
-            process.wait()
-
-        except KeyboardInterrupt:
-            logging.error("Terminating ffmpeg process...")
-
-        except Exception as e:
-            logging.error(f"Error in ffmpeg process: {e}")
-            
-        finally:
-            terminate_flag.set()
-            output_thread.join()
-
-    except Exception as e:
-        logging.error(f"Failed to start ffmpeg process: {e}")
-
-    # Return the last captured progress data
-    return progress_data.get()
\ No newline at end of file
+    return FFmpegRunner(description, log_path=log_path, duration=duration).run(ffmpeg_command)
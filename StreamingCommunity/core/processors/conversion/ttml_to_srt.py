@@ -2,12 +2,15 @@
 
 import os
 import re
+import struct
+import logging
 import xml.etree.ElementTree as et
-from typing import Optional, List
+from collections import deque
+from typing import Iterator, Optional, List, Tuple
 from pathlib import Path
 
 
-# External import 
+# External import
 from rich.console import Console
 from ttconv.imsc.reader import to_model
 from ttconv.srt.writer import from_model
@@ -15,6 +18,155 @@ from ttconv.srt.writer import from_model
 
 # Variable
 console = Console()
+BOUNDARY_TOLERANCE_MS = 40
+RECENT_CUES = 16
+
+_ISOBMFF_TOP_BOXES = {b'ftyp', b'styp', b'moov', b'moof', b'sidx', b'mdat', b'free', b'skip', b'emsg', b'prft'}
+_TTML_BLOCK_RE = re.compile(br'<\?xml.*?</tt>', re.DOTALL)
+_SRT_TIME_RE = re.compile(r'(\d+):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*(\d+):(\d{2}):(\d{2})[,.](\d{3})')
+
+Cue = Tuple[int, int, str]
+
+
+def _split_ttml(payload: bytes) -> List[bytes]:
+    """Return the TTML documents of a payload, with or without XML declaration."""
+    blocks = _TTML_BLOCK_RE.findall(payload)
+    if blocks:
+        return blocks
+
+    start = payload.find(b'<tt')
+    end = payload.rfind(b'</tt>')
+    if start != -1 and end > start:
+        return [payload[start:end + 5]]
+    return []
+
+
+def _iter_mdat_payloads(f) -> Iterator[bytes]:
+    """Walk the top-level boxes of an ISO-BMFF file and yield each mdat payload, skipping the rest by size."""
+    f.seek(0, os.SEEK_END)
+    file_size = f.tell()
+    pos = 0
+
+    while pos + 8 <= file_size:
+        f.seek(pos)
+        size, box_type = struct.unpack('>I4s', f.read(8))
+        header = 8
+
+        if size == 1:
+            size = struct.unpack('>Q', f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = file_size - pos
+
+        if size < header:
+            logging.warning(f"Invalid box {box_type!r} at offset {pos}, stopping TTML scan")
+            return
+
+        if box_type == b'mdat':
+            yield f.read(min(size, file_size - pos) - header)
+
+        pos += size
+
+
+def iter_ttml_documents(ttml_path: str) -> Iterator[bytes]:
+    """
+    Yield the TTML documents of a file one at a time.
+
+    For fMP4 (.m4s) subtitle tracks only one mdat is in memory at a time; plain TTML files are
+    read whole since they hold a single document.
+    """
+    with open(ttml_path, 'rb') as f:
+        head = f.read(8)
+
+        if len(head) == 8 and head[4:8] in _ISOBMFF_TOP_BOXES:
+            for payload in _iter_mdat_payloads(f):
+                yield from _split_ttml(payload)
+            return
+
+        f.seek(0)
+        yield from _split_ttml(f.read())
+
+
+def _parse_srt_time(groups) -> Tuple[int, int]:
+    h1, m1, s1, ms1, h2, m2, s2, ms2 = (int(g) for g in groups)
+    return (((h1 * 60 + m1) * 60 + s1) * 1000 + ms1, ((h2 * 60 + m2) * 60 + s2) * 1000 + ms2)
+
+
+def ttml_block_to_cues(block: bytes) -> Optional[List[Cue]]:
+    """
+    Convert one TTML document to (start_ms, end_ms, text) cues with ttconv.
+
+    Called once per block as the file is read. Returns None if the document is invalid.
+    """
+    try:
+        root = et.fromstring(block.decode('utf-8'))
+        model = to_model(et.ElementTree(root))
+        if model is None:
+            return None
+
+        cues = []
+        for entry in re.split(r'\n\s*\n', from_model(model).strip()):
+            lines = entry.strip().splitlines()
+            for i, line in enumerate(lines):
+                match = _SRT_TIME_RE.search(line)
+                if match:
+                    text = "\n".join(lines[i + 1:]).strip()
+                    if text:
+                        start_ms, end_ms = _parse_srt_time(match.groups())
+                        cues.append((start_ms, end_ms, text))
+                    break
+        return cues
+
+    except Exception:
+        return None
+
+
+def _format_srt_time(ms: int) -> str:
+    hours, ms = divmod(max(0, ms), 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    seconds, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{ms:03d}"
+
+
+class SrtStreamWriter:
+    def __init__(self, f):
+        """
+        Write cues as one SRT stream with continuous numbering.
+
+        Fragments often repeat the cue that crosses their boundary: a cue with the same text
+        that starts where the previous one ends is merged into it, exact repeats are dropped.
+        """
+        self.f = f
+        self.index = 0
+        self.pending: Optional[List] = None
+        self.recent = deque(maxlen=RECENT_CUES)
+
+    def add(self, cue: Cue):
+        start_ms, end_ms, text = cue
+        if cue in self.recent:
+            return
+        self.recent.append(cue)
+
+        if self.pending and self.pending[2] == text and self.pending[0] <= start_ms <= self.pending[1] + BOUNDARY_TOLERANCE_MS:
+            self.pending[1] = max(self.pending[1], end_ms)
+            return
+
+        self._flush()
+        self.pending = [start_ms, end_ms, text]
+
+    def _flush(self):
+        if self.pending is None:
+            return
+
+        self.index += 1
+        start_ms, end_ms, text = self.pending
+        self.f.write(f"{self.index}\n{_format_srt_time(start_ms)} --> {_format_srt_time(end_ms)}\n{text}\n\n")
+        self.pending = None
+
+    def close(self) -> int:
+        """Write the last cue and return the number of cues written."""
+        self._flush()
+        return self.index
 
 
 def convert_ttml_to_srt(ttml_path: str, srt_path: Optional[str] = None) -> bool:
@@ -37,74 +189,41 @@ def convert_ttml_to_srt(ttml_path: str, srt_path: Optional[str] = None) -> bool:
     if srt_path is None:
         srt_path = str(Path(ttml_path).with_suffix('.srt'))
 
+    tmp_path = f"{srt_path}.part"
     try:
-        with open(ttml_path, 'rb') as f:
-            data = f.read()
-
-        # Extract all TTML blocks (works for both plain TTML files and .m4s fragments)
-        ttml_blocks = re.findall(br'<\?xml.*?</tt>', data, re.DOTALL)
-
-        if not ttml_blocks:
-            # Try to see if it's a plain TTML without the XML declaration or just one block
-            try:
-                text_content = data.decode('utf-8')
-                if '<tt' in text_content and '</tt>' in text_content:
-                    match = re.search(r'<tt.*?</tt>', text_content, re.DOTALL)
-                    if match:
-                        ttml_blocks = [match.group(0).encode('utf-8')]
-            except Exception:
-                pass
-
-        if not ttml_blocks:
-            console.print(f"[red]No valid TTML blocks found in {ttml_path}")
-            return False
-
-        all_captions: List[str] = []
         processed_blocks = 0
         skipped_blocks = 0
 
-        for block in ttml_blocks:
-            try:
-
-                # Decode the TTML block
-                ttml_str = block.decode('utf-8')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            writer = SrtStreamWriter(f)
 
-                # Parse the TTML string into an ElementTree
-                root = et.fromstring(ttml_str)
-                tree = et.ElementTree(root)
-
-                # Convert TTML to internal model
-                model = to_model(tree)
-
-                if model is not None:
-                    srt_content = from_model(model)
-                    if srt_content.strip():
-                        all_captions.append(srt_content.strip())
-                    processed_blocks += 1
-                else:
+            # Blocks are converted one at a time as they are read, only one is in memory
+            for block in iter_ttml_documents(ttml_path):
+                cues = ttml_block_to_cues(block)
+                if cues is None:
                     skipped_blocks += 1
+                    continue
 
-            except Exception:
-                skipped_blocks += 1
-                continue
+                processed_blocks += 1
+                for cue in cues:
+                    writer.add(cue)
 
-        if not all_captions:
+            written = writer.close()
+
+        if processed_blocks == 0 or written == 0:
+            os.remove(tmp_path)
             console.print(f"[red]No valid TTML blocks processed from {ttml_path}")
             return False
 
-        # Combine all SRT subtitles
-        # Note: If multiple blocks are present, they might have overlapping or duplicate indices.
-        # Joining them as a single string is simple, but we might want to ensure sequence continuity.
-        # For now, we follow the requested logic.
-        srt_output = "\n\n".join(all_captions)
-
-        # Save the SRT file
-        with open(srt_path, 'w', encoding='utf-8') as f:
-            f.write(srt_output)
+        if skipped_blocks:
+            logging.warning(f"Skipped {skipped_blocks} invalid TTML blocks in {ttml_path}")
 
+        os.replace(tmp_path, srt_path)
         return True
 
     except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         console.print(f"[red]Error during TTML to SRT conversion: {e}")
         return False
 
@@ -118,4 +237,4 @@ def extract_srt_from_m4s(m4s_file_path: str, output_srt_path: Optional[str] = No
         with open(output_srt_path, 'r', encoding='utf-8') as f:
             return f.read()
     else:
-        raise ValueError("Failed to extract SRT from m4s")
\ No newline at end of file
+        raise ValueError("Failed to extract SRT from m4s")
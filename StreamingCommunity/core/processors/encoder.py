@@ -0,0 +1,295 @@
+# 19.10.26
+
+import os
+import sys
+import queue
+import logging
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+
+# External library
+from rich.console import Console
+
+
+# Internal utilities
+from StreamingCommunity.utils import config_manager
+from StreamingCommunity.setup import get_ffmpeg_path, get_ffprobe_path
+
+
+# Logic
+from .capture import capture_ffmpeg_real_time
+from .helper.probe import media_probe
+
+
+# Config
+PARAM_VIDEO = config_manager.config.get_list("PROCESS", "param_video")
+PARAM_AUDIO = config_manager.config.get_list("PROCESS", "param_audio")
+PARAM_FINAL = config_manager.config.get_list("PROCESS", "param_final")
+CHUNKED_ENCODE_WORKERS = config_manager.config.get_int('PROCESS', 'chunked_encode_workers', default=0)
+DEFER_ENCODE = config_manager.config.get_bool('PROCESS', 'defer_encode', default=False)
+MIN_CHUNK_SECONDS = 60
+
+
+# Variable
+console = Console()
+
+
+def is_reencode() -> bool:
+    """True when the configuration re-encodes video (param_final empty and param_video not a copy)."""
+    if PARAM_FINAL or not PARAM_VIDEO:
+        return False
+
+    for i, arg in enumerate(PARAM_VIDEO[:-1]):
+        if arg in ('-c:v', '-vcodec', '-codec:v'):
+            return PARAM_VIDEO[i + 1] != 'copy'
+    return True
+
+
+def copy_then_encode() -> bool:
+    """True when muxing should stream copy and leave the re-encode to encode_after_mux."""
+    return is_reencode() and (DEFER_ENCODE or CHUNKED_ENCODE_WORKERS > 1)
+
+
+def _run_ffmpeg(cmd: List[str], low_priority: bool = False) -> subprocess.CompletedProcess:
+    """
+    Run an FFmpeg command quietly, below normal priority when asked.
+
+    The priority is lowered from the parent after Popen: preexec_fn is not safe once threads are running.
+    """
+    kwargs = {'creationflags': subprocess.BELOW_NORMAL_PRIORITY_CLASS} if low_priority and sys.platform == 'win32' else {}
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, **kwargs) as proc:
+        if low_priority and hasattr(os, 'setpriority'):
+            try:
+                os.setpriority(os.PRIO_PROCESS, proc.pid, 10)
+            except OSError as e:
+                logging.debug(f"Could not lower FFmpeg priority: {e}")
+        _, stderr = proc.communicate()
+
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, stderr)
+
+
+def _temp_output(path: str, tag: str) -> str:
+    base, ext = os.path.splitext(path)
+    return f"{base}.{tag}{ext}"
+
+
+def get_keyframe_times(video_path: str) -> List[float]:
+    """Return the pts of every video keyframe, read from packet flags without decoding."""
+    cmd = [get_ffprobe_path(), '-v', 'error', '-select_streams', 'v:0', '-show_entries', 'packet=pts_time,flags', '-of', 'csv=p=0', video_path]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    except Exception as e:
+        logging.error(f"Keyframe probe failed for {video_path}: {e}")
+        return []
+
+    keyframes = []
+    for line in result.stdout.splitlines():
+        parts = line.strip().split(',')
+        if len(parts) >= 2 and 'K' in parts[1]:
+            try:
+                keyframes.append(float(parts[0]))
+            except ValueError:
+                continue
+
+    return sorted(keyframes)
+
+
+def plan_chunks(keyframes: List[float], duration: float, count: int) -> List[float]:
+    """
+    Pick up to count - 1 split points, each on the first keyframe after an even share of the duration.
+
+    Returns:
+        list: Boundaries starting with 0.0, the last chunk runs to the end of the file.
+    """
+    boundaries = [0.0]
+    for i in range(1, count):
+        target = duration * i / count
+        split = next((k for k in keyframes if k >= target), None)
+        if split is None or split - boundaries[-1] < MIN_CHUNK_SECONDS or duration - split < MIN_CHUNK_SECONDS:
+            continue
+        boundaries.append(split)
+
+    return boundaries
+
+
+def _encode_chunk(video_path: str, start: float, end: Optional[float], chunk_path: str, low_priority: bool) -> bool:
+    cmd = [get_ffmpeg_path(), '-y', '-v', 'error', '-ss', f"{start:.6f}", '-i', video_path]
+    if end is not None:
+        cmd.extend(['-t', f"{end - start:.6f}"])
+    cmd.extend(['-map', '0:v:0', '-an', '-sn', '-dn'])
+    cmd.extend(PARAM_VIDEO)
+    cmd.append(chunk_path)
+
+    result = _run_ffmpeg(cmd, low_priority)
+    if result.returncode != 0:
+        logging.error(f"Chunk encode failed ({start:.2f}s): {result.stderr.strip()}")
+        return False
+    return os.path.exists(chunk_path) and os.path.getsize(chunk_path) > 0
+
+
+def encode_chunked(video_path: str, out_path: str, workers: int, low_priority: bool = False) -> bool:
+    """
+    Re-encode the video of video_path in parallel chunks split at keyframes, then join them
+    with the concat demuxer and copy the other streams from the source.
+
+    Each chunk is its own FFmpeg process, so a thread pool is enough to keep every core busy.
+
+    Returns:
+        bool: False if the file is too short to split or any step failed.
+    """
+    duration = media_probe.duration(video_path)
+    if not duration or duration < MIN_CHUNK_SECONDS * 2:
+        return False
+
+    boundaries = plan_chunks(get_keyframe_times(video_path), duration, workers)
+    if len(boundaries) < 2:
+        return False
+
+    chunk_dir = f"{os.path.splitext(out_path)[0]}_chunks"
+    os.makedirs(chunk_dir, exist_ok=True)
+    ends = boundaries[1:] + [None]
+    chunk_paths = [os.path.join(chunk_dir, f"chunk_{i:03d}.mkv") for i in range(len(boundaries))]
+
+    try:
+        console.print(f"[yellow]FFMPEG [cyan]Encoding [red]{len(chunk_paths)} [cyan]chunks with [red]{workers} [cyan]workers")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda args: _encode_chunk(video_path, *args, low_priority), zip(boundaries, ends, chunk_paths)))
+
+        if not all(results):
+            return False
+
+        list_path = os.path.join(chunk_dir, "concat.txt")
+        with open(list_path, 'w', encoding='utf-8') as f:
+            for chunk_path in chunk_paths:
+                escaped = os.path.abspath(chunk_path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+        cmd = [get_ffmpeg_path(), '-y', '-v', 'error', '-f', 'concat', '-safe', '0', '-i', list_path, '-i', video_path,
+               '-map', '0:v', '-map', '1:a?', '-map', '1:s?', '-map_metadata', '1', '-c', 'copy']
+        cmd.extend(PARAM_AUDIO)
+        cmd.append(out_path)
+
+        result = _run_ffmpeg(cmd, low_priority)
+        if result.returncode != 0:
+            logging.error(f"Chunk concat failed: {result.stderr.strip()}")
+            return False
+        return os.path.exists(out_path) and os.path.getsize(out_path) > 0
+
+    finally:
+        for path in os.listdir(chunk_dir) if os.path.isdir(chunk_dir) else []:
+            try:
+                os.remove(os.path.join(chunk_dir, path))
+            except OSError:
+                pass
+        try:
+            os.rmdir(chunk_dir)
+        except OSError:
+            pass
+
+
+def reencode_in_place(path: str, low_priority: bool = False) -> bool:
+    """Re-encode a muxed file with param_video/param_audio and replace it, chunked when enabled."""
+    temp_path = _temp_output(path, "encoding")
+
+    success = False
+    if CHUNKED_ENCODE_WORKERS > 1:
+        success = encode_chunked(path, temp_path, CHUNKED_ENCODE_WORKERS, low_priority)
+        if not success:
+            console.print("[yellow]Chunked encode not possible, using a single FFmpeg encode")
+
+    if not success:
+        cmd = [get_ffmpeg_path(), '-y', '-i', path, '-map', '0', '-c', 'copy']
+        cmd.extend(PARAM_VIDEO)
+        cmd.extend(PARAM_AUDIO)
+        cmd.append(temp_path)
+
+        if low_priority:
+            result = _run_ffmpeg(cmd, low_priority=True)
+            returncode = result.returncode
+            if returncode != 0:
+                logging.error(f"Deferred encode failed for {path}: {result.stderr.strip()}")
+        else:
+            returncode = capture_ffmpeg_real_time(cmd, "[yellow]FFMPEG [cyan]Encode video", duration=media_probe.duration(path)).get('returncode')
+            print()
+
+        success = returncode == 0 and os.path.exists(temp_path) and os.path.getsize(temp_path) > 0
+
+    if not success:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+    os.replace(temp_path, path)
+    return True
+
+
+class DeferredEncodeQueue:
+    def __init__(self):
+        """
+        Run re-encodes one at a time in a background thread at low priority, after the mux.
+
+        The worker is not a daemon, so the program waits for pending encodes before exiting.
+        """
+        self.jobs = queue.Queue()
+        self.worker = None
+        self.lock = threading.Lock()
+
+    def submit(self, path: str, on_done: Optional[Callable[[], None]] = None):
+        with self.lock:
+            self.jobs.put((path, on_done))
+            if self.worker is None or not self.worker.is_alive():
+                self.worker = threading.Thread(target=self._run, name="deferred-encode")
+                self.worker.start()
+
+        console.print(f"[cyan]Queued deferred encode: [yellow]{os.path.basename(path)} [cyan]({self.jobs.qsize()} pending)")
+
+    def pending(self) -> int:
+        return self.jobs.qsize()
+
+    def _run(self):
+        while True:
+            with self.lock:
+                try:
+                    path, on_done = self.jobs.get_nowait()
+                except queue.Empty:
+                    self.worker = None
+                    return
+
+            if not os.path.exists(path):
+                logging.error(f"Deferred encode skipped, file is gone: {path}")
+            elif reencode_in_place(path, low_priority=True):
+                logging.info(f"Deferred encode done: {path}")
+            else:
+                logging.error(f"Deferred encode failed, stream copy kept: {path}")
+
+            # The file is final now (encoded or stream copy), let the download report completion
+            if on_done is not None:
+                try:
+                    on_done()
+                except Exception as e:
+                    logging.error(f"Deferred encode completion failed for {path}: {e}")
+
+
+def encode_after_mux(path: str, on_done: Optional[Callable[[], None]] = None) -> bool:
+    """
+    Finish the re-encode of a file muxed with stream copy (see copy_then_encode).
+
+    Returns:
+        bool: True if the encode was queued, on_done then runs from the deferred job once the file is replaced.
+    """
+    if not copy_then_encode() or not path or not os.path.exists(path):
+        return False
+
+    if DEFER_ENCODE:
+        deferred_encoder.submit(path, on_done)
+        return True
+
+    reencode_in_place(path)
+    return False
+
+
+# Initialize
+deferred_encoder = DeferredEncodeQueue()
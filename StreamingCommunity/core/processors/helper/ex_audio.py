@@ -1,16 +1,11 @@
 # 16.04.24
 
-import json
-import subprocess
-import logging
-
-
 # External library
 from rich.console import Console
 
 
 # Internal utilities
-from StreamingCommunity.setup import get_ffprobe_path
+from .probe import media_probe
 
 
 # Variable
@@ -19,45 +14,20 @@ console = Console()
 
 def has_audio(file_path: str) -> bool:
     """Check if a media file has an audio stream using FFprobe."""
-    try:
-        ffprobe_cmd = [get_ffprobe_path(), '-v', 'error', '-show_streams', '-print_format', 'json', file_path]
-        with subprocess.Popen(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
-            stdout, stderr = proc.communicate()
-
-            if proc.returncode != 0:
-                logging.error(f"Error has_audio: {stderr}")
-                return False
-
-            probe_result = json.loads(stdout)
-            streams = probe_result.get('streams', [])
-            for stream in streams:
-                if stream.get('codec_type') == 'audio':
-                    return True
-            return False
-        
-    except Exception as e:
-        logging.error(f"Exception in has_audio: {e}")
-        return False
+    return media_probe.has_audio(file_path)
 
 
 def get_video_duration(file_path: str, file_type: str = "file") -> float:
     """Get the duration of a media file (video or audio)."""
-    ffprobe_cmd = [get_ffprobe_path(), '-v', 'error', '-show_format', '-print_format', 'json', file_path]
-    with subprocess.Popen(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
-        stdout, stderr = proc.communicate()
-
-        if proc.returncode != 0:
-            logging.error(f"Error get_video_duration: {stderr}")
-            return None
+    data = media_probe.probe(file_path)
+    if data is None:
+        return None
 
-        # Parse JSON output
-        probe_result = json.loads(stdout)
-
-        # Extract duration from the media information
-        try:
-            return float(probe_result['format']['duration'])
-        except Exception:
-            return 1
+    # Extract duration from the media information
+    try:
+        return float(data['format']['duration'])
+    except Exception:
+        return 1
 
 
 def check_duration_v_a(video_path, audio_path, tolerance=1.0):
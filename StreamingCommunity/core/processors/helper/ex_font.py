@@ -1,29 +1,115 @@
 # 17.01.25
 
 import os
+import json
+import logging
 import platform
+import threading
 import subprocess
-from typing import List
+from typing import Dict, List, Optional
 
 
 # External import
 from rich.console import Console
 
 
+# Internal utilities
+from StreamingCommunity.utils import os_manager
+
+
 # Variable
 console = Console()
+FONT_INDEX_FILE = 'font_index.json'
 
 
 class FontManager:
-    def __init__(self):
-        self._fonts = None
+    def __init__(self, index_path: Optional[str] = None):
+        """
+        Index of the installed font families.
+
+        The index is built once, saved to disk and reused until the modification time of a
+        font directory changes, so checking many subtitles costs one set lookup per font.
+
+        Parameters:
+            - index_path (Optional[str]): JSON file of the index, defaults to .cache/font_index.json.
+        """
+        self.index_path = index_path
+        self._fonts: Optional[List[str]] = None
+        self._families = frozenset()
+        self._lock = threading.Lock()
 
     def get_installed_fonts(self) -> List[str]:
         """Get list of installed fonts on the system (Windows, Linux, macOS)."""
-        if self._fonts is None:
-            self._fonts = self._get_fonts()
+        with self._lock:
+            if self._fonts is None:
+                self._fonts = self._load_or_build()
+                self._families = frozenset(self._fonts)
         return self._fonts
 
+    def has_font(self, family: str) -> bool:
+        """Case-insensitive lookup of a font family."""
+        self.get_installed_fonts()
+        return family.lower().strip() in self._families
+
+    def refresh(self):
+        """Forget the index, the next lookup rebuilds it."""
+        with self._lock:
+            self._fonts = None
+            self._families = frozenset()
+            if self.index_path and os.path.exists(self.index_path):
+                os.remove(self.index_path)
+
+    def _font_dirs(self) -> List[str]:
+        system = platform.system().lower()
+        if system == 'windows':
+            dirs = [os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')]
+            local_app_data = os.environ.get('LOCALAPPDATA')
+            if local_app_data:
+                dirs.append(os.path.join(local_app_data, 'Microsoft', 'Windows', 'Fonts'))
+            return dirs
+        elif system == 'darwin':
+            return ['/Library/Fonts', '/System/Library/Fonts', os.path.expanduser('~/Library/Fonts'), '/Network/Library/Fonts']
+        return ['/usr/share/fonts', '/usr/local/share/fonts', os.path.expanduser('~/.fonts'), os.path.expanduser('~/.local/share/fonts')]
+
+    def _signature(self) -> Dict[str, int]:
+        """Modification time of every font directory, installing or removing a font changes it."""
+        signature = {}
+        for font_dir in self._font_dirs():
+            if not os.path.isdir(font_dir):
+                continue
+            for root, _, _ in os.walk(font_dir):
+                try:
+                    signature[root] = os.stat(root).st_mtime_ns
+                except OSError:
+                    continue
+        return signature
+
+    def _load_or_build(self) -> List[str]:
+        system = platform.system().lower()
+        signature = self._signature()
+        index_path = self.index_path or os_manager.get_cache_path(FONT_INDEX_FILE)
+
+        try:
+            if os.path.exists(index_path):
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('system') == system and data.get('signature') == signature and data.get('fonts'):
+                    return data['fonts']
+        except Exception as e:
+            logging.warning(f"Could not read font index {index_path}: {e}")
+
+        fonts = self._get_fonts()
+        if fonts:
+            try:
+                tmp_path = f"{index_path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'system': system, 'signature': signature, 'fonts': fonts}, f)
+                os.replace(tmp_path, index_path)
+            except Exception as e:
+                logging.warning(f"Could not save font index {index_path}: {e}")
+
+        return fonts
+
     def _get_fonts(self) -> List[str]:
         system = platform.system().lower()
         fonts = []
@@ -40,7 +126,7 @@ class FontManager:
         except Exception as e:
             console.log(f"[red]Error retrieving system fonts: {e}[/red]")
 
-        return sorted(list(set(fonts)))
+        return sorted(set(f for f in fonts if f))
 
     def _get_windows_fonts(self) -> List[str]:
         """Get installed fonts on Windows."""
@@ -91,15 +177,7 @@ class FontManager:
         """Get installed fonts on macOS."""
         fonts = []
 
-        # macOS font directories
-        font_dirs = [
-            '/Library/Fonts',                           # System fonts
-            '/System/Library/Fonts',                    # System fonts (core)
-            os.path.expanduser('~/Library/Fonts'),      # User fonts
-            '/Network/Library/Fonts'                    # Network fonts
-        ]
-
-        for font_dir in font_dirs:
+        for font_dir in self._font_dirs():
             if os.path.exists(font_dir):
                 try:
                     for root, dirs, files in os.walk(font_dir):
@@ -137,14 +215,7 @@ class FontManager:
             pass
 
         # Fallback: scan common Linux font directories
-        font_dirs = [
-            '/usr/share/fonts',
-            '/usr/local/share/fonts',
-            os.path.expanduser('~/.fonts'),
-            os.path.expanduser('~/.local/share/fonts')
-        ]
-
-        for font_dir in font_dirs:
+        for font_dir in self._font_dirs():
             if os.path.exists(font_dir):
                 try:
                     for root, dirs, files in os.walk(font_dir):
@@ -160,4 +231,8 @@ class FontManager:
                 except Exception:
                     pass
 
-        return fonts
\ No newline at end of file
+        return fonts
+
+
+# Initialize
+font_manager = FontManager()
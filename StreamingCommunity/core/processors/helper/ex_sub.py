@@ -11,7 +11,7 @@ from typing import Optional
 from rich.console import Console
 
 # Local import
-from .ex_font import FontManager
+from .ex_font import font_manager
 
 
 # Variable
@@ -51,39 +51,37 @@ def process_subtitle_fonts(subtitle_path: str):
     if format not in ['ass', 'ssa']:
         return
     
-    font_manager = FontManager()
-    installed_fonts = font_manager.get_installed_fonts()
-    
-    if not installed_fonts:
+    if not font_manager.get_installed_fonts():
         console.print("[red]Error: No fonts detected on system. Cannot process subtitle fonts.")
         return
     
-    installed_fonts_lower = [f.lower() for f in installed_fonts]
+    missing_fonts = set()
+    found_fonts = set()
     
+    # Styles are defined before [Events], the dialogue lines are never read
     try:
         with open(subtitle_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            for i, line in enumerate(f):
+                if line.startswith('Style:'):
+                    font_name = extract_font_name_from_style(line)
+                    
+                    if font_name is None:
+                        console.print(f"[yellow]Warning: Could not parse Style line {i+1}: {line.strip()}")
+                        continue
+                    
+                    # Check if font is installed
+                    if font_manager.has_font(font_name):
+                        found_fonts.add(font_name)
+                    else:
+                        missing_fonts.add(font_name)
+
+                elif line.strip().lower() == '[events]':
+                    break
+
     except Exception as e:
         console.print(f"[red]Error reading subtitle file {subtitle_path}: {str(e)}")
         return
     
-    missing_fonts = set()
-    found_fonts = set()
-    
-    for i, line in enumerate(lines):
-        if line.startswith('Style:'):
-            font_name = extract_font_name_from_style(line)
-            
-            if font_name is None:
-                console.print(f"[yellow]Warning: Could not parse Style line {i+1}: {line.strip()}")
-                continue
-            
-            # Check if font is installed
-            if font_name.lower() in installed_fonts_lower:
-                found_fonts.add(font_name)
-            else:
-                missing_fonts.add(font_name)
-    
     # Report findings
     system = platform.system()
     if missing_fonts:
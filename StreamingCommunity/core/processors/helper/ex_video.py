@@ -1,11 +1,11 @@
 # 17.01.25
 
-import json
 import subprocess
 
 
 # Internal utilities
-from StreamingCommunity.setup import get_ffprobe_path, get_ffmpeg_path
+from StreamingCommunity.setup import get_ffmpeg_path
+from .probe import media_probe
 
 
 # External library
@@ -26,21 +26,15 @@ def detect_ts_timestamp_issues(file_path):
     Returns:
         bool: True if timestamp issues are detected, False otherwise.
     """
-    cmd = [get_ffprobe_path(), '-v', 'error', '-show_packets', '-select_streams', 'v:0', '-read_intervals', '0%+#1', '-print_format', 'json', file_path]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    packets = media_probe.first_packets(file_path, 'v:0', 1)
     
-    if result.returncode != 0 or 'pts_time' not in result.stdout:
-        return True  # Assume issues if probe fails or no pts_time
+    if not packets:
+        return True  # Assume issues if probe fails or no packets
     
-    # Parse JSON and check for packets without pts
-    try:
-        info = json.loads(result.stdout)
-        packets = info.get('packets', [])
-        for packet in packets:
-            if packet.get('pts') is None or packet.get('pts') == 'N/A':
-                return True
-    except json.JSONDecodeError:
-        return True
+    # Check for packets without pts
+    for packet in packets:
+        if packet.get('pts') is None or packet.get('pts') == 'N/A' or 'pts_time' not in packet:
+            return True
     
     return False
 
@@ -1,14 +1,12 @@
 # 02.02.26
 
-import json
-import subprocess
 import logging
 from pathlib import Path
 from math import gcd
 
 
 # Internal utilities
-from StreamingCommunity.setup import get_ffprobe_path
+from .probe import media_probe
 
 
 class NFOGenerator:
@@ -19,25 +17,15 @@ class NFOGenerator:
         self.streams = []
         
     def _run_ffprobe(self):
-        """Execute ffprobe and parse JSON output."""
-        cmd = [
-            get_ffprobe_path(),
-            "-v", "error",
-            "-print_format", "json",
-            "-show_format",
-            "-show_streams",
-            str(self.file_path)
-        ]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            self.data = json.loads(result.stdout)
-            self.format_info = self.data.get("format", {})
-            self.streams = self.data.get("streams", [])
-            return True
-        except Exception as e:
-            logging.error(f"FFprobe error: {e}")
+        """Read the cached ffprobe output of the file."""
+        self.data = media_probe.probe(str(self.file_path))
+        if self.data is None:
+            logging.error(f"FFprobe error: could not probe {self.file_path}")
             return False
+        
+        self.format_info = self.data.get("format", {})
+        self.streams = self.data.get("streams", [])
+        return True
     
     @staticmethod
     def format_size(bytes_size):
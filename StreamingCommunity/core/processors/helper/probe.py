@@ -0,0 +1,204 @@
+# 19.10.26
+
+import os
+import json
+import atexit
+import logging
+import threading
+import subprocess
+from collections import OrderedDict
+from typing import List, Optional
+
+
+# Internal utilities
+from StreamingCommunity.utils import config_manager, os_manager
+from StreamingCommunity.setup import get_ffprobe_path
+
+
+# Config
+PERSIST_PROBE_CACHE = config_manager.config.get_bool('PROCESS', 'persist_probe_cache', default=False)
+MAX_PERSISTED_ENTRIES = 2000
+MAX_PACKET_ENTRIES = 256
+KEY_LOCK_STRIPES = 64
+SAVE_DELAY = 30
+
+
+class MediaProbe:
+    def __init__(self, persist_path: Optional[str] = None):
+        """
+        Run ffprobe once per file and memoize the parsed JSON.
+
+        Entries are keyed by absolute path, size and mtime, so a rewritten file is probed again.
+        Both caches are LRU bounded; the persisted file is written at most every SAVE_DELAY
+        seconds and on exit.
+
+        Parameters:
+            - persist_path (Optional[str]): JSON file where results survive across runs.
+        """
+        self.persist_path = persist_path
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._packets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(KEY_LOCK_STRIPES)]
+        self._loaded = False
+        self._dirty = False
+        self._save_timer = None
+
+        if persist_path:
+            atexit.register(self.flush)
+
+    @staticmethod
+    def _key(file_path: str) -> Optional[str]:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return f"{os.path.abspath(file_path)}|{st.st_size}|{st.st_mtime_ns}"
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Striped lock per file, so concurrent callers wait for a single ffprobe run."""
+        return self._key_locks[hash(key) % KEY_LOCK_STRIPES]
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key: str, value, limit: int):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+    def _load(self):
+        if self._loaded or not self.persist_path:
+            self._loaded = True
+            return
+
+        self._loaded = True
+        try:
+            if os.path.exists(self.persist_path):
+                with open(self.persist_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    for key, value in list(data.items())[-MAX_PERSISTED_ENTRIES:]:
+                        self._cache[key] = value
+        except Exception as e:
+            logging.warning(f"Could not load probe cache {self.persist_path}: {e}")
+
+    def _schedule_save(self):
+        """Debounce writes: one save SAVE_DELAY seconds after the first unsaved probe."""
+        if not self.persist_path:
+            return
+
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write the cache to disk now if it changed."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+        self._save()
+
+    def _save(self):
+        if not self.persist_path:
+            return
+
+        try:
+            with self._lock:
+                items = list(self._cache.items())
+
+            tmp_path = f"{self.persist_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(dict(items), f)
+            os.replace(tmp_path, self.persist_path)
+        except Exception as e:
+            logging.warning(f"Could not save probe cache {self.persist_path}: {e}")
+
+    def _run(self, cmd: List[str]) -> Optional[dict]:
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            if result.returncode != 0:
+                logging.error(f"FFprobe error on {cmd[-1]}: {result.stderr.strip()}")
+                return None
+            return json.loads(result.stdout)
+        except Exception as e:
+            logging.error(f"FFprobe error on {cmd[-1]}: {e}")
+            return None
+
+    def probe(self, file_path: str) -> Optional[dict]:
+        """Return the ffprobe format and streams of a file, or None if probing failed."""
+        key = self._key(file_path)
+        if key is None:
+            return None
+
+        with self._key_lock(key):
+            with self._lock:
+                self._load()
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    return self._cache[key]
+
+            data = self._run([get_ffprobe_path(), '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams', file_path])
+            if data is None:
+                return None
+
+            with self._lock:
+                self._remember(self._cache, key, data, MAX_PERSISTED_ENTRIES)
+
+        self._schedule_save()
+        return data
+
+    def first_packets(self, file_path: str, select_streams: str = 'v:0', count: int = 1) -> Optional[list]:
+        """Return the first packets of the selected stream, used for timestamp checks."""
+        key = self._key(file_path)
+        if key is None:
+            return None
+
+        packet_key = f"{key}|{select_streams}|{count}"
+        with self._key_lock(packet_key):
+            with self._lock:
+                if packet_key in self._packets:
+                    self._packets.move_to_end(packet_key)
+                    return self._packets[packet_key]
+
+            data = self._run([get_ffprobe_path(), '-v', 'error', '-show_packets', '-select_streams', select_streams, '-read_intervals', f'0%+#{count}', '-print_format', 'json', file_path])
+            if data is None:
+                return None
+            packets = data.get('packets', [])
+
+            with self._lock:
+                self._remember(self._packets, packet_key, packets, MAX_PACKET_ENTRIES)
+            return packets
+
+    def streams(self, file_path: str) -> List[dict]:
+        data = self.probe(file_path)
+        return data.get('streams', []) if data else []
+
+    def has_audio(self, file_path: str) -> bool:
+        return any(stream.get('codec_type') == 'audio' for stream in self.streams(file_path))
+
+    def duration(self, file_path: str) -> Optional[float]:
+        """Duration in seconds, None if the file cannot be probed."""
+        data = self.probe(file_path)
+        if data is None:
+            return None
+        try:
+            return float(data['format']['duration'])
+        except Exception:
+            return None
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._packets.clear()
+
+
+# Initialize
+media_probe = MediaProbe(os_manager.get_cache_path('media_probe.json') if PERSIST_PROBE_CACHE else None)
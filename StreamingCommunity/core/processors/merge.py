@@ -2,6 +2,7 @@
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 
 
@@ -18,7 +19,9 @@ from StreamingCommunity.setup import binary_paths, get_ffmpeg_path
 from .helper.ex_video import detect_ts_timestamp_issues, convert_ts_to_mp4
 from .helper.ex_audio import check_duration_v_a, has_audio
 from .helper.ex_sub import fix_subtitle_extension
+from .helper.probe import media_probe
 from .capture import capture_ffmpeg_real_time
+from .encoder import copy_then_encode
 from .conversion.ttml_to_srt import convert_ttml_to_srt
 
 
@@ -33,6 +36,23 @@ SUBTITLE_DISPOSITION = config_manager.config.get_bool("PROCESS", "subtitle_dispo
 SUBTITLE_DISPOSITION_LANGUAGE = config_manager.config.get_list("PROCESS", "subtitle_disposition_language")
 AUDIO_ORDER = config_manager.config.get_list("PROCESS", "audio_order")
 SUBTITLE_ORDER = config_manager.config.get_list("PROCESS", "subtitle_order")
+PREPARE_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _sort_by_order(tracks: List[Dict[str, str]], order: List[str], keys: tuple) -> List[Dict[str, str]]:
+    """Sort tracks by the first entry of order contained in one of the given name keys."""
+    if not order:
+        return tracks
+
+    def get_order_index(track):
+        track_name = next((track.get(k) for k in keys if track.get(k)), '') or ''
+        track_name = track_name.lower()
+        for i, order_val in enumerate(order):
+            if order_val.lower() in track_name:
+                return i
+        return len(order)
+
+    return sorted(tracks, key=get_order_index)
 
 
 def add_encoding_params(ffmpeg_cmd: List[str]):
@@ -44,6 +64,8 @@ def add_encoding_params(ffmpeg_cmd: List[str]):
     """
     if PARAM_FINAL:
         ffmpeg_cmd.extend(PARAM_FINAL)
+    elif copy_then_encode():
+        ffmpeg_cmd.extend(['-c', 'copy'])
     else:
         ffmpeg_cmd.extend(PARAM_VIDEO)
         ffmpeg_cmd.extend(PARAM_AUDIO)
@@ -122,46 +144,46 @@ def join_video(video_path: str, out_path: str, log_path: Optional[str] = None):
     ffmpeg_cmd.extend([out_path, '-y'])
 
     # Run join
-    result_json = capture_ffmpeg_real_time(ffmpeg_cmd, "[yellow]FFMPEG [cyan]Join video", log_path)
+    result_json = capture_ffmpeg_real_time(ffmpeg_cmd, "[yellow]FFMPEG [cyan]Join video", log_path, duration=media_probe.duration(video_path))
     print()
+    ffmpeg_succeeded(result_json, out_path)
 
     return out_path, result_json
 
 
-def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: str, limit_duration_diff: float = 3, log_path: Optional[str] = None):
-    """
-    Joins audio tracks with a video file using FFmpeg.
-    
-    Parameters:
-        - video_path (str): The path to the video file.
-        - audio_tracks (list[dict[str, str]]): A list of dictionaries containing information about audio tracks.
-            Each dictionary should contain the 'path' and 'name' keys.
-        - out_path (str): The path to save the output file.
-        - limit_duration_diff (float): Maximum duration difference in seconds.
+def _prepare_audio_track(audio_track: Dict[str, str]) -> Optional[str]:
+    """Convert one TS audio track with timestamp issues to M4A, return the temp file created."""
+    audio_path = audio_track.get('path')
+    if audio_path.lower().endswith('.ts') and detect_ts_timestamp_issues(audio_path):
+        temp_audio_path = audio_path + '.temp.m4a'
+        if convert_ts_to_mp4(audio_path, temp_audio_path):
+            audio_track['path'] = temp_audio_path
+            return temp_audio_path
+        else:
+            console.print(f"[red]Failed to convert audio TS {audio_path} to M4A")
+
+    return None
+
+
+def prepare_audio_tracks(audio_tracks: List[Dict[str, str]]) -> List[str]:
     """
-    if AUDIO_ORDER:
-        def get_order_index(track):
-            track_name = track.get('name', '').lower()
-            for i, order_val in enumerate(AUDIO_ORDER):
-                if order_val.lower() in track_name:
-                    return i
-            return len(AUDIO_ORDER)
-        audio_tracks = sorted(audio_tracks, key=get_order_index)
+    Convert TS audio tracks with timestamp issues to M4A, updating each track path in place.
 
-    use_shortest = False
-    
-    # Check and convert audio tracks if TS with issues
+    Returns:
+        list: Temporary files created, to be removed after the mux.
+    """
     temp_audio_paths = []
     for audio_track in audio_tracks:
-        audio_path = audio_track.get('path')
-        if audio_path.lower().endswith('.ts') and detect_ts_timestamp_issues(audio_path):
-            temp_audio_path = audio_path + '.temp.m4a'
-            if convert_ts_to_mp4(audio_path, temp_audio_path):
-                audio_track['path'] = temp_audio_path
-                temp_audio_paths.append(temp_audio_path)
-            else:
-                console.print(f"[red]Failed to convert audio TS {audio_path} to M4A")
-    
+        temp_audio_path = _prepare_audio_track(audio_track)
+        if temp_audio_path:
+            temp_audio_paths.append(temp_audio_path)
+
+    return temp_audio_paths
+
+
+def check_audio_durations(video_path: str, audio_tracks: List[Dict[str, str]], limit_duration_diff: float = 3) -> bool:
+    """Print the duration of every audio track, return True if -shortest is needed."""
+    use_shortest = False
     for audio_track in audio_tracks:
         audio_path = audio_track.get('path')
         audio_lang = audio_track.get('name', 'unknown')
@@ -173,6 +195,153 @@ def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: s
             console.print(f"[yellow]    WARN [cyan]Audio lang: [red]'{audio_lang}' [cyan]has a duration difference of [red]{diff:.2f}s [cyan]which exceeds the limit of [red]{limit_duration_diff}s.")
             use_shortest = True
 
+    return use_shortest
+
+
+def _prepare_subtitle_track(subtitle: Dict[str, str]):
+    """Fix the extension of one subtitle and convert it from TTML to SRT, updating its path in place."""
+    original_path = subtitle['path']
+    corrected_path = fix_subtitle_extension(original_path)
+    
+    # TTML to SRT conversion if needed
+    if corrected_path.lower().endswith(('.ttml', '.xml')) or 'ttml' in corrected_path.lower():
+        srt_path = os.path.splitext(corrected_path)[0] + '.srt'
+        if convert_ttml_to_srt(corrected_path, srt_path):
+            console.print(f"[yellow]    - [green]Converted TTML to SRT: [red]{os.path.basename(srt_path)}")
+            corrected_path = srt_path
+    
+    subtitle['path'] = corrected_path
+
+
+def prepare_subtitle_tracks(subtitles_list: List[Dict[str, str]]):
+    """Fix subtitle extensions and convert TTML to SRT, updating each track path in place."""
+    for subtitle in subtitles_list:
+        _prepare_subtitle_track(subtitle)
+
+
+def prepare_tracks_parallel(video_path: str, audio_tracks: List[Dict[str, str]], subtitles_list: List[Dict[str, str]]) -> List[str]:
+    """
+    Run the pre-mux preparation of every track in a thread pool.
+
+    Each track is an independent chain (audio: TS check -> convert -> probe, subtitle: extension
+    fix -> fonts -> TTML to SRT), the video probe runs alongside them. Returns once every chain is
+    done, so the mux can start as soon as all of its inputs are ready.
+
+    Returns:
+        list: Temporary audio files created, to be removed after the mux.
+    """
+    def audio_chain(audio_track):
+        temp_path = _prepare_audio_track(audio_track)
+        media_probe.probe(audio_track['path'])
+        return temp_path
+
+    jobs = len(audio_tracks) + len(subtitles_list)
+    if jobs <= 1:
+        temp_audio_paths = prepare_audio_tracks(audio_tracks)
+        prepare_subtitle_tracks(subtitles_list)
+        return temp_audio_paths
+
+    with ThreadPoolExecutor(max_workers=min(PREPARE_WORKERS, jobs + 1)) as executor:
+        video_future = executor.submit(media_probe.probe, video_path)
+        audio_futures = [executor.submit(audio_chain, track) for track in audio_tracks]
+        subtitle_futures = [executor.submit(_prepare_subtitle_track, subtitle) for subtitle in subtitles_list]
+
+        temp_audio_paths = []
+        for future in audio_futures:
+            try:
+                temp_path = future.result()
+                if temp_path:
+                    temp_audio_paths.append(temp_path)
+            except Exception as e:
+                console.print(f"[red]Audio preparation failed: {e}")
+
+        for future in subtitle_futures + [video_future]:
+            try:
+                future.result()
+            except Exception as e:
+                console.print(f"[red]Track preparation failed: {e}")
+
+    return temp_audio_paths
+
+
+def get_subtitle_codec(out_path: str) -> str:
+    """Subtitle codec supported by the output container."""
+    output_ext = os.path.splitext(out_path)[1].lower()
+    if output_ext == '.mp4':
+        return 'mov_text'
+    elif output_ext == '.mkv':
+        # Now that we convert TTML manually, we don't need to force srt via ffmpeg unless they are still not srt
+        return 'srt'
+    return 'copy'
+
+
+def add_subtitle_dispositions(ffmpeg_cmd: List[str], subtitles_list: List[Dict[str, str]]):
+    """Disable every subtitle by default, then mark the one matching SUBTITLE_DISPOSITION_LANGUAGE."""
+    for idx in range(len(subtitles_list)):
+        ffmpeg_cmd.extend([f'-disposition:s:{idx}', '0'])
+    
+    # Set disposition ONLY if SUBTITLE_DISPOSITION is enabled
+    if SUBTITLE_DISPOSITION and len(subtitles_list) > 0:
+        disposition_idx = None
+        
+        # Find subtitle matching the configured language
+        for idx, subtitle in enumerate(subtitles_list):
+            subtitle_lang = subtitle.get('language', '').lower()
+            for lang in SUBTITLE_DISPOSITION_LANGUAGE:
+                config_lang = lang.lower().strip()
+                
+                if subtitle_lang == config_lang or subtitle_lang.startswith(config_lang):
+                    console.print(f"[yellow]    Setting disposition for subtitle: [red]{subtitle.get('language')}")
+                    disposition_idx = idx
+                    break
+                    
+            if disposition_idx is not None:
+                break
+            
+        # If matching subtitle found, set it as default
+        if disposition_idx is not None:
+            ffmpeg_cmd.extend([f'-disposition:s:{disposition_idx}', 'default'])
+
+
+def _remove_files(paths: List[str]):
+    for temp_path in paths:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
+
+
+def ffmpeg_succeeded(result_json: Optional[dict], out_path: str) -> bool:
+    """
+    True when FFmpeg exited cleanly and wrote out_path.
+
+    A non-zero exit can leave a truncated file behind, it is removed so callers checking
+    for the output fall back instead of keeping it.
+    """
+    returncode = (result_json or {}).get('returncode')
+    if returncode not in (0, None):
+        console.print(f"[red]FFmpeg failed with exit code {returncode}, discarding {os.path.basename(out_path)}")
+        _remove_files([out_path])
+        return False
+    return os.path.exists(out_path) and os.path.getsize(out_path) > 0
+
+
+def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: str, limit_duration_diff: float = 3, log_path: Optional[str] = None):
+    """
+    Joins audio tracks with a video file using FFmpeg.
+    
+    Parameters:
+        - video_path (str): The path to the video file.
+        - audio_tracks (list[dict[str, str]]): A list of dictionaries containing information about audio tracks.
+            Each dictionary should contain the 'path' and 'name' keys.
+        - out_path (str): The path to save the output file.
+        - limit_duration_diff (float): Maximum duration difference in seconds.
+    """
+    audio_tracks = _sort_by_order(audio_tracks, AUDIO_ORDER, ('name',))
+    temp_audio_paths = prepare_tracks_parallel(video_path, audio_tracks, [])
+    use_shortest = check_audio_durations(video_path, audio_tracks, limit_duration_diff)
+
     # Start command with locate ffmpeg
     ffmpeg_cmd = [get_ffmpeg_path()]
 
@@ -216,16 +385,12 @@ def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: s
     ffmpeg_cmd.extend([out_path, '-y'])
 
     # Run join
-    result_json = capture_ffmpeg_real_time(ffmpeg_cmd, "[yellow]FFMPEG [cyan]Join audio", log_path)
+    result_json = capture_ffmpeg_real_time(ffmpeg_cmd, "[yellow]FFMPEG [cyan]Join audio", log_path, duration=media_probe.duration(video_path))
     print()
+    ffmpeg_succeeded(result_json, out_path)
 
     # Clean up temp audio files
-    for temp_path in temp_audio_paths:
-        if os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except Exception:
-                pass
+    _remove_files(temp_audio_paths)
 
     return out_path, use_shortest, result_json
 
@@ -240,40 +405,13 @@ def join_subtitles(video_path: str, subtitles_list: List[Dict[str, str]], out_pa
             Each dictionary should contain the 'path' key with the path to the subtitle file and the 'name' key with the name of the subtitle.
         - out_path (str): The path to save the output file.
     """
-    if SUBTITLE_ORDER:
-        def get_order_index(track):
-            track_name = (track.get('name', '') or track.get('language', '') or track.get('lang', '') or '').lower()
-            for i, order_val in enumerate(SUBTITLE_ORDER):
-                if order_val.lower() in track_name:
-                    return i
-            return len(SUBTITLE_ORDER)
-        subtitles_list = sorted(subtitles_list, key=get_order_index)
+    subtitles_list = _sort_by_order(subtitles_list, SUBTITLE_ORDER, ('name', 'language', 'lang'))
 
     # First, detect and fix subtitle extensions
-    for subtitle in subtitles_list:
-        original_path = subtitle['path']
-        corrected_path = fix_subtitle_extension(original_path)
-        
-        # TTML to SRT conversion if needed
-        if corrected_path.lower().endswith(('.ttml', '.xml')) or 'ttml' in corrected_path.lower():
-            srt_path = os.path.splitext(corrected_path)[0] + '.srt'
-            if convert_ttml_to_srt(corrected_path, srt_path):
-                console.print(f"[yellow]    - [green]Converted TTML to SRT: [red]{os.path.basename(srt_path)}")
-                corrected_path = srt_path
-        
-        subtitle['path'] = corrected_path
+    prepare_tracks_parallel(video_path, [], subtitles_list)
     
     ffmpeg_cmd = [get_ffmpeg_path(), "-i", video_path]
-    output_ext = os.path.splitext(out_path)[1].lower()
-    
-    # Determine subtitle codec based on output format
-    if output_ext == '.mp4':
-        subtitle_codec = 'mov_text'
-    elif output_ext == '.mkv':
-        # Now that we convert TTML manually, we don't need to force srt via ffmpeg unless they are still not srt
-        subtitle_codec = 'srt'
-    else:
-        subtitle_codec = 'copy'
+    subtitle_codec = get_subtitle_codec(out_path)
     
     # Add subtitle input files first
     for subtitle in subtitles_list:
@@ -295,36 +433,145 @@ def join_subtitles(video_path: str, subtitles_list: List[Dict[str, str]], out_pa
     ffmpeg_cmd.extend(['-c:v', 'copy', '-c:a', 'copy', '-c:s', subtitle_codec])
     
     # Handle disposition: set all subtitles to 0 (disabled) by default
-    for idx in range(len(subtitles_list)):
-        ffmpeg_cmd.extend([f'-disposition:s:{idx}', '0'])
-    
-    # Set disposition ONLY if SUBTITLE_DISPOSITION is enabled
-    if SUBTITLE_DISPOSITION and len(subtitles_list) > 0:
-        disposition_idx = None
-        
-        # Find subtitle matching the configured language
-        for idx, subtitle in enumerate(subtitles_list):
-            subtitle_lang = subtitle.get('language', '').lower()
-            for lang in SUBTITLE_DISPOSITION_LANGUAGE:
-                config_lang = lang.lower().strip()
-                
-                if subtitle_lang == config_lang or subtitle_lang.startswith(config_lang):
-                    console.print(f"[yellow]    Setting disposition for subtitle: [red]{subtitle.get('language')}")
-                    disposition_idx = idx
-                    break
-                    
-            if disposition_idx is not None:
-                break
-            
-        # If matching subtitle found, set it as default
-        if disposition_idx is not None:
-            ffmpeg_cmd.extend([f'-disposition:s:{disposition_idx}', 'default'])
+    add_subtitle_dispositions(ffmpeg_cmd, subtitles_list)
     
     # Overwrite
     ffmpeg_cmd += [out_path, "-y"]
     
     # Run join
-    result_json = capture_ffmpeg_real_time(ffmpeg_cmd, "[yellow]FFMPEG [cyan]Join subtitle", log_path)
+    result_json = capture_ffmpeg_real_time(ffmpeg_cmd, "[yellow]FFMPEG [cyan]Join subtitle", log_path, duration=media_probe.duration(video_path))
     print()
+    ffmpeg_succeeded(result_json, out_path)
     
-    return out_path, result_json
\ No newline at end of file
+    return out_path, result_json
+
+
+def build_mux_command(video_path: str, audio_tracks: List[Dict[str, str]], subtitles_list: List[Dict[str, str]], out_path: str, use_shortest: bool = False) -> List[str]:
+    """
+    Build a single FFmpeg command muxing video, audio and subtitle tracks.
+
+    Tracks must already be ordered and prepared (see prepare_audio_tracks / prepare_subtitle_tracks).
+    Input order is video, audios, subtitles, so audio i is input i + 1 and subtitle j is input len(audios) + j + 1.
+    """
+    ffmpeg_cmd = [get_ffmpeg_path()]
+
+    # Enabled the use of gpu
+    if USE_GPU and audio_tracks:
+        ffmpeg_cmd.extend(['-hwaccel', detect_gpu_device_type()])
+
+    # Insert input video path with TS format
+    if video_path.lower().endswith('.ts'):
+        ffmpeg_cmd.extend(['-f', 'mpegts'])
+    ffmpeg_cmd.extend(['-i', video_path])
+
+    for audio_track in audio_tracks:
+        if audio_track.get('path', '').lower().endswith('.ts'):
+            ffmpeg_cmd.extend(['-f', 'mpegts'])
+        ffmpeg_cmd.extend(['-i', audio_track.get('path')])
+
+    for subtitle in subtitles_list:
+        ffmpeg_cmd.extend(['-i', subtitle['path']])
+
+    # Map video, then the external audios or the audio already inside the video
+    ffmpeg_cmd.extend(['-map', '0:v'])
+    if audio_tracks:
+        for i in range(1, len(audio_tracks) + 1):
+            ffmpeg_cmd.extend(['-map', f'{i}:a'])
+    elif has_audio(video_path):
+        ffmpeg_cmd.extend(['-map', '0:a'])
+
+    sub_offset = len(audio_tracks) + 1
+    for idx in range(len(subtitles_list)):
+        ffmpeg_cmd.extend(['-map', f'{sub_offset + idx}:s'])
+
+    # Add language metadata for each audio track
+    for i, audio_track in enumerate(audio_tracks):
+        lang_code = audio_track.get('name', 'unknown')
+        ffmpeg_cmd.extend([f'-metadata:s:a:{i}', f'language={lang_code}'])
+        ffmpeg_cmd.extend([f'-metadata:s:a:{i}', f'title={audio_track.get("name", "unknown")}'])
+
+    for idx, subtitle in enumerate(subtitles_list):
+        lang_display = subtitle.get('lang', subtitle.get('language', 'unknown'))
+        ffmpeg_cmd.extend([f'-metadata:s:s:{idx}', f'title={lang_display}'])
+
+    # Video and audio follow the configured encoding only when audio is muxed, like join_audios
+    if audio_tracks:
+        add_encoding_params(ffmpeg_cmd)
+    else:
+        ffmpeg_cmd.extend(['-c:v', 'copy', '-c:a', 'copy'])
+
+    if subtitles_list:
+        ffmpeg_cmd.extend(['-c:s', get_subtitle_codec(out_path)])
+        add_subtitle_dispositions(ffmpeg_cmd, subtitles_list)
+
+    if use_shortest:
+        ffmpeg_cmd.extend(['-shortest', '-strict', 'experimental'])
+
+    ffmpeg_cmd.extend([out_path, '-y'])
+    return ffmpeg_cmd
+
+
+def mux_tracks(video_path: str, audio_tracks: List[Dict[str, str]], subtitles_list: List[Dict[str, str]], out_path: str, limit_duration_diff: float = 3, log_path: Optional[str] = None):
+    """
+    Mux video, audio and subtitle tracks into out_path with a single FFmpeg pass.
+
+    Only tracks that need it are pre-converted (TS audio with broken timestamps, TTML subtitles),
+    the video is read and written once. If the single pass fails, falls back to the staged
+    join_audios -> join_subtitles chain.
+
+    Parameters:
+        - video_path (str): The path to the video file.
+        - audio_tracks (list[dict[str, str]]): Audio tracks with 'path' and 'name' keys.
+        - subtitles_list (list[dict[str, str]]): Subtitle tracks with 'path' and 'language' keys.
+        - out_path (str): The path to save the output file.
+        - limit_duration_diff (float): Maximum audio/video duration difference in seconds.
+        - log_path (Optional[str]): Path of the FFmpeg log.
+
+    Returns:
+        tuple: (out_path, result_json)
+    """
+    audio_tracks = _sort_by_order(audio_tracks, AUDIO_ORDER, ('name',))
+    subtitles_list = _sort_by_order(subtitles_list, SUBTITLE_ORDER, ('name', 'language', 'lang'))
+
+    temp_audio_paths = prepare_tracks_parallel(video_path, audio_tracks, subtitles_list)
+    use_shortest = check_audio_durations(video_path, audio_tracks, limit_duration_diff) if audio_tracks else False
+
+    for subtitle in subtitles_list:
+        lang_display = subtitle.get('lang', subtitle.get('language', 'unknown'))
+        console.print(f"[yellow]    - [cyan]Subtitle lang [red]{lang_display}, [cyan]Path: [red]{subtitle.get('path', 'unknown')}")
+
+    ffmpeg_cmd = build_mux_command(video_path, audio_tracks, subtitles_list, out_path, use_shortest)
+    result_json = capture_ffmpeg_real_time(ffmpeg_cmd, "[yellow]FFMPEG [cyan]Mux tracks", log_path, duration=media_probe.duration(video_path))
+    print()
+
+    if not ffmpeg_succeeded(result_json, out_path):
+        console.print("[yellow]Single pass mux failed, falling back to staged merge")
+        out_path, result_json = _mux_tracks_staged(video_path, audio_tracks, subtitles_list, out_path, limit_duration_diff, log_path)
+
+    _remove_files(temp_audio_paths)
+    return out_path, result_json
+
+
+def _mux_tracks_staged(video_path: str, audio_tracks: List[Dict[str, str]], subtitles_list: List[Dict[str, str]], out_path: str, limit_duration_diff: float, log_path: Optional[str]):
+    """Old behaviour: one FFmpeg pass per track type, each rewriting the whole video."""
+    base, ext = os.path.splitext(out_path)
+    log_base = os.path.splitext(log_path)[0] if log_path else None
+    current_file = video_path
+    result_json = None
+
+    if audio_tracks:
+        audio_output = f"{base}_with_audio{ext}" if subtitles_list else out_path
+        merged_file, _, result_json = join_audios(current_file, audio_tracks, audio_output, limit_duration_diff, f"{log_base}_audio.log" if log_base else None)
+        if os.path.exists(merged_file):
+            current_file = merged_file
+        else:
+            console.print("[yellow]Audio merge failed, continuing with video only")
+
+    if subtitles_list:
+        merged_file, result_json = join_subtitles(current_file, subtitles_list, out_path, f"{log_base}_sub.log" if log_base else None)
+        if os.path.exists(merged_file):
+            current_file = merged_file
+        else:
+            console.print("[yellow]Subtitle merge failed, continuing without subtitles")
+
+    return current_file, result_json
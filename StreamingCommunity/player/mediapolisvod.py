@@ -4,7 +4,7 @@ import json
 
 
 # Internal utilities
-from StreamingCommunity.utils.http_client import create_client, get_headers
+from StreamingCommunity.utils.http_client import get_headers, shared_request
 
 
 class VideoSource:
@@ -21,7 +21,7 @@ class VideoSource:
                 return "Error: Unable to determine video JSON URL"
                         
         try:
-            response = create_client(headers=get_headers()).get(video_url)
+            response = shared_request("GET", video_url, headers=get_headers())
             if response.status_code != 200:
                 return f"Error: Failed to fetch video data (Status: {response.status_code})"
                 
@@ -43,7 +43,7 @@ class VideoSource:
                 'output': '62',
             }
 
-            stream_response = create_client(headers=get_headers()).get('https://mediapolisvod.rai.it/relinker/relinkerServlet.htm', params=params)
+            stream_response = shared_request("GET", 'https://mediapolisvod.rai.it/relinker/relinkerServlet.htm', params=params, headers=get_headers())
             if stream_response.status_code != 200:
                 return f"Error: Failed to fetch stream URL (Status: {stream_response.status_code})"
                 
@@ -10,7 +10,7 @@ from bs4 import BeautifulSoup
 
 
 # Internal utilities
-from StreamingCommunity.utils.http_client import create_client_curl, get_headers
+from StreamingCommunity.utils.http_client import get_headers, shared_request
 
 
 class VideoSource:
@@ -35,7 +35,7 @@ class VideoSource:
             - str: The response content if successful, None otherwise.
         """
         try:
-            response = create_client_curl(headers=self.headers).get(url)
+            response = shared_request("GET", url, headers=self.headers, kind="curl")
             if response.status_code >= 400:
                 logging.error(f"Request failed with status code: {response.status_code}, to url: {url}")
                 return None
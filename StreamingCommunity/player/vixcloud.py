@@ -13,7 +13,7 @@ from rich.console import Console
 
 
 # Internal utilities
-from StreamingCommunity.utils.http_client import create_client, get_userAgent, create_client_curl
+from StreamingCommunity.utils.http_client import get_userAgent, shared_request
 
 
 # Variable
@@ -64,7 +64,7 @@ class VideoSource:
             }
 
         try:
-            response = create_client(headers=self.headers).get(f"{self.url}/iframe/{self.media_id}", params=params)
+            response = shared_request("GET", f"{self.url}/iframe/{self.media_id}", params=params, headers=self.headers)
             response.raise_for_status()
 
             # Parse response with BeautifulSoup to get iframe source
@@ -119,7 +119,7 @@ class VideoSource:
 
             # Fetch content from iframe source
             if self.iframe_src is not None:
-                response = create_client(headers=self.headers).get(self.iframe_src)
+                response = shared_request("GET", self.iframe_src, headers=self.headers)
                 response.raise_for_status()
 
                 # Parse response with BeautifulSoup to get content
@@ -194,7 +194,7 @@ class VideoSourceAnime(VideoSource):
             str: Parsed script content
         """
         try:
-            response = create_client_curl(headers=self.headers).get(f"{self.url}/embed-url/{episode_id}")
+            response = shared_request("GET", f"{self.url}/embed-url/{episode_id}", headers=self.headers, kind="curl")
             response.raise_for_status()
 
             # Extract and clean embed URL
@@ -202,7 +202,7 @@ class VideoSourceAnime(VideoSource):
             self.iframe_src = embed_url
 
             # Fetch video content using embed URL
-            video_response = create_client(headers=self.headers).get(embed_url)
+            video_response = shared_request("GET", embed_url, headers=self.headers)
             video_response.raise_for_status()
 
             # Parse response with BeautifulSoup to get content of the scriot
@@ -1,16 +1,22 @@
 # 23.11.24
 
-import difflib
+import logging
+import threading
 from datetime import datetime
-from typing import Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional
 
 
 # Internal utilities
 from StreamingCommunity.utils import config_manager, tmdb_client
+from StreamingCommunity.utils.ranking import rank
 
 
 # Variable
 TMDB_KEY = config_manager.login.get('TMDB', 'api_key')
+YEAR_LOOKUP_WORKERS = 8
+YEAR_LOOKUP_TIMEOUT = 10
+_year_executor = ThreadPoolExecutor(max_workers=YEAR_LOOKUP_WORKERS, thread_name_prefix="tmdb-year")
 
 
 class Episode:
@@ -155,32 +161,80 @@ class Entries(metaclass=EntriesMeta):
 class EntriesManager:
     def __init__(self):
         self.media_list: List[Entries] = []
+        self._pending = []
+        self._lock = threading.Lock()
+        self._on_enriched: List[Callable[[], None]] = []
+        self.on_update: Optional[Callable[[Entries], None]] = None
 
     def add(self, media: Entries) -> None:
-        # Logic to fetch year if 9999
-        if media.year == "9999":
-            if (TMDB_KEY != '' and TMDB_KEY is not None):
-                if (media.slug and media.slug != ''):
-                    print(f"Fetching year for slug: {media.slug}, type: {media.type}")
-                    media.year = str(tmdb_client.get_year_by_slug_and_type(media.slug, media.type) or "9999")
-                    if media.year == "9999":
-                        print("Cant fetch year setting current year.")
-                        media.year = str(datetime.now().year)
-
-                elif (media.name and media.name != ''):
-                    print(f"Fetching year for name: {media.name}, type: {media.type}")
-                    media.year = str(tmdb_client.get_year_by_slug_and_type(media.name.replace(' ', '-').lower(), media.type) or "9999")
-                    if media.year == "9999":
-                        print("Cant fetch year setting current year.")
-                        media.year = str(datetime.now().year)
-
+        """Append the entry; a missing year ("9999") is looked up on TMDB in the background."""
         self.media_list.append(media)
 
+        if media.year == "9999" and TMDB_KEY:
+            slug = media.slug or (media.name.replace(' ', '-').lower() if media.name else '')
+            if slug:
+                future = _year_executor.submit(self._resolve_year, media, slug)
+                with self._lock:
+                    self._pending.append(future)
+                future.add_done_callback(self._lookup_done)
+
+    def _resolve_year(self, media: Entries, slug: str) -> None:
+        try:
+            year = tmdb_client.get_year_by_slug_and_type(slug, media.type)
+        except Exception as e:
+            logging.warning(f"Year lookup failed for {slug}: {e}")
+            year = None
+
+        # Same fallback as before: unknown years become the current one
+        media.year = str(year or datetime.now().year)
+        if self.on_update is not None:
+            try:
+                self.on_update(media)
+            except Exception as e:
+                logging.warning(f"Entry update callback failed: {e}")
+
+    def _lookup_done(self, future) -> None:
+        with self._lock:
+            if future in self._pending:
+                self._pending.remove(future)
+            callbacks = self._on_enriched if not self._pending else []
+            if callbacks:
+                self._on_enriched = []
+
+        for callback in callbacks:
+            callback()
+
+    def when_enriched(self, callback: Callable[[], None]) -> None:
+        """Run callback once every pending year lookup has finished (now, if none is pending)."""
+        with self._lock:
+            if self._pending:
+                self._on_enriched.append(callback)
+                return
+        callback()
+
+    def pending_years(self) -> int:
+        """Number of year lookups still running."""
+        with self._lock:
+            return len(self._pending)
+
+    def wait_for_years(self, timeout: Optional[float] = YEAR_LOOKUP_TIMEOUT) -> bool:
+        """Wait for pending year lookups, at most timeout seconds. Returns True if none is left."""
+        with self._lock:
+            pending = list(self._pending)
+        if pending:
+            wait(pending, timeout=timeout)
+        with self._lock:
+            return not self._pending
+
     def get(self, index: int) -> Entries:
         return self.media_list[index]
     
     def clear(self) -> None:
+        """Drop the entries and forget their lookups, late results no longer fire callbacks."""
         self.media_list.clear()
+        with self._lock:
+            self._pending = []
+            self._on_enriched = []
 
     def __len__(self) -> int:
         return len(self.media_list)
@@ -192,9 +246,7 @@ class EntriesManager:
         """
         Calculate fuzzy match scores for each media item based on the query and sort by score descending.
         """
-        query_lower = query.lower()
-        for media in self.media_list:
-            title = getattr(media, 'name', '')
-            score = 0 if title is None else difflib.SequenceMatcher(None, query_lower, title.lower()).ratio()
+        ranked = rank(query, self.media_list, key=lambda media: getattr(media, 'name', ''))
+        for media, score in ranked:
             setattr(media, 'score', score)
-        self.media_list.sort(key=lambda x: getattr(x, 'score', 0), reverse=True)
\ No newline at end of file
+        self.media_list[:] = [media for media, _ in ranked]
@@ -0,0 +1,180 @@
+# 19.10.26
+
+import json
+import time
+import logging
+import threading
+import unicodedata
+from contextlib import contextmanager
+try:
+    import sqlite3
+    SQLITE3_AVAILABLE = True
+except Exception:
+    SQLITE3_AVAILABLE = False
+from typing import Callable, Iterator, List, Optional, Tuple
+
+
+# Internal utilities
+from StreamingCommunity.utils import config_manager, os_manager
+
+
+# Logic
+from .object import Entries, EntriesManager
+
+
+# Config
+SEARCH_CACHE_TTL = config_manager.config.get_int('DEFAULT', 'search_cache_ttl', default=3600)
+MAX_ENTRY_AGE = 30 * 24 * 3600
+SEARCH_CACHE_FILE = 'search_cache.db'
+
+
+def normalize_query(query: str) -> str:
+    """Lower case, NFKC and single spaces, so trivially different queries share an entry."""
+    return " ".join(unicodedata.normalize('NFKC', query or '').lower().split())
+
+
+class SearchCache:
+    def __init__(self, db_path: Optional[str] = None, ttl: int = SEARCH_CACHE_TTL):
+        """
+        SQLite cache of site search results keyed by site, normalized query and language.
+
+        Fresh entries (younger than ttl) are returned as they are. Stale entries are returned
+        immediately too, while a background thread repeats the search and updates the entry.
+
+        Parameters:
+            - db_path (Optional[str]): SQLite file, defaults to .cache/search_cache.db.
+            - ttl (int): Seconds an entry stays fresh, 0 disables the cache.
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator["sqlite3.Connection"]:
+        """Open a connection for one transaction, committed on success and always closed."""
+        if self.db_path is None:
+            self.db_path = os_manager.get_cache_path(SEARCH_CACHE_FILE)
+
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            if not self._initialized:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS search_cache (
+                        site TEXT NOT NULL,
+                        query TEXT NOT NULL,
+                        language TEXT NOT NULL,
+                        results TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        PRIMARY KEY (site, query, language)
+                    )
+                """)
+                conn.commit()
+                self._initialized = True
+
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, site: str, query: str, language: str = '') -> Optional[Tuple[List[dict], float]]:
+        """Return (results, age in seconds) or None if the search was never cached."""
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT results, created_at FROM search_cache WHERE site = ? AND query = ? AND language = ?",
+                    (site, normalize_query(query), language)
+                ).fetchone()
+        except Exception as e:
+            logging.warning(f"Search cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        age = time.time() - row[1]
+        if age > MAX_ENTRY_AGE:
+            return None
+        return json.loads(row[0]), age
+
+    def put(self, site: str, query: str, results: List[dict], language: str = ''):
+        try:
+            with self._lock, self._connect() as conn:
+                now = time.time()
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_cache (site, query, language, results, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (site, normalize_query(query), language, json.dumps(results, default=str), now)
+                )
+                conn.execute("DELETE FROM search_cache WHERE created_at < ?", (now - MAX_ENTRY_AGE,))
+        except Exception as e:
+            logging.warning(f"Search cache write failed: {e}")
+
+    def clear(self):
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute("DELETE FROM search_cache")
+        except Exception as e:
+            logging.warning(f"Search cache clear failed: {e}")
+
+    @staticmethod
+    def _to_manager(results: List[dict]) -> EntriesManager:
+        manager = EntriesManager()
+
+        # Cached entries already went through add(), skip the year lookup
+        manager.media_list = [Entries(**item) for item in results]
+        return manager
+
+    def _store(self, site: str, query: str, language: str, manager: EntriesManager):
+        # An empty answer is more often a site error than a real miss, keep the old entry
+        if len(manager) > 0:
+            # Store once the background year lookups have filled the entries
+            manager.when_enriched(lambda: self.put(site, query, [media.to_dict() for media in manager.media_list], language))
+
+    def _refresh(self, site: str, query: str, language: str, fetch: Callable[[], EntriesManager]):
+        key = (site, normalize_query(query), language)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self._store(site, query, language, fetch())
+            except Exception as e:
+                logging.warning(f"Background search refresh failed for {site} '{query}': {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"search-refresh-{site}", daemon=True).start()
+
+    def search(self, site: str, query: str, fetch: Callable[[], EntriesManager], language: str = '') -> EntriesManager:
+        """
+        Return the results of fetch() for this search, from the cache when possible.
+
+        Parameters:
+            - site (str): Site name.
+            - query (str): The query as typed.
+            - fetch (callable): Runs the real search and returns a new EntriesManager.
+            - language (str): Language of the search, if the site has one.
+        """
+        if self.ttl <= 0 or not site or not SQLITE3_AVAILABLE:
+            return fetch()
+
+        cached = self.get(site, query, language)
+        if cached is not None:
+            results, age = cached
+            if age > self.ttl:
+                logging.info(f"Stale search cache for {site} '{query}' ({int(age)}s), refreshing in background")
+                self._refresh(site, query, language, fetch)
+            return self._to_manager(results)
+
+        manager = fetch()
+        self._store(site, query, language, manager)
+        return manager
+
+
+# Initialize
+search_cache = SearchCache()
@@ -1,5 +1,7 @@
 # 01.10.25 
 
+import threading
+from contextlib import contextmanager
 from typing import Callable, Optional, Dict, Any
 
 
@@ -10,6 +12,7 @@ from rich.prompt import Prompt
 
 # Internal utilities
 from StreamingCommunity.services._base import Entries, EntriesManager
+from StreamingCommunity.services._base.search_cache import search_cache
 from StreamingCommunity.utils import TVShowManager
 
 
@@ -18,6 +21,20 @@ console = Console()
 msg = Prompt()
 available_colors = ['red', 'magenta', 'yellow', 'cyan', 'green', 'blue', 'white']
 column_to_hide = ['Slug', 'Sub_ita', 'First_air_date', 'Seasons_count', 'Url', 'Image', 'Path_id', 'Score']
+_search_local = threading.local()
+
+
+@contextmanager
+def live_year_updates(callback: Callable[[Entries], None]):
+    """
+    Within this block, get_onlyDatabase searches of the current thread return without waiting
+    for the year lookups; callback(media) runs from the lookup thread as each year arrives.
+    """
+    _search_local.on_year = callback
+    try:
+        yield
+    finally:
+        _search_local.on_year = None
 
 
 def get_select_title(table_show_manager, media_search_manager): 
@@ -37,7 +54,10 @@ def get_select_title(table_show_manager, media_search_manager):
     if not media_search_manager.media_list:
         console.print("\n[red]No media items available.")
         return None
-    
+
+    # Year lookups run in the background since add(), the ones still running show as "..."
+    years_pending = media_search_manager.pending_years() > 0
+
     first_media_item = media_search_manager.media_list[0]
     column_info = {"Index": {'color': available_colors[0]}}
 
@@ -68,7 +88,8 @@ def get_select_title(table_show_manager, media_search_manager):
         for key in first_media_item.__dict__.keys():
             if key.capitalize() in column_to_hide:
                 continue
-            media_dict[key.capitalize()] = str(getattr(media, key))
+            value = str(getattr(media, key))
+            media_dict[key.capitalize()] = "..." if key == 'year' and value == "9999" and years_pending else value
         table_show_manager.add_tv_show(media_dict)
 
     while True:
@@ -84,6 +105,9 @@ def get_select_title(table_show_manager, media_search_manager):
             
             if 0 <= selected_index < len(media_search_manager.media_list):
                 table_show_manager.clear()
+
+                # The year names the output folder, let a late lookup finish (bounded)
+                media_search_manager.wait_for_years()
                 return media_search_manager.get(selected_index)
             else:
                 console.print("\n[red]Invalid or out-of-range index. Please try again.")
@@ -159,16 +183,54 @@ def base_process_search_result(select_title: Optional[Entries], download_film_fu
         return False
 
 
-def base_search(title_search_func: Callable[[str], int], process_result_func: Callable[[Optional[Entries], Optional[Dict[str, str]], Optional[Any]], bool], media_search_manager: EntriesManager, table_show_manager: TVShowManager,
+def search_titles(title_search_func: Callable[[str, Optional[EntriesManager]], int], query: str, site_name: Optional[str] = None, language: str = '') -> EntriesManager:
+    """
+    Run a site title search into a new EntriesManager, sorted by fuzzy score.
+
+    With a site name the results go through the search cache: within search_cache_ttl they
+    come from disk, after it the stale results are returned while a background search refreshes them.
+    Missing years are looked up concurrently. Inside live_year_updates the results are returned at
+    once and late years go to its callback; otherwise callers copy the entries, so wait for them (bounded).
+
+    Parameters:
+        title_search_func (callable): The title_search function of a site.
+        query (str): The query to search for.
+        site_name (str, optional): Site of the search, enables the cache.
+        language (str, optional): Language of the search, part of the cache key.
+
+    Returns:
+        EntriesManager: Results of this call only.
+    """
+    def fetch() -> EntriesManager:
+        results = EntriesManager()
+        title_search_func(query, results)
+        results.sort_by_fuzzy_score(query)
+        return results
+
+    if not site_name:
+        results = fetch()
+    else:
+        results = search_cache.search(site_name, query, fetch, language)
+        results.sort_by_fuzzy_score(query)
+
+    on_year = getattr(_search_local, 'on_year', None)
+    if on_year is None:
+        results.wait_for_years()
+    else:
+        results.on_update = on_year
+    return results
+
+
+def base_search(title_search_func: Callable[[str, Optional[EntriesManager]], int], process_result_func: Callable[[Optional[Entries], Optional[Dict[str, str]], Optional[Any]], bool], media_search_manager: EntriesManager, table_show_manager: TVShowManager,
     site_name: str, string_to_search: Optional[str] = None, get_onlyDatabase: bool = False, direct_item: Optional[Dict[str, Any]] = None, selections: Optional[Dict[str, str]] = None, scrape_serie: Optional[Any] = None
 ) -> Any:
     """
     Generalized search function for streaming sites.
     
     Parameters:
-        title_search_func (callable): Function that performs the actual search and returns number of results
+        title_search_func (callable): Function that fills the given container and returns the number of results
         process_result_func (callable): Function that processes the selected result
-        media_search_manager (EntriesManager): Manager for media search results
+        media_search_manager (EntriesManager): Manager for media search results of the interactive CLI
         table_show_manager (TVShowManager): Manager for displaying results
         site_name (str): Name of the site being searched
         string_to_search (str, optional): String to search for. Can be passed from run.py.
@@ -180,6 +242,9 @@ def base_search(title_search_func: Callable[[str], int], process_result_func: Ca
     
     Returns:
         EntriesManager if get_onlyDatabase=True, bool otherwise
+
+    With get_onlyDatabase=True every call fills and returns a new EntriesManager, so concurrent
+    searches on the same site (GUI, global search) never share results.
     """
     # Handle direct item processing
     if direct_item:
@@ -194,8 +259,14 @@ def base_search(title_search_func: Callable[[str], int], process_result_func: Ca
     else:
         actual_search_query = msg.ask(f"\n[purple]Insert a word to search in [green]{site_name}").strip()
 
+    # If only the database is needed, search into a container owned by this call
+    if get_onlyDatabase:
+        if not actual_search_query:
+            return False
+        return search_titles(title_search_func, actual_search_query, site_name)
+
     # Search on database
-    len_database = title_search_func(actual_search_query)
+    len_database = title_search_func(actual_search_query, media_search_manager)
     
     # Sort results by fuzzy score
     media_search_manager.sort_by_fuzzy_score(actual_search_query)
@@ -204,10 +275,6 @@ def base_search(title_search_func: Callable[[str], int], process_result_func: Ca
     if not actual_search_query:
         return False
     
-    # If only the database is needed, return the manager
-    if get_onlyDatabase:
-        return media_search_manager
-    
     # Process results
     if len_database > 0:
         select_title = get_select_title(table_show_manager, media_search_manager)
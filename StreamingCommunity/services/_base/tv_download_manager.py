@@ -1,6 +1,10 @@
 # 19.06.24
 
-from typing import Callable, Any, Optional
+import queue
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Any, List, Optional
 
 
 # External library
@@ -9,12 +13,15 @@ from rich.prompt import Prompt
 
 
 # Internal utilities
+from StreamingCommunity.utils import config_manager
 from StreamingCommunity.services._base.tv_display_manager import manage_selection, validate_selection, display_episodes_list, display_seasons_list
 from StreamingCommunity.source.utils.tracker import download_tracker, context_tracker
 
 
 # Variable
 console = Console()
+PIPELINE_DEPTH = config_manager.config.get_int('DOWNLOAD', 'pipeline_depth', default=1)
+MAX_PARALLEL_EPISODES = config_manager.config.get_int('DOWNLOAD', 'max_parallel_episodes', default=1)
 
 
 def _is_user_stop_requested() -> bool:
@@ -24,7 +31,212 @@ def _is_user_stop_requested() -> bool:
     download_id = context_tracker.download_id
     if not download_id:
         return False
-    return download_tracker.is_stopped(download_id)
+    return download_tracker.was_cancelled(download_id)
+
+
+class EpisodePipeline:
+    def __init__(self, season_number: int, depth: int = 1):
+        """
+        Two stage pipeline for series downloads: the calling thread downloads episode N+1
+        while a worker thread muxes episode N, writes its NFO and runs its hooks.
+
+        The queue is bounded, so at most `depth` downloaded episodes wait for muxing and
+        the downloads never run far ahead of the disk.
+
+        Parameters:
+            - season_number (int): Season being downloaded, used in messages.
+            - depth (int): Maximum number of episodes waiting for post-processing.
+        """
+        self.season_number = season_number
+        self.jobs = queue.Queue(maxsize=max(1, depth))
+        self.stop_event = threading.Event()
+        self.worker = threading.Thread(target=self._run, name=f"post-process-s{season_number}", daemon=True)
+        self.worker.start()
+
+    @property
+    def stopped(self) -> bool:
+        return self.stop_event.is_set()
+
+    def submit(self, i_episode: int, download_id: Optional[str], output_path: str, job: Callable):
+        """Queue the post-processing of a downloaded episode, blocking while the queue is full."""
+        while not self.stop_event.is_set():
+            try:
+                self.jobs.put((i_episode, download_id, job), timeout=0.5)
+                return output_path, False
+            except queue.Full:
+                continue
+
+        self._cancel_job(download_id)
+        return None, True
+
+    def stop(self):
+        """Stop after the episode being muxed, queued episodes are marked as cancelled."""
+        self.stop_event.set()
+
+    def close(self, cancel: bool = False):
+        """Wait for the queued episodes to be processed (or cancelled) and stop the worker."""
+        if cancel:
+            self.stop()
+        self.jobs.put(None)
+        self.worker.join()
+
+    @staticmethod
+    def _cancel_job(download_id: Optional[str]):
+        if download_id:
+            download_tracker.complete_download(download_id, success=False, error="cancelled")
+
+    def _run(self):
+        while True:
+            item = self.jobs.get()
+            if item is None:
+                return
+
+            i_episode, download_id, job = item
+            if self.stop_event.is_set():
+                self._cancel_job(download_id)
+                continue
+
+            # FFmpeg runners started by the job report to this episode
+            context_tracker.download_id = download_id
+            try:
+                _, stopped = job()
+            except Exception as e:
+                logging.exception(f"Post-processing failed for episode {i_episode}: {e}")
+                stopped = True
+
+            if stopped:
+                if download_id and download_tracker.was_cancelled(download_id):
+                    self.stop_event.set()
+                else:
+                    console.print(f"[yellow]Warning: episode {i_episode} failed for season {self.season_number} while muxing.")
+
+
+def _download_episodes_parallel(episodes: List[Any], index_season_selected: int, list_episode_select: List[int], download_video_callback: Callable, workers: int) -> None:
+    """
+    Download the selected episodes with a pool of workers, reporting results in episode order.
+
+    Each worker gets its own tracked id and splits the thread/connection/speed budget with the
+    others (context_tracker.parallel_share). Resolving an episode (scraper, player, playlist)
+    runs under a shared lock released by the downloader when the transfer starts, because the
+    service callbacks share scraper and player objects between episodes.
+    """
+    base_download_id = context_tracker.download_id
+    site_name = context_tracker.site_name
+    media_type = context_tracker.media_type
+    resolve_lock = threading.Lock()
+    stop_event = threading.Event()
+
+    def run_episode(i_episode: int):
+        if stop_event.is_set():
+            return None, True, True
+
+        resolve_lock.acquire()
+        released = threading.Event()
+
+        def release_resolve():
+            if not released.is_set():
+                released.set()
+                resolve_lock.release()
+
+        context_tracker.download_id = f"{base_download_id}_e{i_episode}" if base_download_id else None
+        context_tracker.site_name = site_name
+        context_tracker.media_type = media_type
+        context_tracker.parallel_share = workers
+        context_tracker.on_download_start = release_resolve
+
+        try:
+            if stop_event.is_set():
+                return None, True, True
+
+            path, stopped = download_video_callback(episodes[i_episode-1], index_season_selected, i_episode)
+            cancelled = bool(stopped) and _is_user_stop_requested()
+            if cancelled:
+                stop_event.set()
+            return path, stopped, cancelled
+        
+        finally:
+            release_resolve()
+            context_tracker.on_download_start = None
+            context_tracker.parallel_share = 1
+            context_tracker.download_id = None
+
+    console.print(f"\n[cyan]Downloading [yellow]{len(list_episode_select)} [cyan]episodes of season [yellow]{index_season_selected} [cyan]with [yellow]{workers} [cyan]parallel workers")
+    completed, failed = 0, 0
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"episode-s{index_season_selected}") as executor:
+        futures = [(i_episode, executor.submit(run_episode, i_episode)) for i_episode in list_episode_select]
+
+        try:
+            for i_episode, future in futures:
+                try:
+                    path, stopped, cancelled = future.result()
+                except Exception as e:
+                    logging.exception(f"Episode {i_episode} failed: {e}")
+                    path, stopped, cancelled = None, True, False
+
+                if cancelled:
+                    console.print(f"[yellow]Episode {i_episode} cancelled.")
+                elif stopped:
+                    failed += 1
+                    console.print(f"[yellow]Warning: episode {i_episode} failed for season {index_season_selected}.")
+                else:
+                    completed += 1
+                    console.print(f"[green]Episode {i_episode} completed: [cyan]{path}")
+
+        except BaseException:
+            stop_event.set()
+            for _, future in futures:
+                future.cancel()
+            raise
+
+    console.print(f"[cyan]Season [yellow]{index_season_selected}: [green]{completed} [cyan]completed, [red]{failed} [cyan]failed")
+
+
+def _download_episodes(episodes: List[Any], index_season_selected: int, list_episode_select: List[int], download_video_callback: Callable) -> None:
+    """Download the selected episodes, overlapping each download with the muxing of the previous one."""
+    if MAX_PARALLEL_EPISODES > 1 and len(list_episode_select) > 1:
+        workers = min(MAX_PARALLEL_EPISODES, len(list_episode_select))
+        _download_episodes_parallel(episodes, index_season_selected, list_episode_select, download_video_callback, workers)
+        return
+
+    if PIPELINE_DEPTH <= 0 or len(list_episode_select) < 2:
+        for i_episode in list_episode_select:
+            path, stopped = download_video_callback(episodes[i_episode-1], index_season_selected, i_episode)
+            
+            if stopped:
+                if _is_user_stop_requested():
+                    break
+                console.print(f"[yellow]Warning: episode {i_episode} failed for season {index_season_selected}. Continuing with next episode.")
+        return
+
+    # Every episode gets its own tracked id, two of them are alive at the same time
+    base_download_id = context_tracker.download_id
+    pipeline = EpisodePipeline(index_season_selected, PIPELINE_DEPTH)
+    cancelled = True
+
+    try:
+        for i_episode in list_episode_select:
+            if pipeline.stopped:
+                break
+
+            episode_download_id = f"{base_download_id}_e{i_episode}" if base_download_id else None
+            context_tracker.download_id = episode_download_id
+            context_tracker.post_processor = lambda output_path, job, i=i_episode, d=episode_download_id: pipeline.submit(i, d, output_path, job)
+
+            path, stopped = download_video_callback(episodes[i_episode-1], index_season_selected, i_episode)
+
+            if stopped:
+                if _is_user_stop_requested():
+                    break
+                if not pipeline.stopped:
+                    console.print(f"[yellow]Warning: episode {i_episode} failed for season {index_season_selected}. Continuing with next episode.")
+
+        cancelled = pipeline.stopped
+
+    finally:
+        context_tracker.post_processor = None
+        context_tracker.download_id = base_download_id
+        pipeline.close(cancel=cancelled)
 
 
 def process_season_selection(scrape_serie: Any, seasons_count: int, season_selection: Optional[str], episode_selection: Optional[str], download_episode_callback: Callable) -> None:
@@ -121,14 +333,7 @@ def process_episode_download(index_season_selected: int, scrape_serie: Any, down
         return
     
     if download_all:
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video_callback(episodes[i_episode-1], index_season_selected, i_episode)
-            
-            if stopped:
-                if _is_user_stop_requested():
-                    break
-                console.print(f"[yellow]Warning: episode {i_episode} failed for season {index_season_selected}. Continuing with next episode.")
-        
+        _download_episodes(episodes, index_season_selected, list(range(1, episodes_count + 1)), download_video_callback)
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
     
     else:
@@ -186,10 +391,4 @@ def process_episode_download(index_season_selected: int, scrape_serie: Any, down
             last_command = Prompt.ask("[red]Enter valid episode numbers or indices")
 
         # Download selected episodes if not stopped
-        for i_episode in list_episode_select:
-            path, stopped = download_video_callback(episodes[i_episode-1], index_season_selected, i_episode)
-            
-            if stopped:
-                if _is_user_stop_requested():
-                    break
-                console.print(f"[yellow]Warning: episode {i_episode} failed for season {index_season_selected}. Continuing with next episode.")
+        _download_episodes(episodes, index_season_selected, list_episode_select, download_video_callback)
@@ -50,12 +50,12 @@ def get_real_title(record: dict) -> str:
     else:
         return record.get('title_it', '')
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Perform anime search on animeunity.so.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
     seen_titles = set()
     user_agent = get_userAgent()
     data = get_token(user_agent)
@@ -76,7 +76,7 @@ def title_search(query: str) -> int:
     try:
         response1 = create_client_curl(headers=headers).post(f'{site_constants.FULL_URL}/livesearch', cookies=cookies, data={'title': query})
         response1.raise_for_status()
-        process_results(response1.json().get('records', []), seen_titles, entries_manager)
+        process_results(response1.json().get('records', []), seen_titles, results)
 
     except Exception as e:
         console.print(f"[red]Site: {site_constants.SITE_NAME}, request search error: {e}")
@@ -97,12 +97,12 @@ def title_search(query: str) -> int:
         }
         response2 = create_client_curl(headers=headers).post(f'{site_constants.FULL_URL}/archivio/get-animes', cookies=cookies, json=json_data)
         response2.raise_for_status()
-        process_results(response2.json().get('records', []), seen_titles, entries_manager)
+        process_results(response2.json().get('records', []), seen_titles, results)
 
     except Exception as e:
         console.print(f"Site: {site_constants.SITE_NAME}, archivio search error: {e}")
 
-    result_count = len(entries_manager)
+    result_count = len(results)
     return result_count
 
 def process_results(records: list, seen_titles: set, entries_manager: EntriesManager) -> None:
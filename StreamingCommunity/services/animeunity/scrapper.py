@@ -1,13 +1,28 @@
 # 01.03.24
 
+import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 
 # Internal utilities
-from StreamingCommunity.utils.http_client import create_client_curl, get_headers
+from StreamingCommunity.utils.http_client import get_headers, shared_request
 from StreamingCommunity.services._base.object import EpisodeManager, Episode
 
 
+# Variable
+CHUNK_SIZE = 120
+CHUNK_WORKERS = 6
+EPISODES_CACHE_TTL = 600
+_episodes_cache: Dict[Tuple[str, int], Tuple[float, List[dict]]] = {}
+_episodes_cache_lock = threading.Lock()
+
+# Long-lived, so each worker keeps its thread-local curl session between calls
+_chunk_executor = ThreadPoolExecutor(max_workers=CHUNK_WORKERS, thread_name_prefix="animeunity-episodes")
+
+
 class ScrapeSerieAnime:
     def __init__(self, url: str):
         """
@@ -45,36 +60,44 @@ class ScrapeSerieAnime:
             return len(self.episodes_cache)
         return None
     
+    def _fetch_chunk(self, start_range: int, end_range: int) -> List[dict]:
+        params = {
+            "start_range": start_range,
+            "end_range": end_range
+        }
+        response = shared_request("GET", f"{self.url}/info_api/{self.media_id}/1", params=params, headers=self.headers, kind="curl")
+        response.raise_for_status()
+        return response.json().get("episodes", [])
+
     def _fetch_all_episodes(self):
         """
-        Fetch all episodes data at once and cache it
+        Fetch all episodes data at once and cache it.
+        The chunks are requested concurrently once the count is known, and the list is kept for EPISODES_CACHE_TTL seconds per media.
         """
+        cache_key = (self.url, self.media_id)
+        with _episodes_cache_lock:
+            cached = _episodes_cache.get(cache_key)
+        if cached and time.time() - cached[0] < EPISODES_CACHE_TTL:
+            self.episodes_cache = cached[1]
+            return
+
         try:
             # Get initial episode count
-            response = create_client_curl(headers=self.headers).get(f"{self.url}/info_api/{self.media_id}/")
+            response = shared_request("GET", f"{self.url}/info_api/{self.media_id}/", headers=self.headers, kind="curl")
             response.raise_for_status()
             initial_count = response.json()["episodes_count"]
-            
+
+            ranges = [(start, min(start + CHUNK_SIZE - 1, initial_count)) for start in range(1, initial_count + 1, CHUNK_SIZE)]
+
+            # Fetch episodes in chunks, map() keeps them in order
             all_episodes = []
-            start_range = 1
-            
-            # Fetch episodes in chunks
-            while start_range <= initial_count:
-                end_range = min(start_range + 119, initial_count)
-
-                params={
-                    "start_range": start_range,
-                    "end_range": end_range
-                }
-                
-                response = create_client_curl(headers=self.headers).get(f"{self.url}/info_api/{self.media_id}/1", params=params)
-                response.raise_for_status()
-
-                chunk_episodes = response.json().get("episodes", [])
+            for chunk_episodes in _chunk_executor.map(lambda r: self._fetch_chunk(*r), ranges):
                 all_episodes.extend(chunk_episodes)
-                start_range = end_range + 1
             
             self.episodes_cache = all_episodes
+            with _episodes_cache_lock:
+                _episodes_cache[cache_key] = (time.time(), all_episodes)
+
         except Exception as e:
             logging.error(f"Error fetching all episodes: {e}")
             self.episodes_cache = None
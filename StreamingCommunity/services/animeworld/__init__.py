@@ -29,18 +29,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Function to perform an anime search using a provided title.
 
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         - int: A number containing the length of media search manager.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     search_url = f"{site_constants.FULL_URL}/search?keyword={query}"
     console.print(f"[cyan]Search url: [yellow]{search_url}")
@@ -73,7 +74,7 @@ def title_search(query: str) -> int:
                 elif status_div.find('div', class_='ona'):
                     anime_type = 'ONA'
 
-                entries_manager.add(Entries(
+                results.add(Entries(
                     name=title,
                     type=anime_type,
                     DUB=is_dubbed,
@@ -84,7 +85,7 @@ def title_search(query: str) -> int:
         except Exception as e:
             print(f"Error parsing a film entry: {e}")
 
-    return len(entries_manager)
+    return len(results)
 
 
 
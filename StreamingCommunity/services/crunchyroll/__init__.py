@@ -26,18 +26,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles based on a search query.
       
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         int: The number of titles found.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     if not config_manager.login.get('crunchyroll','device_id') or not config_manager.login.get('crunchyroll','etp_rt'):
         raise Exception("device_id or etp_rt is missing or empty in config.json.")
@@ -113,7 +114,7 @@ def title_search(query: str) -> int:
                 if poster_wide and len(poster_wide) > 0:
                     poster_image = poster_wide[0][-1].get("source")
 
-            entries_manager.add(Entries(
+            results.add(Entries(
                 id=item_id,
                 name=title,
                 type=tipo,
@@ -121,7 +122,7 @@ def title_search(query: str) -> int:
                 image=poster_image
             ))
 
-    return len(entries_manager)
+    return len(results)
 
 
 
@@ -28,18 +28,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles on Discovery+
     
     Parameters:
         query (str): Search query
+        media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI
         
     Returns:
         int: Number of results found
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     if not check_region_availability(_region, site_constants.SITE_NAME):
         return 0
@@ -95,7 +96,7 @@ def title_search(query: str) -> int:
             if premiere_date:
                 year = premiere_date.split('-')[0] if '-' in premiere_date else None
             
-            entries_manager.add(Entries(
+            results.add(Entries(
                 id=attrs.get('alternateId'),
                 name=attrs.get('name'),
                 type='tv',
@@ -124,7 +125,7 @@ def title_search(query: str) -> int:
             if air_date:
                 year = air_date[:4] if len(air_date) >= 4 else None
             
-            entries_manager.add(Entries(
+            results.add(Entries(
                 id=element.get('id'),
                 name=attrs.get('name'),
                 type='movie',
@@ -132,7 +133,7 @@ def title_search(query: str) -> int:
                 year=year
             ))
     
-    return len(entries_manager)
+    return len(results)
 
 
 # WRAPPING FUNCTIONS
@@ -27,18 +27,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles on Discovery+
     
     Parameters:
         query (str): Search query
+        media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI
         
     Returns:
         int: Number of results found
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     if not check_region_availability(_region, site_constants.SITE_NAME):
         return 0
@@ -81,7 +82,7 @@ def title_search(query: str) -> int:
                     date = attributes.get('airDate', '').split("T")[0]
                 
                 combined_id = f"{element.get('id')}|{attributes.get('alternateId')}"
-                entries_manager.add(Entries(
+                results.add(Entries(
                     id=combined_id,
                     name=attributes.get('name', 'No Title'),
                     type='tv' if element_type == 'show' else 'movie',
@@ -89,7 +90,7 @@ def title_search(query: str) -> int:
                     year=date
                 ))
     
-    return len(entries_manager)
+    return len(results)
 
 
 
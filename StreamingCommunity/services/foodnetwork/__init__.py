@@ -27,18 +27,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles based on a search query.
       
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         int: The number of titles found.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     if not check_region_availability(_region, site_constants.SITE_NAME):
         return 0
@@ -69,7 +70,7 @@ def title_search(query: str) -> int:
         data = response.json()
 
     for dict_title in data:
-        entries_manager.add(Entries(
+        results.add(Entries(
             name=dict_title.get('title'),
             type='tv',
             year=dict_title.get('dateLastModified').split('-')[0],
@@ -77,7 +78,7 @@ def title_search(query: str) -> int:
             url=f'https://public.aurora.enhanced.live/site/page/{str(dict_title.get("slug")).lower().replace(" ", "-")}/?include=default&filter[environment]=foodnetwork&v=2&parent_slug={dict_title.get("parentSlug")}',
         ))
 	
-    return len(entries_manager)
+    return len(results)
 
 
 
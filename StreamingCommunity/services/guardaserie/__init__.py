@@ -29,18 +29,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles based on a search query.
 
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         - int: The number of titles found.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     search_url = f"{site_constants.FULL_URL}/?story={query}&do=search&subaction=search"
     console.print(f"[cyan]Search url: [yellow]{search_url}")
@@ -57,7 +58,7 @@ def title_search(query: str) -> int:
 
     for serie_div in soup.find_all('div', class_='mlnew'):
         try:
-            entries_manager.add(Entries(
+            results.add(Entries(
                 name=serie_div.find('a').get("title").replace("streaming guardaserie", ""),
                 type='tv',
                 url=serie_div.find('a').get("href"),
@@ -67,7 +68,7 @@ def title_search(query: str) -> int:
         except Exception as e:
             print(f"Error parsing a film entry: {e}")
 
-    return len(entries_manager)
+    return len(results)
 
 
 
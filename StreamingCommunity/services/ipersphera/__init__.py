@@ -29,18 +29,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles based on a search query.
       
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         int: The number of titles found.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     search_url = f"https://www.ipersphera.com/?s={query}"
     console.print(f"[cyan]Search url: [yellow]{search_url}")
@@ -79,13 +80,13 @@ def title_search(query: str) -> int:
             if "serie" in categs_text or "tv" in categs_text:
                 tipo = "tv"
 
-        entries_manager.add(Entries(
+        results.add(Entries(
             url=url,
             name=title,
             type=tipo
         ))
 
-    return len(entries_manager)
+    return len(results)
 
 
 
@@ -9,7 +9,7 @@ from rich.prompt import Prompt
 
 # Internal utilities
 from StreamingCommunity.utils import TVShowManager
-from StreamingCommunity.utils.http_client import create_client, check_region_availability
+from StreamingCommunity.utils.http_client import check_region_availability, shared_request
 from StreamingCommunity.services._base import site_constants, EntriesManager, Entries
 from StreamingCommunity.services._base.site_search_manager import base_process_search_result, base_search
 
@@ -30,18 +30,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles based on a search query.
       
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         int: The number of titles found.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     if not check_region_availability(_region, site_constants.SITE_NAME):
         return 0
@@ -56,7 +57,7 @@ def title_search(query: str) -> int:
     }
     
     try:
-        response = create_client(headers=class_mediaset_api.generate_request_headers()).get(search_url, params=params)
+        response = shared_request("GET", search_url, params=params, headers=class_mediaset_api.generate_request_headers())
         response.raise_for_status()
     except Exception as e:
         console.print(f"[red]Site: {site_constants.SITE_NAME}, request search error: {e}")
@@ -98,7 +99,7 @@ def title_search(query: str) -> int:
         if vertical_image.get("r", ""):
             image_url += f"?r={vertical_image.get('r', '')}"
         
-        entries_manager.add(Entries(
+        results.add(Entries(
             id=item.get("guid", ""),
             name=item.get("cardTitle", "No Title"),
             type=item_type,
@@ -107,7 +108,7 @@ def title_search(query: str) -> int:
             url=item.get("cardLink", {}).get("value", "")
         ))
 
-    return len(entries_manager)
+    return len(results)
 
 
 
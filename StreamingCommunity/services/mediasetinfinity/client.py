@@ -12,7 +12,7 @@ from rich.console import Console
 
 # Internal utilities
 from StreamingCommunity.utils import config_manager
-from StreamingCommunity.utils.http_client import create_client, create_client_curl, get_headers, get_userAgent
+from StreamingCommunity.utils.http_client import get_headers, get_userAgent, shared_request
 
 
 # Variable
@@ -58,11 +58,11 @@ class MediasetAPI:
             'appName': self.app_name,
             'client_id': self.client_id,
         }
-        response = create_client(headers=self.headers).post('https://api-ott-prod-fe.mediaset.net/PROD/play/idm/anonymous/login/v2.0', json=json_data)
+        response = shared_request("POST", 'https://api-ott-prod-fe.mediaset.net/PROD/play/idm/anonymous/login/v2.0', json=json_data, headers=self.headers)
         return response.json()['response']['beToken']
 
     def fetch_html(self):
-        response = create_client_curl(headers=self.headers).get("https://mediasetinfinity.mediaset.it/")
+        response = shared_request("GET", "https://mediasetinfinity.mediaset.it/", headers=self.headers, kind="curl")
         response.raise_for_status()
         return response.text
 
@@ -126,7 +126,7 @@ def get_playback_url(CONTENT_ID):
     }
 
     try:
-        response = create_client(headers=headers).post('https://api-ott-prod-fe.mediaset.net/PROD/play/playback/check/v2.0', json=json_data)
+        response = shared_request("POST", 'https://api-ott-prod-fe.mediaset.net/PROD/play/playback/check/v2.0', json=json_data, headers=headers)
         response.raise_for_status()
         resp_json = response.json()
 
@@ -262,7 +262,7 @@ def get_tracking_info(PLAYBACK_JSON):
         params['publicUrl'] = PLAYBACK_JSON['publicUrl']
 
     try:
-        response = create_client(headers={'user-agent': get_userAgent()}).get(PLAYBACK_JSON['url'], params=params)
+        response = shared_request("GET", PLAYBACK_JSON['url'], params=params, headers={'user-agent': get_userAgent()})
         response.raise_for_status()
 
         results = parse_smil_for_media_info(response.text)
@@ -13,7 +13,7 @@ from rich.prompt import Prompt
 
 # Internal utilities
 from StreamingCommunity.utils import os_manager, config_manager, start_message
-from StreamingCommunity.utils.http_client import create_client
+from StreamingCommunity.utils.http_client import shared_request
 from StreamingCommunity.services._base import site_constants, Entries
 from StreamingCommunity.services._base.tv_display_manager import map_movie_title, map_episode_title, map_season_name
 from StreamingCommunity.services._base.tv_download_manager import process_season_selection, process_episode_download
@@ -66,7 +66,7 @@ def try_mpd(url, qualities):
         mpd_url = urlunparse(parsed._replace(path=new_path)).strip()
 
         try:
-            r = create_client().head(mpd_url)
+            r = shared_request("HEAD", mpd_url)
             if r.status_code == 200:
                 return mpd_url
         except Exception:
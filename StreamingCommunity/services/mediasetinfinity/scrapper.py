@@ -4,7 +4,9 @@ import re
 import time
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, quote
+from typing import Any, Dict, List
 
 
 # External libraries
@@ -12,10 +14,89 @@ from bs4 import BeautifulSoup
 
 
 # Internal utilities
-from StreamingCommunity.utils.http_client import create_client_curl, get_userAgent, get_headers
+from StreamingCommunity.utils.http_client import get_userAgent, get_headers, shared_request
 from StreamingCommunity.services._base.object import SeasonManager, Episode, Season
 
 
+# Variable
+SEASON_WORKERS = 6
+VIDEO_URL_PREFIX = "https://mediasetinfinity.mediaset.it/video/"
+
+# Long-lived, so each worker keeps its thread-local curl session between calls
+_season_executor = ThreadPoolExecutor(max_workers=SEASON_WORKERS, thread_name_prefix="mediaset-season")
+
+
+def _walk(node: Any):
+    """Yield every dict of a decoded JSON tree."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def _flatten(item: Dict[str, Any]) -> Dict[str, Any]:
+    """First value of every key in a dict and its children, in document order."""
+    flat = {}
+    for node in _walk(item):
+        for key, value in node.items():
+            if key not in flat and not isinstance(value, (dict, list)):
+                flat[key] = value
+            if key == 'url' and isinstance(value, str) and value.startswith(VIDEO_URL_PREFIX):
+                flat.setdefault('video_url', value)
+    return flat
+
+
+def parse_rsc_video_items(text: str) -> List[Dict[str, Any]]:
+    """
+    Decode an RSC payload once and return the flattened VideoItem objects it contains.
+
+    Every payload line is "<id>:<json>"; lines that are not JSON (module references, text chunks) are skipped.
+    """
+    items = []
+    for line in text.splitlines():
+        _, sep, payload = line.partition(':')
+        if not sep or not payload.startswith(('[', '{')) or '"VideoItem"' not in payload:
+            continue
+        try:
+            tree = json.loads(payload)
+        except ValueError:
+            continue
+
+        for node in _walk(tree):
+            if node.get('__typename') == 'VideoItem':
+                flat = _flatten(node)
+                if flat.get('video_url'):
+                    items.append(flat)
+    return items
+
+
+def _regex_video_items(text: str) -> List[Dict[str, Any]]:
+    """Fallback for payloads that are not line-delimited JSON."""
+    items = []
+    fields = {
+        'cardTitle': r'"cardTitle":"([^"]*?)"',
+        'description': r'"description":"([^"]*?)"',
+        'duration': r'"duration":(\d+)',
+        'guid': r'"guid":"([^"]*?)"',
+        'video_url': r'"url":"(https://mediasetinfinity\.mediaset\.it/video/[^"]*?)"'
+    }
+    pattern = r'"__typename":"VideoItem".*?"url":"https://mediasetinfinity\.mediaset\.it/video/[^"]*?"'
+    for match in re.finditer(pattern, text, re.DOTALL):
+        block = match.group(0)
+        item = {}
+        for key, regex in fields.items():
+            m = re.search(regex, block)
+            if m:
+                item[key] = int(m.group(1)) if key == 'duration' else m.group(1)
+        if item:
+            items.append(item)
+    return items
+
+
 class GetSerieInfo:
     BAD_WORDS = [
         'Trailer', 'Promo', 'Teaser', 'Clip', 'Backstage', 'Le interviste', 'BALLETTI', 'Anteprime web', 'I servizi', 'Video trend', 'Extra', 'Le trame della settimana', 'Esclusive',
@@ -31,13 +112,17 @@ class GetSerieInfo:
         """
         self.headers = get_headers()
         self.url = url
-        self.client = create_client_curl()
         self.seasons_manager = SeasonManager()
         self.serie_id = None
         self.public_id = None
         self.series_name = ""
         self.stagioni_disponibili = []
 
+    @staticmethod
+    def _get(url, **kwargs):
+        """GET through the shared curl session of the host (one per thread, so seasons can load concurrently)."""
+        return shared_request("GET", url, kind="curl", **kwargs)
+
     def _extract_serie_id(self):
         """Extract the series ID from the starting URL"""
         try:
@@ -60,7 +145,7 @@ class GetSerieInfo:
         try:
             params = {'byGuid': self.serie_id}
             url = f'https://feed.entertainment.tv.theplatform.eu/f/{self.public_id}/mediaset-prod-all-series-v2'
-            response = self.client.get(url, params=params, headers=self.headers)
+            response = self._get(url, params=params, headers=self.headers)
             if response.status_code == 200 and response.text.strip().startswith('{'):
                 return response.json()
             else:
@@ -134,47 +219,55 @@ class GetSerieInfo:
             season['page_url'] = page_url
 
     def _extract_season_sb_ids(self, stagioni_disponibili):
-        """Extract sb IDs from season pages"""
-        for season in stagioni_disponibili:
-            if not season.get('page_url'):
-                continue
-                
-            response_page = self.client.get(season['page_url'], headers={'User-Agent': get_userAgent()})
-            
-            if not response_page or response_page.status_code != 200:
-                logging.warning(f"Failed to fetch season page: {season.get('page_url')}")
-                continue
-                
-            print("Response for _extract_season_sb_ids:", response_page.status_code, " Season:", season['tvSeasonNumber'])
-            time.sleep(0.5)
-            soup = BeautifulSoup(response_page.text, 'html.parser')
+        """Extract sb IDs from season pages, all pages are fetched concurrently"""
+        seasons = [season for season in stagioni_disponibili if season.get('page_url')]
+        if not seasons:
+            return
+
+        list(_season_executor.map(self._extract_season_categories, seasons))
+
+    def _extract_season_categories(self, season):
+        """Fetch one season page and store its titleCarousel categories in season['categories']"""
+        try:
+            response_page = self._get(season['page_url'], headers={'User-Agent': get_userAgent()})
+        except Exception as e:
+            logging.warning(f"Failed to fetch season page: {season.get('page_url')}: {e}")
+            return
+
+        if not response_page or response_page.status_code != 200:
+            logging.warning(f"Failed to fetch season page: {season.get('page_url')}")
+            return
             
-            # Check for titleCarousel links (multiple categories)
-            carousel_links = soup.find_all('a', class_='titleCarousel')
+        print("Response for _extract_season_sb_ids:", response_page.status_code, " Season:", season['tvSeasonNumber'])
+        soup = BeautifulSoup(response_page.text, 'html.parser')
+        
+        # Check for titleCarousel links (multiple categories)
+        carousel_links = soup.find_all('a', class_='titleCarousel')
+        
+        if carousel_links:
+            print(f"Found {len(carousel_links)} titleCarousel categories")
+            categories = []
             
-            if carousel_links:
-                print(f"Found {len(carousel_links)} titleCarousel categories")
-                season['categories'] = []
-                
-                for carousel_link in carousel_links:
-                    if carousel_link.has_attr('href'):
-                        category_title = carousel_link.find('h2')
-                        category_name = category_title.text.strip() if category_title else 'Unnamed'
-                        if any(w.lower() in category_name.lower() for w in self.BAD_WORDS):
-                            continue
-                            
-                        href = carousel_link['href']
-                        if ',' in href:
-                            sb_id = href.split(',')[-1]
-                        else:
-                            sb_id = href.split('_')[-1]
-
-                        season['categories'].append({
-                            'name': category_name,
-                            'sb': sb_id
-                        })
-            else:
-                logging.warning(f"No titleCarousel categories found for season {season['tvSeasonNumber']}")
+            for carousel_link in carousel_links:
+                if carousel_link.has_attr('href'):
+                    category_title = carousel_link.find('h2')
+                    category_name = category_title.text.strip() if category_title else 'Unnamed'
+                    if any(w.lower() in category_name.lower() for w in self.BAD_WORDS):
+                        continue
+                        
+                    href = carousel_link['href']
+                    if ',' in href:
+                        sb_id = href.split(',')[-1]
+                    else:
+                        sb_id = href.split('_')[-1]
+
+                    categories.append({
+                        'name': category_name,
+                        'sb': sb_id
+                    })
+            season['categories'] = categories
+        else:
+            logging.warning(f"No titleCarousel categories found for season {season['tvSeasonNumber']}")
 
     def _get_season_episodes(self, season, sb_id, category_name):
         """Get episodes for a specific season"""
@@ -212,7 +305,7 @@ class GetSerieInfo:
                 'range': '0-699',
                 'sort': ':publishInfo_lastPublished|asc,tvSeasonEpisodeNumber|asc'
             }
-            data = self.client.get(programs_url, params=params, headers={'user-agent': get_userAgent()}).json()
+            data = self._get(programs_url, params=params, headers={'user-agent': get_userAgent()}).json()
             if not data:
                 return []
 
@@ -268,46 +361,31 @@ class GetSerieInfo:
 
         for attempt in range(3):
             try:
-                episode_response = self.client.get(browse_url, headers=rsc_headers)
+                episode_response = self._get(browse_url, headers=rsc_headers)
                 status = getattr(episode_response, 'status_code', None)
                 if status and status >= 400:
                     episode_response.raise_for_status()
 
+                # Decode the payload once, every field is then read from the parsed items
                 text = episode_response.text
-                pattern = r'"__typename":"VideoItem".*?"url":"https://mediasetinfinity\.mediaset\.it/video/[^"]*?"'
-                
-                for match in re.finditer(pattern, text, re.DOTALL):
-                    block = match.group(0)
-                    ep = {}
-                    fields = {
-                        'title': r'"cardTitle":"([^"]*?)"',
-                        'description': r'"description":"([^"]*?)"',
-                        'duration': r'"duration":(\d+)',
-                        'guid': r'"guid":"([^"]*?)"',
-                        'url': r'"url":"(https://mediasetinfinity\.mediaset\.it/video/[^"]*?)"'
-                    }
-                    
-                    for key, regex in fields.items():
-                        m = re.search(regex, block)
-                        if m:
-                            ep[key] = int(m.group(1)) if key == 'duration' else m.group(1)
-                    
-                    if ep:
-                        duration = int(ep.get('duration', 0) / 60) if ep.get('duration') else 0
-                        if duration < 10:
-                            continue
-
-                        episode = Episode(
-                            id=ep.get('guid', ''),
-                            name=ep.get('title', ''),
-                            url=ep.get('url', ''),
-                            duration=duration,
-                            number=0,  # Will be set later
-                            category=category_name,
-                            description=ep.get('description', ''),
-                            season_number=season_number
-                        )
-                        episodes.append(episode)
+                video_items = parse_rsc_video_items(text) or _regex_video_items(text)
+
+                for item in video_items:
+                    duration = int(item['duration'] / 60) if isinstance(item.get('duration'), (int, float)) else 0
+                    if duration < 10:
+                        continue
+
+                    episode = Episode(
+                        id=item.get('guid', ''),
+                        name=item.get('cardTitle', ''),
+                        url=item.get('video_url', ''),
+                        duration=duration,
+                        number=0,  # Will be set later
+                        category=category_name,
+                        description=item.get('description', ''),
+                        season_number=season_number
+                    )
+                    episodes.append(episode)
                 
                 if episodes:
                     return episodes
@@ -331,7 +409,7 @@ class GetSerieInfo:
                 'range': '0-699',
             }
             episode_url = f"https://feed.entertainment.tv.theplatform.eu/f/{self.public_id}/mediaset-prod-all-programs-v2"
-            response = self.client.get(episode_url, params=params, headers={'user-agent': get_userAgent()})
+            response = self._get(episode_url, params=params, headers={'user-agent': get_userAgent()})
             
             if response.status_code == 200:
                 data = response.json()
@@ -400,22 +478,8 @@ class GetSerieInfo:
             if seasons_to_extract:
                 self._extract_season_sb_ids(seasons_to_extract)
 
-            # Step 7: Collect episodes from categories
-            for season in self.stagioni_disponibili:
-                season['episodes'] = []
-                
-                if 'categories' in season:
-                    for category in season['categories']:
-                        if any(w.lower() in category['name'].lower() for w in self.BAD_WORDS):
-                            continue
-                        print(f"Processing category: {category['name']} for season {season['tvSeasonNumber']}")
-                        episodes = self._get_season_episodes(season, category['sb'], category['name'])
-                        
-                        existing_ids = {ep.id for ep in season['episodes']}
-                        for ep in episodes:
-                            if ep.id not in existing_ids:
-                                season['episodes'].append(ep)
-                                existing_ids.add(ep.id)
+            # Step 7: Collect episodes from categories, one season per worker
+            list(_season_executor.map(self._collect_season_episodes, self.stagioni_disponibili))
             
             # Step 8: Populate seasons manager
             self._populate_seasons_manager()
@@ -423,6 +487,23 @@ class GetSerieInfo:
         except Exception as e:
             logging.error(f"Error in collect_season: {str(e)}")
 
+    def _collect_season_episodes(self, season):
+        """Collect the episodes of every category of a season, without duplicates"""
+        season['episodes'] = []
+        
+        if 'categories' in season:
+            for category in season['categories']:
+                if any(w.lower() in category['name'].lower() for w in self.BAD_WORDS):
+                    continue
+                print(f"Processing category: {category['name']} for season {season['tvSeasonNumber']}")
+                episodes = self._get_season_episodes(season, category['sb'], category['name'])
+                
+                existing_ids = {ep.id for ep in season['episodes']}
+                for ep in episodes:
+                    if ep.id not in existing_ids:
+                        season['episodes'].append(ep)
+                        existing_ids.add(ep.id)
+
     def _populate_seasons_manager(self):
         """Populate the seasons_manager with collected data - ONLY for seasons with episodes"""
         seasons_with_episodes = 0
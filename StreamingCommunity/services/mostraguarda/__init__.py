@@ -32,18 +32,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles based on a search query using TMDB.
       
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         int: The number of titles found.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     # Search on TMDB
     movie_id = tmdb.search_movie(quote_plus(query))
@@ -64,9 +65,9 @@ def title_search(query: str) -> int:
         )
 
         print("add to manager: ", media_item.__dict__)
-        entries_manager.add(media_item)
+        results.add(media_item)
   
-    return len(entries_manager)
+    return len(results)
 
 
 # WRAPPING FUNCTIONS
@@ -29,18 +29,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles on Pluto TV
     
     Parameters:
         query (str): Search query
+        media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI
         
     Returns:
         int: Number of results found
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     search_url = f"https://service-media-search.clusters.pluto.tv/v1/search?q={query}&limit=10"
     console.print(f"[cyan]Search url: [yellow]{search_url}")
@@ -62,7 +63,7 @@ def title_search(query: str) -> int:
 
             define_type = 'tv' if dict_title.get('type') == 'series' else dict_title.get('type')
             
-            entries_manager.add(Entries(
+            results.add(Entries(
                 id=dict_title.get('id'),
                 name=dict_title.get('name'),
                 type=define_type,
@@ -73,7 +74,7 @@ def title_search(query: str) -> int:
         except Exception as e:
             print(f"Error parsing entry: {e}")
     
-    return len(entries_manager)
+    return len(results)
 
 
 # WRAPPING FUNCTIONS
@@ -7,7 +7,7 @@ from rich.prompt import Prompt
 
 # Internal utilities
 from StreamingCommunity.utils import TVShowManager
-from StreamingCommunity.utils.http_client import create_client, get_headers, check_region_availability
+from StreamingCommunity.utils.http_client import get_headers, check_region_availability, shared_request
 from StreamingCommunity.services._base import site_constants, EntriesManager, Entries
 from StreamingCommunity.services._base.site_search_manager import base_process_search_result, base_search
 
@@ -28,18 +28,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles based on a search query.
       
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         int: The number of titles found.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     if not check_region_availability(_region, site_constants.SITE_NAME):
         return 0
@@ -59,7 +60,7 @@ def title_search(query: str) -> int:
     }
 
     try:
-        response = create_client(headers=get_headers()).post(search_url, json=json_data)
+        response = shared_request("POST", search_url, json=json_data, headers=get_headers())
         response.raise_for_status()
 
     except Exception as e:
@@ -97,7 +98,7 @@ def title_search(query: str) -> int:
             if url and not url.startswith('http'):
                 url = f"https://www.raiplay.it{url}"
 
-            entries_manager.add(Entries(
+            results.add(Entries(
                 id=item.get('id', ''),
                 path_id=path_id,
                 name=item.get('titolo', 'Unknown'),
@@ -111,7 +112,7 @@ def title_search(query: str) -> int:
             console.print(f"[red]Error processing item '{item.get('titolo', 'Unknown')}': {e}")
             continue
     
-    return len(entries_manager)
+    return len(results)
 
 
 
@@ -4,7 +4,7 @@ import json
 
 
 # Internal utilities
-from StreamingCommunity.utils.http_client import create_client, get_headers
+from StreamingCommunity.utils.http_client import get_headers, shared_request
 
 
 def generate_license_url(mpd_id: str):
@@ -22,7 +22,7 @@ def generate_license_url(mpd_id: str):
         'output': '62',
     }
     
-    response = create_client(headers=get_headers()).get('https://mediapolisvod.rai.it/relinker/relinkerServlet.htm', params=params)
+    response = shared_request("GET", 'https://mediapolisvod.rai.it/relinker/relinkerServlet.htm', params=params, headers=get_headers())
     response.raise_for_status()
 
     # Extract the license URL from the response in two lines
@@ -12,7 +12,7 @@ from rich.prompt import Prompt
 
 # Internal utilities
 from StreamingCommunity.utils import config_manager, start_message
-from StreamingCommunity.utils.http_client import create_client, get_headers, get_userAgent
+from StreamingCommunity.utils.http_client import get_headers, get_userAgent, shared_request
 from StreamingCommunity.services._base import site_constants, Entries
 from StreamingCommunity.services._base.tv_display_manager import map_movie_title, map_episode_title, map_season_name
 from StreamingCommunity.services._base.tv_download_manager import process_season_selection, process_episode_download
@@ -64,7 +64,7 @@ def download_film(select_title: Entries) -> Tuple[str, bool]:
     console.print(f"\n[yellow]Download: [red]{site_constants.SITE_NAME} → [cyan]{select_title.name} \n")
 
     # Extract m3u8 URL from the film's URL
-    response = create_client(headers=get_headers()).get(select_title.url + ".json")
+    response = shared_request("GET", select_title.url + ".json", headers=get_headers())
     first_item_path = "https://www.raiplay.it" + response.json().get("first_item_path")
     master_playlist = VideoSource.extract_m3u8_url(first_item_path)
 
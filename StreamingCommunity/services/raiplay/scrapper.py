@@ -5,7 +5,7 @@ import logging
 
 
 # Internal utilities
-from StreamingCommunity.utils.http_client import create_client, get_headers
+from StreamingCommunity.utils.http_client import get_headers, shared_request
 from StreamingCommunity.services._base.object import SeasonManager, Episode, Season
 
 
@@ -26,7 +26,7 @@ class GetSerieInfo:
         try:
             path = self.path_id.lstrip('/')
             program_url = f"{self.base_url}/{path}"
-            response = create_client(headers=get_headers()).get(program_url)
+            response = shared_request("GET", program_url, headers=get_headers())
             
             # If 404, content is not yet available
             if response.status_code == 404:
@@ -122,7 +122,7 @@ class GetSerieInfo:
             base_path = self.path_id.lstrip('/').replace('.json', '')
             url = f"{self.base_url}/{base_path}/{block_id}/{set_id}/episodes.json"
             
-            response = create_client(headers=get_headers()).get(url)
+            response = shared_request("GET", url, headers=get_headers())
             response.raise_for_status()
             
             episodes_data = response.json()
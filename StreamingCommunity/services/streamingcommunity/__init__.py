@@ -1,23 +1,19 @@
 # 21.05.24
 
-import json
-
-
 # External library
-from bs4 import BeautifulSoup
 from rich.console import Console
 from rich.prompt import Prompt
 
 
 # Internal utilities
 from StreamingCommunity.utils import TVShowManager
-from StreamingCommunity.utils.http_client import create_client, get_userAgent
 from StreamingCommunity.services._base import site_constants, EntriesManager, Entries
 from StreamingCommunity.services._base.site_search_manager import base_process_search_result, base_search
 
 
 # Logic
 from .downloader import download_series, download_film
+from .inertia import inertia_versions
 
 
 # Variable
@@ -31,18 +27,19 @@ entries_manager = EntriesManager()
 table_show_manager = TVShowManager()
 
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles based on a search query in both IT and EN languages.
       
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         int: The number of unique titles found.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     # Dictionary to track unique IDs
     seen_ids = set()
@@ -51,21 +48,11 @@ def title_search(query: str) -> int:
     for lang in languages:
         console.print(f"[cyan]Searching in language: [yellow]{lang}")
         
-        try:
-            response = create_client(headers={'user-agent': get_userAgent()}).get(f"{site_constants.FULL_URL}/{lang}")
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            version = json.loads(soup.find('div', {'id': "app"}).get("data-page"))['version']
-        except Exception as e:
-            console.print(f"[red]Site: {site_constants.SITE_NAME} version ({lang}), request error: {e}")
-            continue
-
         search_url = f"{site_constants.FULL_URL}/{lang}/search?q={query}"
         console.print(f"[cyan]Search url: [yellow]{search_url}")
 
         try:
-            response = create_client(headers={'user-agent': get_userAgent(), 'x-inertia': 'true', 'x-inertia-version': version}).get(search_url)
-            response.raise_for_status()
+            response = inertia_versions.get(f"{site_constants.FULL_URL}/{lang}", search_url)
         except Exception as e:
             console.print(f"[red]Site: {site_constants.SITE_NAME} ({lang}), request search error: {e}")
             continue
@@ -126,7 +113,7 @@ def title_search(query: str) -> int:
                 if not year:
                     year = dict_title.get('last_air_date') or dict_title.get('release_date')
 
-                entries_manager.add(Entries(
+                results.add(Entries(
                     id=title_id,
                     slug=dict_title.get('slug'),
                     name=dict_title.get('name'),
@@ -139,7 +126,7 @@ def title_search(query: str) -> int:
             except Exception as e:
                 print(f"[red]Error parsing a film entry ({lang}): {e}")
 
-    return len(entries_manager)
+    return len(results)
 
 
 
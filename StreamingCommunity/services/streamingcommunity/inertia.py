@@ -0,0 +1,84 @@
+# 19.10.26
+
+import json
+import logging
+import threading
+from typing import Dict, Optional
+
+
+# External libraries
+import httpx
+from bs4 import BeautifulSoup
+
+
+# Internal utilities
+from StreamingCommunity.utils.http_client import get_userAgent, shared_request
+
+
+class InertiaVersionCache:
+    def __init__(self):
+        """
+        Inertia asset version per base url (domain + language).
+
+        The version is read once from the data-page of the HTML page and reused for every
+        x-inertia request; a 409 answer means the site was redeployed, so it is read again.
+        """
+        self._versions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _fetch_version(base_url: str) -> str:
+        response = shared_request("GET", base_url, headers={'user-agent': get_userAgent()})
+        response.raise_for_status()
+        soup = BeautifulSoup(response.text, 'html.parser')
+        return json.loads(soup.find('div', {'id': "app"}).get("data-page"))['version']
+
+    def get_version(self, base_url: str, refresh: bool = False) -> str:
+        """Return the Inertia version of base_url, fetching the HTML page only when unknown or refreshed."""
+        base_url = base_url.rstrip('/')
+        with self._lock:
+            version = None if refresh else self._versions.get(base_url)
+
+        if version is None:
+            version = self._fetch_version(base_url)
+            with self._lock:
+                self._versions[base_url] = version
+
+        return version
+
+    def invalidate(self, base_url: Optional[str] = None):
+        with self._lock:
+            if base_url is None:
+                self._versions.clear()
+            else:
+                self._versions.pop(base_url.rstrip('/'), None)
+
+    def get(self, base_url: str, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        GET an Inertia page as JSON with the cached version, refreshing it once on 409.
+
+        Parameters:
+            - base_url (str): Site url with language (e.g. https://site/it), key of the version.
+            - url (str): Page to request.
+            - headers (Optional[Dict[str, str]]): Extra headers.
+        """
+        request_headers = {'user-agent': get_userAgent()}
+        request_headers.update(headers or {})
+        request_headers['x-inertia'] = 'true'
+
+        for refresh in (False, True):
+            request_headers['x-inertia-version'] = self.get_version(base_url, refresh=refresh)
+            response = shared_request("GET", url, headers=request_headers)
+
+            if response.status_code != 409:
+                response.raise_for_status()
+                return response
+
+            logging.info(f"Inertia version changed for {base_url}, refreshing")
+
+        response.raise_for_status()
+        return response
+
+
+# Initialize
+inertia_versions = InertiaVersionCache()
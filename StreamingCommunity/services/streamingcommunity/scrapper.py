@@ -1,18 +1,17 @@
 # 01.03.24
 
-import json
 import logging
 
 
-# External libraries
-from bs4 import BeautifulSoup
-
-
 # Internal utilities
-from StreamingCommunity.utils.http_client import create_client, get_headers
+from StreamingCommunity.utils.http_client import get_headers
 from StreamingCommunity.services._base.object import SeasonManager, Episode, Season
 
 
+# Logic
+from .inertia import inertia_versions
+
+
 class GetSerieInfo:
     def __init__(self, url, media_id: int = None, series_name: str = None, year: int = None, provider_language: str = "it", series_display_name: str = None):
         """
@@ -45,13 +44,10 @@ class GetSerieInfo:
             Exception: If there's an error fetching series information
         """
         try:
-            response = create_client(headers=self.headers).get(f"{self.url}/titles/{self.media_id}-{self.series_name}")
-            response.raise_for_status()
-
-            # Extract series info from JSON response
-            soup = BeautifulSoup(response.text, "html.parser")
-            json_response = json.loads(soup.find("div", {"id": "app"}).get("data-page"))
-            self.version = json_response['version']
+            # Inertia JSON of the title page, the version is cached per domain and language
+            response = inertia_versions.get(self.url, f"{self.url}/titles/{self.media_id}-{self.series_name}", headers=self.headers)
+            json_response = response.json()
+            self.version = json_response.get('version') or inertia_versions.get_version(self.url)
             
             # Extract information about available seasons
             title_data = json_response.get("props", {}).get("title", {})
@@ -90,12 +86,7 @@ class GetSerieInfo:
                 logging.error(f"Season {number_season} not found")
                 return
 
-            custom_headers = self.headers.copy()
-            custom_headers.update({
-                'x-inertia': 'true',
-                'x-inertia-version': self.version,
-            })
-            response = create_client(headers=custom_headers).get(f"{self.url}/titles/{self.media_id}-{self.series_name}/season-{number_season}")
+            response = inertia_versions.get(self.url, f"{self.url}/titles/{self.media_id}-{self.series_name}/season-{number_season}", headers=self.headers)
 
             # Extract episodes from JSON response
             json_response = response.json().get('props', {}).get('loadedSeason', {}).get('episodes', [])
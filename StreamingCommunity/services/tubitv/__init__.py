@@ -55,18 +55,19 @@ def affinity_score(element, keyword):
 
     return score
 
-def title_search(query: str) -> int:
+def title_search(query: str, media_search_manager: EntriesManager = None) -> int:
     """
     Search for titles on Tubi TV based on a search query.
       
     Parameters:
         - query (str): The query to search for.
+        - media_search_manager (EntriesManager, optional): Container for the results, defaults to the one of the CLI.
 
     Returns:
         int: The number of titles found.
     """
-    entries_manager.clear()
-    table_show_manager.clear()
+    results = media_search_manager if media_search_manager is not None else entries_manager
+    results.clear()
 
     if not check_region_availability(_region, site_constants.SITE_NAME):
         return 0
@@ -123,7 +124,7 @@ def title_search(query: str) -> int:
             if "thumbnails" in element and element["thumbnails"]:
                 thumbnail = element["thumbnails"][0]
             
-            entries_manager.add(Entries(
+            results.add(Entries(
                 name=title,
                 type=type_content,
                 year=str(year) if year else "9999",
@@ -135,7 +136,7 @@ def title_search(query: str) -> int:
             console.print(f"[yellow]Error parsing a title entry: {e}")
             continue
     
-    return len(entries_manager)
+    return len(results)
 
 
 
@@ -23,6 +23,7 @@ except Exception:
 # Internal import
 from StreamingCommunity.setup import get_bento4_decrypt_path, get_mp4dump_path, get_shaka_packager_path
 from StreamingCommunity.utils.vault import obj_externalSupaDbVault
+from .mp4_box import detect_scheme, MP4BoxError
 
 
 # Variable
@@ -41,9 +42,30 @@ class Decryptor:
         self.is_supa_db_connected = obj_externalSupaDbVault is not None
     
     def detect_encryption(self, file_path):
-        """Detect encryption scheme using mp4dump. Returns 'ctr', 'cbc', or None if not encrypted."""
+        """Detect encryption scheme from the MP4 boxes. Returns 'ctr', 'cbc', or None if not encrypted."""
         logger.info(f"Detecting encryption: {os.path.basename(file_path)}")
+
+        try:
+            scheme, kid = detect_scheme(file_path)
+            if kid:
+                console.print(f"[dim]KID: {kid}")
+            if scheme:
+                console.print(f"[dim]Scheme: {scheme}")
+            return scheme, kid
+        
+        except MP4BoxError as e:
+            logger.info(f"Box scan not applicable: {e}")
+            return None, None
+        except Exception as e:
+            logger.warning(f"Box scan failed for {file_path}: {e}, falling back to mp4dump")
+
+        return self._detect_encryption_mp4dump(file_path)
+
+    def _detect_encryption_mp4dump(self, file_path):
+        """Detect encryption scheme using mp4dump. Returns 'ctr', 'cbc', or None if not encrypted."""
         kid = None
+        if not self.mp4dump_path:
+            return None, None
         
         try:
             cmd = [self.mp4dump_path, file_path]
@@ -0,0 +1,169 @@
+# 19.10.26
+
+import os
+import mmap
+import struct
+import logging
+from typing import Iterator, Optional, Tuple
+
+
+# Variable
+logger = logging.getLogger(__name__)
+
+# Containers walked on the way to the protection info
+_CONTAINER_BOXES = {b'moov', b'trak', b'mdia', b'minf', b'stbl', b'sinf', b'schi', b'moof', b'traf', b'mvex'}
+
+# Sample entries that carry a sinf box, with the size of their fixed fields
+_SAMPLE_ENTRY_HEADER = {
+    b'encv': 78,
+    b'enca': 28,
+    b'enct': 8,
+    b'encs': 8,
+}
+
+# Boxes that mark a fragment as encrypted even without a sinf in moov
+_FRAGMENT_ENC_BOXES = {b'senc', b'saiz', b'saio'}
+
+
+class MP4BoxError(Exception):
+    """Raised when the file is not a readable ISO-BMFF container."""
+
+
+class EncryptionInfo:
+    def __init__(self):
+        self.scheme = None
+        self.default_kid = None
+        self.is_protected = None
+        self.original_format = None
+        self.has_sinf = False
+        self.has_encrypted_entry = False
+        self.has_fragment_enc = False
+
+    def is_encrypted(self) -> bool:
+        return bool(self.scheme or self.is_protected or self.has_sinf or self.has_encrypted_entry or self.has_fragment_enc)
+
+    def __repr__(self):
+        return f"EncryptionInfo(scheme={self.scheme}, kid={self.default_kid}, protected={self.is_protected}, sinf={self.has_sinf})"
+
+
+def _iter_boxes(buf, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yield (type, payload_start, box_end) for every box between start and end."""
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack_from('>I4s', buf, pos)
+        header = 8
+
+        if size == 1:
+            if pos + 16 > end:
+                return
+            size = struct.unpack_from('>Q', buf, pos + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+
+        if size < header or pos + size > end:
+            return
+
+        yield box_type, pos + header, pos + size
+        pos += size
+
+
+def _parse_schm(buf, start: int, end: int, info: EncryptionInfo):
+    if start + 8 <= end:
+        info.scheme = buf[start + 4:start + 8].decode('ascii', errors='replace').lower()
+
+
+def _parse_tenc(buf, start: int, end: int, info: EncryptionInfo):
+    # version/flags(4) reserved(1) reserved|pattern(1) isProtected(1) ivSize(1) KID(16)
+    if start + 24 <= end:
+        info.is_protected = buf[start + 6]
+        kid = bytes(buf[start + 8:start + 24])
+        if any(kid):
+            info.default_kid = kid.hex()
+
+
+def _walk(buf, start: int, end: int, info: EncryptionInfo):
+    for box_type, payload, box_end in _iter_boxes(buf, start, end):
+        if box_type in _CONTAINER_BOXES:
+            if box_type == b'sinf':
+                info.has_sinf = True
+            _walk(buf, payload, box_end, info)
+
+        elif box_type == b'stsd':
+            _walk_stsd(buf, payload, box_end, info)
+
+        elif box_type == b'frma':
+            if payload + 4 <= box_end:
+                info.original_format = bytes(buf[payload:payload + 4]).decode('ascii', errors='replace')
+
+        elif box_type == b'schm':
+            _parse_schm(buf, payload, box_end, info)
+
+        elif box_type == b'tenc':
+            _parse_tenc(buf, payload, box_end, info)
+
+        elif box_type in _FRAGMENT_ENC_BOXES:
+            info.has_fragment_enc = True
+
+
+def _walk_stsd(buf, start: int, end: int, info: EncryptionInfo):
+    # Skip version/flags(4) and entry_count(4)
+    for entry_type, payload, entry_end in _iter_boxes(buf, start + 8, end):
+        fixed = _SAMPLE_ENTRY_HEADER.get(entry_type)
+        if fixed is None:
+            continue
+
+        info.has_encrypted_entry = True
+        child_start = payload + fixed
+
+        # QuickTime v1/v2 audio entries have extra fields, look for sinf directly
+        if entry_type == b'enca':
+            sinf_pos = bytes(buf[payload:entry_end]).find(b'sinf')
+            if sinf_pos >= 4:
+                child_start = payload + sinf_pos - 4
+
+        _walk(buf, child_start, entry_end, info)
+
+
+def scan_encryption(file_path: str) -> EncryptionInfo:
+    """
+    Read the protection info of an ISO-BMFF file without parsing sample data.
+
+    Only moov and the first moof are walked, everything else is skipped by size.
+    """
+    size = os.path.getsize(file_path)
+    if size < 8:
+        raise MP4BoxError(f"File too small: {file_path}")
+
+    info = EncryptionInfo()
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            first_type = buf[4:8]
+            if first_type not in (b'ftyp', b'styp', b'moov', b'moof', b'sidx', b'free', b'skip', b'emsg'):
+                raise MP4BoxError(f"Not an ISO-BMFF file: {file_path}")
+
+            for box_type, payload, box_end in _iter_boxes(buf, 0, size):
+                if box_type == b'moov':
+                    _walk(buf, payload, box_end, info)
+                    if info.is_encrypted():
+                        break
+
+                elif box_type == b'moof':
+                    _walk(buf, payload, box_end, info)
+                    break
+
+    logger.info(f"Scanned {os.path.basename(file_path)}: {info}")
+    return info
+
+
+def detect_scheme(file_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return ('ctr' | 'cbc' | None, default_kid) for an ISO-BMFF file."""
+    info = scan_encryption(file_path)
+
+    if not info.is_encrypted():
+        return None, None
+
+    if info.scheme in ('cbcs', 'cbc1'):
+        return 'cbc', info.default_kid
+
+    return 'ctr', info.default_kid
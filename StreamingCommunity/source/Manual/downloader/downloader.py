@@ -15,6 +15,7 @@ from rich.table import Table
 # Internal utilities
 from StreamingCommunity.utils import config_manager
 from StreamingCommunity.utils.http_client import create_client, get_headers
+from StreamingCommunity.source.utils.tracker import context_tracker
 
 
 # Logic
@@ -224,7 +225,7 @@ class Downloader:
         else:
             self.parser = HLSParser(self.manifest_url, self.headers, None)
         
-        self.segment_downloader = SegmentDownloader(headers=self.headers, max_workers=MAX_WORKERS, download_id=self.download_id)
+        self.segment_downloader = SegmentDownloader(headers=self.headers, max_workers=context_tracker.share_budget(MAX_WORKERS), download_id=self.download_id)
         self.decryptor = Decryptor()
         self.stream_orchestrator = StreamDownloader(self.parser, self.segment_downloader, self.decryptor, self.output_path, self.temp_dir, self.kid_key, self.download_id)
         self.streams = []
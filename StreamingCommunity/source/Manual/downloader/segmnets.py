@@ -183,7 +183,7 @@ class SegmentDownloader:
         
         # Use NullContext if in GUI mode to avoid live table conflicts for GUI
         from contextlib import nullcontext
-        progress_ctx = nullcontext() if context_tracker.is_gui else Progress(
+        progress_ctx = nullcontext() if not context_tracker.show_progress else Progress(
             TextColumn("{task.description}"),
             CustomBarColumn(bar_width=40),
             ColoredSegmentColumn(),
@@ -200,7 +200,7 @@ class SegmentDownloader:
 
         with progress_ctx as progress:
             task = None
-            if not context_tracker.is_gui:
+            if context_tracker.show_progress:
                 task = progress.add_task(
                     display_desc,
                     total=total_segments,
@@ -255,7 +255,7 @@ class SegmentDownloader:
                             size_str = f"{format_size(total_size)} / {format_size(total_size * total_segments / max(downloaded_count, 1))}"
                             segments_str = f"{downloaded_count}/{total_segments}"
                             
-                            if not context_tracker.is_gui:
+                            if context_tracker.show_progress:
                                 progress.update(task, completed=downloaded_count + failed_count, progress=segments_str, speed=speed_str, size=size_str)
                             
                             if self.download_id:
@@ -269,13 +269,13 @@ class SegmentDownloader:
                                 )
                         else:
                             failed_count += 1
-                            if not context_tracker.is_gui:
+                            if context_tracker.show_progress:
                                 progress.update(task, completed=downloaded_count + failed_count)
                     
                     except Exception as e:
                         logger.error(f"Error downloading segment {segment.number}: {e}")
                         failed_count += 1
-                        if not context_tracker.is_gui:
+                        if context_tracker.show_progress:
                             progress.update(task, completed=downloaded_count + failed_count)
         
         elapsed = time.time() - start_time
@@ -48,6 +48,20 @@ use_proxy = config_manager.config.get_bool("REQUESTS", "use_proxy")
 configuration_proxy = config_manager.config.get_dict("REQUESTS", "proxy", default={})
 
 
+def split_speed_limit(limit: str, share: int) -> str:
+    """Divide a --max-speed value like "30MB" between parallel downloads, moving to a smaller unit when needed."""
+    match = re.match(r'^\s*(\d+(?:\.\d+)?)\s*([KMG]?)(B?)\s*$', limit, re.IGNORECASE)
+    if share <= 1 or not match:
+        return limit
+
+    value, unit, suffix = float(match.group(1)) / share, match.group(2).upper(), match.group(3)
+    smaller = {'G': 'M', 'M': 'K'}
+    while value != int(value) and unit in smaller:
+        value, unit = value * 1024, smaller[unit]
+
+    return f"{max(1, int(value))}{unit}{suffix}"
+
+
 class MediaDownloader:
     def __init__(self, url: str, output_dir: str, filename: str, headers: Optional[Dict] = None, key: Optional[str] = None, cookies: Optional[Dict] = None, decrypt_preference: str = "shaka", download_id: str = None, site_name: str = None):
         self.url = url
@@ -64,6 +78,7 @@ class MediaDownloader:
         self.force_best_video = False
         self.meta_json_path, self.meta_selected_path, self.raw_m3u8, self.raw_mpd, self.raw_ism = None, None, None, None, None 
         self.status = None
+        self.stop_event = None
         self.manifest_type = "Unknown"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.output_dir_type = "Movie" if config_manager.config.get("OUTPUT", "movie_folder_name") in str(self.output_dir) else "TV" if config_manager.config.get("OUTPUT", "serie_folder_name") in str(self.output_dir) else "Anime" if config_manager.config.get("OUTPUT", "anime_folder_name") in str(self.output_dir) else "other"
@@ -72,6 +87,12 @@ class MediaDownloader:
         if self.download_id:
             download_tracker.start_download(self.download_id, self.filename, self.site_name or "Unknown", self.output_dir_type)
 
+    def _stop_requested(self) -> bool:
+        """True when the tracked download or the owner of this downloader (stop_event) asked to stop."""
+        if self.stop_event is not None and self.stop_event.is_set():
+            return True
+        return bool(self.download_id) and download_tracker.is_stopped(self.download_id)
+
     def _normalize_filter(self, filter_value: str) -> str:
         """Normalize filter ensuring values are quoted if they contain special characters"""
         if not filter_value:
@@ -330,13 +351,13 @@ class MediaDownloader:
         if concurrent_download:
             cmd.append("--concurrent-download")
         if thread_count > 0:
-            cmd.extend(["--thread-count", str(thread_count)])
+            cmd.extend(["--thread-count", str(context_tracker.share_budget(thread_count))])
         if request_timeout > 0:
             cmd.extend(["--http-request-timeout", str(request_timeout)])
         if retry_count > 0:
             cmd.extend(["--download-retry-count", str(retry_count)])
         if max_speed and str(max_speed).lower() != "false":
-            cmd.extend(["--max-speed", max_speed])
+            cmd.extend(["--max-speed", split_speed_limit(str(max_speed), context_tracker.budget_share)])
         if self.key:
             keys_list = self.key.get_keys_list() if isinstance(self.key, KeysManager) else ([self.key] if isinstance(self.key, str) else self.key)
             for single_key in keys_list:
@@ -367,7 +388,7 @@ class MediaDownloader:
                 proc.wait()
 
             else:
-                progress_ctx = nullcontext() if context_tracker.is_gui else Progress(
+                progress_ctx = nullcontext() if not context_tracker.show_progress else Progress(
                     TextColumn("[purple]{task.description}", justify="left"), CustomBarColumn(bar_width=40), ColoredSegmentColumn(),
                     TextColumn("[dim][[/dim]"), CompactTimeColumn(), TextColumn("[dim]<[/dim]"), CompactTimeRemainingColumn(), TextColumn("[dim]][/dim]"),
                     SizeColumn(), TextColumn("[dim]@[/dim]"), TextColumn("[red]{task.fields[speed]}[/red]", justify="right"), 
@@ -385,7 +406,7 @@ class MediaDownloader:
 
                     with proc:
                         for line in proc.stdout:
-                            if self.download_id and download_tracker.is_stopped(self.download_id):
+                            if self._stop_requested():
                                 proc.terminate()
                                 break
                             
@@ -399,7 +420,7 @@ class MediaDownloader:
                                 progress.update(task_id, completed=100)
         
         # Check if we were cancelled
-        if self.download_id and download_tracker.is_stopped(self.download_id):
+        if self._stop_requested():
             return {"error": "cancelled"}
 
         # Check for key retrieval errors (Succedde spesso quando parsa m3u8 che hanno bisogna di licenza, ma non ho ancora trovato un caso per implementare license per quel cazzo di m3u8 quindi amen va su failed).
@@ -437,7 +458,8 @@ class MediaDownloader:
                 
             # Check if still encrypted
             console.print(f"[cyan]Check file [red]{file_path.name} [cyan]is still encrypted...")
-            if decryptor.detect_encryption(str(file_path)):
+            encryption_scheme, _ = decryptor.detect_encryption(str(file_path))
+            if encryption_scheme:
                 
                 # Decrypt to a temporary file
                 temp_output = file_path.with_suffix(file_path.suffix + ".decrypted")
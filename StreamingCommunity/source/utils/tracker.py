@@ -119,6 +119,28 @@ class DownloadTracker(metaclass=SingletonMeta):
                 self.downloads[download_id]["status"] = status
                 self.downloads[download_id]["last_update"] = time.time()
 
+    def update_ffmpeg_progress(self, download_id: str, task_key: str, out_time_us: int = None, speed: float = None, total_size: int = None, progress: float = None):
+        """Store the structured progress of an FFmpeg run (mux, encode) without touching the download status."""
+        with self._lock:
+            if download_id in self.downloads:
+                dl = self.downloads[download_id]
+                dl["last_update"] = time.time()
+                dl["ffmpeg"] = {
+                    "task": task_key,
+                    "out_time_us": out_time_us,
+                    "speed": speed,
+                    "total_size": total_size,
+                    "progress": progress,
+                }
+
+                task = dl["tasks"].setdefault(task_key, {"progress": 0.0, "speed": "0B/s", "size": "0B/0B", "segments": "0/0"})
+                if progress is not None:
+                    task["progress"] = float(progress)
+                if speed is not None:
+                    task["speed"] = f"{speed}x"
+                if total_size is not None:
+                    task["size"] = str(total_size)
+
     def request_stop(self, download_id: str):
         """Signal a download to stop and terminate its processes."""
         with self._lock:
@@ -145,6 +167,14 @@ class DownloadTracker(metaclass=SingletonMeta):
             event = self.stop_events.get(download_id)
             return event.is_set() if event else False
 
+    def was_cancelled(self, download_id: str) -> bool:
+        """Check if a stop is pending or the download already ended as cancelled."""
+        with self._lock:
+            event = self.stop_events.get(download_id)
+            if event is not None and event.is_set():
+                return True
+            return any(dl.get("id") == download_id and dl.get("status") == "cancelled" for dl in self.history)
+
     def register_process(self, download_id: str, process: Any):
         """Register a subprocess or task to be terminated if download is cancelled."""
         with self._lock:
@@ -270,6 +300,57 @@ class ContextTracker:
     def site_name(self, value):
         self.local.site_name = value
 
+    @property
+    def post_processor(self):
+        return getattr(self.local, 'post_processor', None)
+    
+    @post_processor.setter
+    def post_processor(self, value):
+        self.local.post_processor = value
+
+    @property
+    def parallel_share(self):
+        return getattr(self.local, 'parallel_share', 1)
+    
+    @parallel_share.setter
+    def parallel_share(self, value):
+        self.local.parallel_share = value
+
+    @property
+    def budget_share(self):
+        """Downloads the thread budget is split between, parallel_share unless a download runs side jobs of its own."""
+        return getattr(self.local, 'budget_share', None) or self.parallel_share
+    
+    @budget_share.setter
+    def budget_share(self, value):
+        self.local.budget_share = value
+
+    @property
+    def on_download_start(self):
+        return getattr(self.local, 'on_download_start', None)
+    
+    @on_download_start.setter
+    def on_download_start(self, value):
+        self.local.on_download_start = value
+
+    @property
+    def show_progress(self) -> bool:
+        """Live progress bars are hidden in the GUI and when several episodes download at once."""
+        return not self.is_gui and self.parallel_share <= 1
+
+    def share_budget(self, total: int) -> int:
+        """Split a global budget (threads, connections) between the parallel downloads of this thread."""
+        if not total or total <= 0:
+            return total
+        return max(1, total // max(1, self.budget_share))
+
+    def notify_download_start(self):
+        """Called by downloaders right before the transfer starts, runs the pending callback once."""
+        callback = self.on_download_start
+        if callback is not None:
+            self.local.on_download_start = None
+            callback()
+
     @property
     def is_gui(self):
         return getattr(self.local, 'is_gui', self._global_is_gui)
@@ -9,6 +9,7 @@ from rich.console import Console
 
 # Internal utilities
 from StreamingCommunity.utils import config_manager
+from StreamingCommunity.source.utils.tracker import context_tracker
 
 
 # Variable
@@ -27,7 +28,8 @@ def start_message(clean: bool=True):
 [green]→[purple]                                                                                /___/   
     '''
 
-    if CLEAN and clean: 
+    # Parallel episode workers share the terminal, clearing it would wipe the other episodes
+    if CLEAN and clean and context_tracker.parallel_share <= 1: 
         os.system("cls" if platform.system() == 'Windows' else "clear")
         # console.clear() DA NON USARE CHE DIO CANE CREA PROBLEMI
     
@@ -1,7 +1,13 @@
 # 09.08.25
 from __future__ import annotations
 
-from typing import Dict, Optional, Union
+import atexit
+import logging
+import weakref
+import threading
+import importlib.util
+from urllib.parse import urlparse
+from typing import Any, Dict, Optional, Tuple, Union
 
 
 # External library
@@ -18,6 +24,7 @@ from StreamingCommunity.utils import config_manager
 ua =  ua_generator.generate(device='desktop', browser=('chrome', 'edge'))
 CONF_PROXY = config_manager.config.get_dict("REQUESTS", "proxy") or {}
 USE_PROXY = bool(config_manager.config.get_bool("REQUESTS", "use_proxy"))
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 
@@ -147,6 +154,127 @@ def create_client_curl(*, headers: Optional[Dict[str, str]] = None, cookies: Opt
     return session
 
 
+class SessionRegistry:
+    def __init__(self):
+        """
+        Long-lived sessions per (host, client kind, proxy), so requests to the same host reuse
+        connections, TLS sessions and cookies instead of opening a new client every call.
+
+        httpx clients are thread-safe and shared by every thread (HTTP/2 when h2 is installed).
+        curl_cffi sessions are not, so each thread gets its own session per key.
+        """
+        self._lock = threading.Lock()
+        self._httpx: Dict[Tuple, httpx.Client] = {}
+        self._local = threading.local()
+        self._curl_sessions = weakref.WeakSet()
+        self._metrics: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def _host(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc.lower()}"
+
+    @staticmethod
+    def _proxy_key(proxies: Optional[Dict[str, str]]) -> Tuple:
+        return tuple(sorted(proxies.items())) if proxies else ()
+
+    def _count(self, host: str, kind: str, field: str, amount: int = 1):
+        with self._lock:
+            stats = self._metrics.setdefault(f"{kind} {host}", {'sessions': 0, 'requests': 0, 'connections': 0, 'tls_handshakes': 0})
+            stats[field] += amount
+
+    def _tracer(self, host: str):
+        def trace(event_name: str, info: dict):
+            if event_name == "connection.connect_tcp.complete":
+                self._count(host, "httpx", 'connections')
+            elif event_name == "connection.start_tls.complete":
+                self._count(host, "httpx", 'tls_handshakes')
+        return trace
+
+    def get(self, url: str, kind: str = "httpx", proxies: Optional[Dict[str, str]] = None, impersonate: str = "chrome142"):
+        """
+        Return the shared session for the host of url.
+
+        Parameters:
+            - url (str): Any url of the host.
+            - kind (str): "httpx" or "curl" (curl_cffi, browser impersonation).
+            - proxies (Optional[Dict[str, str]]): Defaults to the configured proxy.
+            - impersonate (str): Browser profile of curl sessions.
+        """
+        host = self._host(url)
+        proxy_value = proxies if proxies is not None else _get_proxies()
+        key = (host, self._proxy_key(proxy_value), impersonate if kind == "curl" else None)
+
+        if kind == "curl":
+            sessions = self._local.__dict__.setdefault('curl', {})
+            session = sessions.get(key)
+            if session is None:
+                session = create_client_curl(proxies=proxy_value, impersonate=impersonate)
+                sessions[key] = session
+                with self._lock:
+                    self._curl_sessions.add(session)
+                self._count(host, kind, 'sessions')
+            return session
+
+        with self._lock:
+            client = self._httpx.get(key)
+            if client is None:
+                client = create_client(proxies=proxy_value, http2=HTTP2_AVAILABLE)
+
+                # Count new connections and TLS handshakes through the httpcore trace extension
+                tracer = self._tracer(host)
+                client.event_hooks = {'request': [lambda request: request.extensions.setdefault("trace", tracer)]}
+                self._httpx[key] = client
+                created = True
+            else:
+                created = False
+
+        if created:
+            self._count(host, kind, 'sessions')
+        return client
+
+    def request(self, method: str, url: str, kind: str = "httpx", proxies: Optional[Dict[str, str]] = None, **kwargs: Any):
+        """Send a request with the shared session of the host; kwargs go to the client (headers, params, json, ...)."""
+        session = self.get(url, kind=kind, proxies=proxies)
+        self._count(self._host(url), kind, 'requests')
+        return session.request(method, url, **kwargs)
+
+    def metrics(self) -> Dict[str, Dict[str, int]]:
+        """Per host counters; requests minus connections is the number of reused connections (httpx only)."""
+        with self._lock:
+            return {key: dict(value) for key, value in self._metrics.items()}
+
+    def close(self):
+        for key, stats in self.metrics().items():
+            logging.debug(f"HTTP session {key}: {stats}")
+
+        with self._lock:
+            clients, self._httpx = list(self._httpx.values()), {}
+            sessions, self._curl_sessions = list(self._curl_sessions), weakref.WeakSet()
+        self._local = threading.local()
+
+        for session in clients + sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+
+# Initialize
+session_registry = SessionRegistry()
+atexit.register(session_registry.close)
+
+
+def get_session(url: str, kind: str = "httpx", proxies: Optional[Dict[str, str]] = None):
+    """Shared long-lived session for the host of url, see SessionRegistry."""
+    return session_registry.get(url, kind=kind, proxies=proxies)
+
+
+def shared_request(method: str, url: str, kind: str = "httpx", **kwargs: Any):
+    """One request through the shared session of the host of url."""
+    return session_registry.request(method, url, kind=kind, **kwargs)
+
+
 def get_userAgent() -> str:
     user_agent =  ua_generator.generate().text
     return user_agent
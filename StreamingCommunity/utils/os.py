@@ -1,6 +1,7 @@
 # 24.01.24
 
 import os
+import errno
 import shutil
 import logging
 
@@ -139,6 +140,125 @@ class OsManager:
             logging.error(f"Path creation error: {e}")
             return False
 
+    def get_cache_path(self, filename: str) -> str:
+        """
+        Return the path of a cache file inside the .cache folder of the working directory.
+
+        Args:
+            filename (str): Name of the cache file.
+
+        Returns:
+            str: Absolute path, the folder is created if missing.
+        """
+        cache_dir = os.path.join(os.getcwd(), ".cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, filename)
+
+    def same_filesystem(self, src: str, dst: str) -> bool:
+        """
+        Check if two paths live on the same device, so a rename does not copy data.
+
+        Args:
+            src (str): Existing file or directory.
+            dst (str): Destination path, its nearest existing parent is checked.
+
+        Returns:
+            bool: True if both paths are on the same device.
+        """
+        dst_dir = os.path.abspath(dst)
+        while dst_dir and not os.path.exists(dst_dir):
+            parent = os.path.dirname(dst_dir)
+            if parent == dst_dir:
+                break
+            dst_dir = parent
+
+        try:
+            return os.stat(src).st_dev == os.stat(dst_dir).st_dev
+        except OSError:
+            return False
+
+    def move_file(self, src: str, dst: str) -> str:
+        """
+        Move a file with a rename, copying only once when crossing devices.
+
+        On a different device the data is copied next to dst, renamed into place and the
+        source is removed, so dst is never left half written.
+
+        Args:
+            src (str): File to move.
+            dst (str): Final path, overwritten if it exists.
+
+        Returns:
+            str: The destination path.
+        """
+        try:
+            os.replace(src, dst)
+            return dst
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+        logging.info(f"Cross-device move, copying {src} to {dst}")
+        part_path = f"{dst}.part"
+        try:
+            shutil.copy2(src, part_path)
+            os.replace(part_path, dst)
+        except Exception:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+        os.remove(src)
+        return dst
+
+    def link_or_copy(self, src: str, dst: str) -> str:
+        """
+        Place a copy of src at dst without duplicating data when the filesystem allows it.
+
+        Tries a hardlink, then a reflink (Linux FICLONE), then falls back to a plain copy.
+
+        Args:
+            src (str): File to copy.
+            dst (str): Destination path, overwritten if it exists.
+
+        Returns:
+            str: The destination path.
+        """
+        if os.path.exists(dst):
+            os.remove(dst)
+
+        if self.same_filesystem(src, dst):
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError:
+                pass
+
+            if self._reflink(src, dst):
+                return dst
+
+        shutil.copy2(src, dst)
+        return dst
+
+    @staticmethod
+    def _reflink(src: str, dst: str) -> bool:
+        """Clone src into dst with a copy-on-write ioctl (btrfs, xfs), False if unsupported."""
+        try:
+            import fcntl
+        except ImportError:
+            return False
+
+        FICLONE = 0x40049409
+        try:
+            with open(src, 'rb') as f_src, open(dst, 'wb') as f_dst:
+                fcntl.ioctl(f_dst.fileno(), FICLONE, f_src.fileno())
+            shutil.copystat(src, dst)
+            return True
+        except OSError:
+            if os.path.exists(dst):
+                os.remove(dst)
+            return False
+
     def remove_folder(self, folder_path: str) -> bool:
         """
         Safely remove a folder.
@@ -0,0 +1,92 @@
+# 19.10.26
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
+
+
+# Variable
+T = TypeVar("T")
+TOKEN_WEIGHT = 0.5
+_non_word = re.compile(r"[\W_]+", re.UNICODE)
+
+
+class Fingerprint(NamedTuple):
+    text: str
+    tokens: frozenset
+    trigrams: frozenset
+    compact: frozenset
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def normalize_title(text: str) -> str:
+    """Lower case, accents removed, punctuation and dashes turned into single spaces."""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return _non_word.sub(' ', text.lower()).strip()
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(text: str) -> Fingerprint:
+    """Normalized text, word set and character trigrams of a title, computed once per distinct title."""
+    norm = normalize_title(text)
+    tokens = frozenset(norm.split())
+
+    # Trigrams per word, padded so short words and word edges still count
+    grams = set()
+    for token in tokens:
+        grams |= _trigrams(token)
+
+    # Trigrams of the title without spaces, for "spiderman" against "spider man"
+    return Fingerprint(norm, tokens, frozenset(grams), frozenset(_trigrams(norm.replace(' ', ''))))
+
+
+def _dice(a: frozenset, b: frozenset) -> float:
+    return 2 * len(a & b) / (len(a) + len(b)) if a or b else 0.0
+
+
+def _score(query: Fingerprint, title: Fingerprint) -> float:
+    if not query.text or not title.text:
+        return 0.0
+    if query.text == title.text:
+        return 1.0
+
+    # Token set: how much of the query is in the title, and how much else the title has
+    common = len(query.tokens & title.tokens)
+    token_score = (common / len(query.tokens) + common / len(query.tokens | title.tokens)) / 2
+
+    # Trigram Dice coefficient, tolerant to typos and word order
+    blended = TOKEN_WEIGHT * token_score + (1 - TOKEN_WEIGHT) * _dice(query.trigrams, title.trigrams)
+    return max(blended, _dice(query.compact, title.compact))
+
+
+def similarity(a: str, b: str) -> float:
+    """Similarity of two titles in [0, 1], word order does not matter."""
+    return _score(fingerprint(a), fingerprint(b))
+
+
+def score_all(query: str, titles: Iterable[Optional[str]]) -> List[float]:
+    """Score many titles against one query, the query is normalized once."""
+    query_fp = fingerprint(query)
+    return [_score(query_fp, fingerprint(str(title))) if title else 0.0 for title in titles]
+
+
+def rank(query: str, items: List[T], key: Callable[[T], Optional[str]]) -> List[Tuple[T, float]]:
+    """
+    Sort items by similarity of key(item) to the query, best first.
+
+    Parameters:
+        - query (str): The search query.
+        - items (List): Items to rank, equal scores keep their order.
+        - key (Callable): Returns the title of an item.
+
+    Returns:
+        List[Tuple]: (item, score) pairs.
+    """
+    scores = score_all(query, (key(item) for item in items))
+    return sorted(zip(items, scores), key=lambda pair: pair[1], reverse=True)
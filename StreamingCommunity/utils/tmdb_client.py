@@ -1,9 +1,15 @@
 # 24.08.24
 
 import re
+import json
 import time
+import logging
+import sqlite3
+import threading
 import unicodedata
+from contextlib import contextmanager
 from difflib import SequenceMatcher
+from typing import Dict, Iterator, Optional
 
 
 # External libraries
@@ -12,12 +18,98 @@ from rich.console import Console
 
 # Internal utilities
 from StreamingCommunity.utils import config_manager
-from StreamingCommunity.utils.http_client import create_client_curl, get_userAgent
+from StreamingCommunity.utils.os import os_manager
+from StreamingCommunity.utils.http_client import get_session
 
 
 # Variable
 console = Console()
 api_key = config_manager.login.get("TMDB", "api_key")
+TMDB_CACHE_FILE = 'tmdb_cache.db'
+TMDB_RATE_PER_SECOND = 40
+
+# Seconds a cached answer is reused, by endpoint prefix (first match wins)
+ENDPOINT_TTLS = (
+    ("search/", 24 * 3600),
+    ("movie/", 7 * 24 * 3600),
+    ("tv/", 7 * 24 * 3600),
+)
+DEFAULT_TTL = 24 * 3600
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Allow `rate` requests per second on average, with bursts up to `capacity`."""
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class ResponseCache:
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        SQLite store of TMDB answers keyed by endpoint and parameters (api key excluded).
+
+        Parameters:
+            - db_path (Optional[str]): SQLite file, defaults to .cache/tmdb_cache.db.
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction, committed on success and always closed."""
+        if self.db_path is None:
+            self.db_path = os_manager.get_cache_path(TMDB_CACHE_FILE)
+
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            if not self._initialized:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("CREATE TABLE IF NOT EXISTS tmdb_cache (key TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)")
+                conn.commit()
+                self._initialized = True
+
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[dict]:
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute("SELECT data FROM tmdb_cache WHERE key = ? AND expires_at > ?", (key, time.time())).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            logging.warning(f"TMDB cache read failed: {e}")
+            return None
+
+    def put(self, key: str, data: dict, ttl: int):
+        try:
+            with self._lock, self._connect() as conn:
+                now = time.time()
+                conn.execute("INSERT OR REPLACE INTO tmdb_cache (key, data, expires_at) VALUES (?, ?, ?)", (key, json.dumps(data), now + ttl))
+                conn.execute("DELETE FROM tmdb_cache WHERE expires_at < ?", (now,))
+        except Exception as e:
+            logging.warning(f"TMDB cache write failed: {e}")
 
 
 class TMDBClient:
@@ -27,10 +119,29 @@ class TMDBClient:
         """
         self.api_key = api_key
         self.base_url = "https://api.themoviedb.org/3"
+        self.cache = ResponseCache()
+        self.rate_limiter = TokenBucket(TMDB_RATE_PER_SECOND)
+        self._inflight: Dict[str, dict] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _session(self):
+        """Shared curl session of the TMDB host (one per thread), connections are reused across calls."""
+        return get_session(self.base_url, kind="curl")
+
+    @staticmethod
+    def _ttl_for(endpoint: str) -> int:
+        return next((ttl for prefix, ttl in ENDPOINT_TTLS if endpoint.startswith(prefix)), DEFAULT_TTL)
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: dict) -> str:
+        return f"{endpoint}?{json.dumps({k: v for k, v in params.items() if k != 'api_key'}, sort_keys=True)}"
 
     def _make_request(self, endpoint, params=None, retries=3):
         """
         Make a request to the given API endpoint with optional parameters.
+
+        Answers are cached on disk per endpoint and parameters, and concurrent identical
+        requests share one HTTP call.
         """
         if params is None:
             params = {}
@@ -39,12 +150,42 @@ class TMDBClient:
             console.log("[red]TMDB API key is not set. Please provide a valid API key in the configuration.")
             return {}
 
+        key = self._cache_key(endpoint, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Single flight: the first caller fetches, the others wait for its answer
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = {'event': threading.Event(), 'data': {}}
+                self._inflight[key] = flight
+
+        if not leader:
+            flight['event'].wait()
+            return flight['data']
+
+        try:
+            data = self._fetch(endpoint, dict(params), retries)
+            if data:
+                self.cache.put(key, data, self._ttl_for(endpoint))
+            flight['data'] = data
+            return data
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            flight['event'].set()
+
+    def _fetch(self, endpoint, params, retries):
         params['api_key'] = self.api_key
         url = f"{self.base_url}/{endpoint}"
         
         for attempt in range(retries + 1):
             try:
-                response = create_client_curl(headers={"User-Agent": get_userAgent()}).get(url, params=params)
+                self.rate_limiter.acquire()
+                response = self._session().get(url, params=params)
                 response.raise_for_status()
                 return response.json()
             
@@ -75,9 +216,11 @@ class TMDBClient:
     def _slugs_match(self, slug1: str, slug2: str, threshold: float = 0.85) -> bool:
         """
         Check if two slugs are similar enough using fuzzy matching.
+
+        A near-exact character ratio, not ranking.similarity: this decides identity, so a
+        plural ("alien" / "aliens") must match and a sequel ("the-dark-knight-rises") must not.
         """
-        ratio = SequenceMatcher(None, slug1, slug2).ratio()
-        return ratio >= threshold
+        return SequenceMatcher(None, slug1, slug2).ratio() >= threshold
 
     def get_type_and_id_by_slug_year(self, slug: str, year: str = None, media_type: str = None, language_preference: str = "it"):
         """
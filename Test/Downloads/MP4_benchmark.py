@@ -0,0 +1,130 @@
+# 19.10.26
+# ruff: noqa: E402
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import multiprocessing
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+# Fix import
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+from StreamingCommunity.core.downloader import mp4
+from StreamingCommunity.utils import internet_manager
+from StreamingCommunity.utils.http_client import create_client
+
+
+# Variable
+SIZE_MB = int(os.environ.get("BENCH_SIZE_MB", 1024))
+PORT = int(os.environ.get("BENCH_PORT", 8899))
+BLOCK = os.urandom(1024 * 1024)
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    size = SIZE_MB * 1024 * 1024
+
+    def log_message(self, *args):
+        pass
+
+    def _headers(self, status, start, end):
+        self.send_response(status)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"bench"')
+        self.send_header("Content-Length", str(end - start))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{self.size}")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._headers(200, 0, self.size)
+
+    def do_GET(self):
+        start, end, status = 0, self.size, 200
+        rng = self.headers.get("Range")
+        if rng:
+            a, _, b = rng.replace("bytes=", "").partition("-")
+            start, end, status = int(a), (int(b) + 1 if b else self.size), 206
+
+        self._headers(status, start, end)
+        pos = start
+        try:
+            while pos < end:
+                offset = pos % len(BLOCK)
+                n = min(len(BLOCK) - offset, end - pos)
+                self.wfile.write(BLOCK[offset:offset + n])
+                pos += n
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def serve():
+    ThreadingHTTPServer(("127.0.0.1", PORT), RangeHandler).serve_forever()
+
+
+def baseline_download(url, path):
+    """
+    The pre-adaptive single stream loop: 64 KiB chunks, one buffered write and one
+    full stats/progress refresh per chunk.
+    """
+    with mp4._create_progress() as progress_bars, create_client() as client:
+        with client.stream("GET", url) as response:
+            total = int(response.headers.get('content-length', 0))
+            task_id = progress_bars.add_task("download", total=total, downloaded="0.00", downloaded_unit="B", total_size="--", total_unit="", elapsed="0s", eta="--", speed="-- B/s")
+            start_time, downloaded = time.time(), 0
+
+            with open(path, 'wb') as file:
+                for chunk in response.iter_bytes(chunk_size=65536):
+                    downloaded += file.write(chunk)
+                    elapsed = time.time() - start_time
+                    speed = downloaded / elapsed if elapsed > 0 else 0
+                    speed_str = internet_manager.format_transfer_speed(speed) if speed else "-- B/s"
+                    eta_str = internet_manager.format_time(max(total - downloaded, 0) / speed) if speed else "--"
+                    downloaded_value, downloaded_unit = internet_manager.format_file_size(downloaded).split(" ")
+                    progress_bars.update(task_id, completed=downloaded, downloaded=downloaded_value, downloaded_unit=downloaded_unit,
+                        elapsed=internet_manager.format_time(elapsed), eta=eta_str, speed=speed_str)
+
+
+def run(label, connections, baseline=False):
+    """Download once and return CPU seconds of this process per GB."""
+    mp4.MP4_CONNECTIONS = connections
+    url = f"http://127.0.0.1:{PORT}/bench.mp4"
+
+    out_dir = tempfile.mkdtemp()
+    path = os.path.join(out_dir, "bench.mp4")
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    if baseline:
+        baseline_download(url, path)
+    else:
+        mp4.MP4_Downloader(url=url, path=path, show_final_info=False)
+    cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    gb = SIZE_MB / 1024
+    return label, cpu / gb, SIZE_MB / wall
+
+
+if __name__ == "__main__":
+    server = multiprocessing.Process(target=serve, daemon=True)
+    server.start()
+    time.sleep(1)
+
+    results = [
+        run("baseline 64KiB, per chunk UI", 1, baseline=True),
+        run("adaptive chunk, throttled UI", 1),
+        run(f"adaptive + {4} ranged conn", 4),
+    ]
+    server.terminate()
+
+    print(f"\n{'mode':<32}{'CPU s/GB':>10}{'MB/s':>10}")
+    for label, cpu_per_gb, speed in results:
+        print(f"{label:<32}{cpu_per_gb:>10.2f}{speed:>10.1f}")
+
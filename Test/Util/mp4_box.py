@@ -0,0 +1,95 @@
+# 19.10.26
+# ruff: noqa: E402
+# Manual test for encryption scheme detection on synthetic fMP4 files
+
+import os
+import sys
+import struct
+import tempfile
+
+
+# Fix import
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+from StreamingCommunity.source.Manual.decrypt.mp4_box import detect_scheme, MP4BoxError
+
+
+# Variable
+KID = bytes.fromhex("0123456789abcdef0123456789abcdef")
+
+
+def box(box_type: bytes, *children: bytes) -> bytes:
+    payload = b''.join(children)
+    return struct.pack('>I4s', 8 + len(payload), box_type) + payload
+
+
+def full_box(box_type: bytes, body: bytes) -> bytes:
+    return box(box_type, b'\x00\x00\x00\x00' + body)
+
+
+def ftyp() -> bytes:
+    return box(b'ftyp', b'iso6', b'\x00\x00\x00\x00', b'iso6dash')
+
+
+def sinf(scheme: bytes, original: bytes = b'avc1') -> bytes:
+    schm = full_box(b'schm', scheme + struct.pack('>I', 0x10000))
+    tenc = full_box(b'tenc', b'\x00\x00' + b'\x01\x10' + KID)
+    return box(b'sinf', box(b'frma', original), schm, box(b'schi', tenc))
+
+
+def moov(sample_entry: bytes) -> bytes:
+    stsd = full_box(b'stsd', struct.pack('>I', 1) + sample_entry)
+    stbl = box(b'stbl', stsd)
+    return box(b'moov', box(b'trak', box(b'mdia', box(b'minf', stbl))))
+
+
+def encrypted_entry(scheme: bytes) -> bytes:
+    # encv: 78 bytes of visual sample entry fields, then the protection info
+    return box(b'encv', b'\x00' * 78, sinf(scheme))
+
+
+def clear_entry() -> bytes:
+    return box(b'avc1', b'\x00' * 78, box(b'avcC', b'\x01\x64\x00\x1f'))
+
+
+def fragment(encrypted: bool) -> bytes:
+    traf_children = [full_box(b'tfhd', struct.pack('>I', 1))]
+    if encrypted:
+        traf_children.append(full_box(b'senc', struct.pack('>I', 0)))
+    moof = box(b'moof', full_box(b'mfhd', struct.pack('>I', 1)), box(b'traf', *traf_children))
+    return moof + box(b'mdat', b'\x00' * 32)
+
+
+def write(folder: str, name: str, data: bytes) -> str:
+    path = os.path.join(folder, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [
+            ("cbcs.mp4", ftyp() + moov(encrypted_entry(b'cbcs')) + fragment(True), ('cbc', KID.hex())),
+            ("cenc.mp4", ftyp() + moov(encrypted_entry(b'cenc')) + fragment(True), ('ctr', KID.hex())),
+            ("clear.mp4", ftyp() + moov(clear_entry()) + fragment(False), (None, None)),
+            ("senc_only.m4s", box(b'styp', b'msdh', b'\x00\x00\x00\x00') + fragment(True), ('ctr', None)),
+        ]
+
+        for name, data, expected in cases:
+            result = detect_scheme(write(tmp, name, data))
+            assert result == expected, f"{name}: expected {expected!r}, got {result!r}"
+            print(f"OK: {name} -> {result}")
+
+        # Not an ISO-BMFF file
+        try:
+            detect_scheme(write(tmp, "bad.bin", b'#EXTM3U\n' * 4))
+            raise AssertionError("bad.bin: expected MP4BoxError")
+        except MP4BoxError:
+            print("OK: bad.bin rejected")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# 19.10.26
+# ruff: noqa: E402
+
+import os
+import sys
+import time
+import random
+import difflib
+
+
+# Fix import
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+from StreamingCommunity.utils import ranking
+
+
+# Variable
+COUNT = int(os.environ.get("BENCH_COUNT", 500))
+ROUNDS = int(os.environ.get("BENCH_ROUNDS", 20))
+WORDS = ["the", "dark", "knight", "iron", "man", "casa", "di", "carta", "one", "piece", "stranger", "things", "gomorra",
+    "la", "serie", "breaking", "bad", "house", "of", "dragon", "spider", "home", "lost", "city", "love", "night", "war"]
+QUALITY = [
+    ("man iron", "Iron Man", "Ironclad"),
+    ("stranger things", "Stranger Things 4", "Strange Things"),
+    ("spiderman", "Spider-Man", "Spin Man"),
+    ("la casa di carta", "La casa di carta", "La casa delle bambole"),
+    ("pokemon", "Pokémon", "Poker Mom"),
+]
+
+
+def difflib_rank(query, titles):
+    query_lower = query.lower()
+    scores = [difflib.SequenceMatcher(None, query_lower, title.lower()).ratio() for title in titles]
+    return sorted(zip(titles, scores), key=lambda pair: pair[1], reverse=True)
+
+
+def timed(func, query, titles):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(query, titles)
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def main():
+    rng = random.Random(42)
+    titles = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5))).title() for _ in range(COUNT)]
+    query = "the dark knight"
+
+    print(f"Ranking {COUNT} titles, {ROUNDS} rounds")
+    print(f"difflib          : {timed(difflib_rank, query, titles):8.2f} ms/round")
+
+    ranking.fingerprint.cache_clear()
+    cold = timed(lambda q, t: (ranking.fingerprint.cache_clear(), ranking.rank(q, t, key=str)), query, titles)
+    print(f"ranking (cold)   : {cold:8.2f} ms/round")
+    print(f"ranking (cached) : {timed(lambda q, t: ranking.rank(q, t, key=str), query, titles):8.2f} ms/round")
+
+    print("\nquery              | expected best      | distractor         | difflib       | ranking")
+    for query, good, bad in QUALITY:
+        d_good, d_bad = (difflib.SequenceMatcher(None, query, t.lower()).ratio() for t in (good, bad))
+        r_good, r_bad = ranking.similarity(query, good), ranking.similarity(query, bad)
+        print(f"{query:18} | {good:18} | {bad:18} | {d_good:.2f} vs {d_bad:.2f} | {r_good:.2f} vs {r_bad:.2f}")
+
+
+if __name__ == "__main__":
+    main()